@@ -1,3 +1,4 @@
+import { execFileSync } from 'child_process';
 import fs from 'fs';
 import path from 'path';
 import { logger } from '../utils/logger';
@@ -15,6 +16,15 @@ interface TaskContent {
   }[];
 }
 
+const workLogStore = path.join(__dirname, 'jira', 'work_log_store.py');
+
+function runWorkLogStore(workLogsDir: string, args: string[]): string {
+  return execFileSync('python3', [workLogStore, ...args], {
+    encoding: 'utf-8',
+    env: { ...process.env, JIRA_WORK_LOG_DIR: workLogsDir }
+  }).trim();
+}
+
 function parseExistingContent(content: string): TaskContent {
   const titleMatch = content.match(/# Task Work Log: \[([^\]]+)\] (.+)/);
   const statusMatch = content.match(/\*\*Status\*\*:\s*(.+)/);
@@ -123,12 +133,9 @@ async function fixWorkLog(filePath: string): Promise<void> {
 Last Updated: ${new Date().toISOString().replace('T', ' ').split('.')[0]}
 `;
 
-    // Create a backup first
-    const backupDir = path.join(path.dirname(filePath), `backup_${Date.now()}`);
-    if (!fs.existsSync(backupDir)) {
-      fs.mkdirSync(backupDir);
-    }
-    fs.copyFileSync(filePath, path.join(backupDir, path.basename(filePath)));
+    // Snapshot first; a log that's already stored isn't copied again
+    const workLogsDir = path.dirname(filePath);
+    const snapshotId = runWorkLogStore(workLogsDir, ['snapshot', filePath]).replace(' (unchanged)', '');
 
     // Write the new content
     try {
@@ -136,8 +143,8 @@ Last Updated: ${new Date().toISOString().replace('T', ' ').split('.')[0]}
       logger.info(`Fixed work log: ${path.basename(filePath)}`);
     } catch (writeError) {
       logger.error(`Error writing to ${path.basename(filePath)}:`, writeError);
-      // Try to restore from backup
-      fs.copyFileSync(path.join(backupDir, path.basename(filePath)), filePath);
+      // Try to restore from the snapshot
+      runWorkLogStore(workLogsDir, ['restore', snapshotId, '--file', path.basename(filePath), '--to', workLogsDir, '--copy']);
       throw writeError;
     }
   } catch (error) {
@@ -1,42 +1,27 @@
 #!/usr/bin/env python3
-import os
+import argparse
 import sys
-from jira import JIRA
-from dotenv import load_dotenv
+from jira_utils import init_jira
 
-def main():
-    # Load environment variables
-    load_dotenv()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Add a comment to an issue')
+    parser.add_argument('issue_key', help='Issue key (e.g. TENP-123)')
+    parser.add_argument('comment', help='Comment text')
+    args = parser.parse_args(argv)
+    issue_key = args.issue_key
+    comment = args.comment
     
-    # Get Jira credentials from environment
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
-    server = os.getenv('JIRA_BASE_URL')
-    
-    if not all([email, api_token, server]):
-        print("Error: Missing required environment variables")
-        sys.exit(1)
-    
-    # Check command line arguments
-    if len(sys.argv) != 3:
-        print("Usage: python add_comment.py <issue-key> <comment>")
+    # Initialize Jira
+    jira, error = init_jira()
+    if error:
+        print(f"\nError: {error}")
         sys.exit(1)
     
-    issue_key = sys.argv[1]
-    comment = sys.argv[2]
-    
     try:
-        # Initialize Jira client
-        jira = JIRA(
-            server=server,
-            basic_auth=(email, api_token)
-        )
-        
         print(f"\nSuccessfully authenticated as: {jira.current_user()}")
         
-        # Add comment to the issue
-        issue = jira.issue(issue_key)
-        jira.add_comment(issue, comment)
+        # Add comment to the issue (no need to fetch it first)
+        jira.add_comment(issue_key, comment)
         
         print(f"\nSuccessfully added comment to {issue_key}")
         
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PLANS_DIR = SCRIPTS_DIR / 'plans'
+# Timings are machine-specific, so the baseline stays local (see .gitignore)
+BASELINE_PATH = Path(os.getenv('JIRA_BENCHMARK_BASELINE', SCRIPTS_DIR / '.benchmark-baseline.json'))
+# A timing regresses when it grows by more than this fraction and by more
+# than the noise floor; any growth in request counts is a regression
+REGRESSION_TOLERANCE = float(os.getenv('JIRA_BENCHMARK_TOLERANCE', '0.25'))
+NOISE_FLOOR_MS = float(os.getenv('JIRA_BENCHMARK_NOISE_MS', '20'))
+
+PHASES = ('import', 'config', 'client', 'auth', 'first_request', 'total')
+COUNTS = ('requests', 'auth_requests')
+
+# Entry point: (command line, stdin). Runs are read-only where the script
+# allows it; the rest only change the stand-in server, which is reset per run
+BENCHMARKS: Dict[str, Tuple[List[str], str]] = {
+    'add_comment': (['TENP-1', 'Benchmark comment'], ''),
+    'bulk_transition': (['TENP-2', 'TENP-3', 'TENP-4', '--status', 'In Progress'], ''),
+    'changelog_analytics': ([], ''),
+    'check_issue': (['TENP-1'], ''),
+    'create_auth_ui_tasks': ([], ''),
+    'create_migration_tasks': ([], ''),
+    'create_subtasks': ([], ''),
+    'create_task': (['Benchmark task', 'Created by the benchmark', 'Task'], ''),
+    'dependency_graph': (['TENP-4'], ''),
+    'development_workflow': ([], '0\n'),
+    'jira_mirror': ([], ''),
+    'list_tasks': ([], ''),
+    'move_to_done': (['TENP-5'], ''),
+    'move_to_progress': (['TENP-6'], ''),
+    'move_to_review': (['TENP-7'], ''),
+    'move_to_selected': ([], ''),
+    'move_to_testing': (['TENP-8'], ''),
+    'sync_dependencies': ([str(PLANS_DIR / 'dependencies.yaml'), '--dry-run'], ''),
+    'task_plan': ([str(PLANS_DIR / 'dependencies.yaml'), '--dry-run'], ''),
+    'task_workflow': (['TENP-9'], '3\n'),
+    'track_progress': ([], ''),
+    'update_completed_tasks': (['--dry-run'], ''),
+    'update_dependencies': (['--dry-run'], ''),
+    'update_migration_tasks': (['--dry-run'], ''),
+    'update_task_statuses': (['--dry-run'], ''),
+    'update_tasks': (['--key', 'TENP-10', '--status', 'Done'], ''),
+    'workflow': ([], '0\n'),
+    'workflow_trigger': ([], '0\n'),
+}
+
+# Stand-in Jira
+
+STATUSES = ['To Do', 'Selected for Development', 'In Progress', 'Testing', 'Review', 'Done']
+STATUS_CATEGORIES = {'To Do': 'new', 'Selected for Development': 'new', 'Done': 'done'}
+ISSUE_COUNT = 320
+
+class StandInJira:
+    """
+    Minimal in-memory Jira REST API on localhost: the endpoints and JQL the
+    scripts use, with every request counted
+    """
+
+    def __init__(self, issue_count: int = ISSUE_COUNT):
+        self.issue_count = issue_count
+        self.lock = threading.Lock()
+        self.reset()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reset(self) -> None:
+        """Every run starts from the same issues, links and histories"""
+        with self.lock:
+            self.requests = 0
+            self.next_id = self.issue_count + 1
+            self.issues = {}
+            self.links = set()
+            for number in range(1, self.issue_count + 1):
+                status = 'In Progress' if number % 7 == 0 else 'Selected for Development' if number % 5 == 0 else 'To Do'
+                history = [self._change('To Do', 'Selected for Development', '2025-01-02T09:00:00.000+0000')]
+                if status == 'In Progress':
+                    history.append(self._change('Selected for Development', 'In Progress', '2025-01-03T09:00:00.000+0000'))
+                self._add_issue(f"TENP-{number}", {
+                    'summary': f"Benchmark issue {number}",
+                    'description': 'Stand-in issue',
+                    'status': status,
+                    'issuetype': 'Epic' if number > self.issue_count - 5 else 'Task',
+                    'labels': [],
+                    'parent': None,
+                }, history)
+                if number % 3 == 0 and number < self.issue_count:
+                    self.links.add(('Blocks', f"TENP-{number}", f"TENP-{number + 1}"))
+
+    def _change(self, from_status: str, to_status: str, created: str) -> dict:
+        return {'id': '1', 'created': created, 'items': [{'field': 'status', 'fromString': from_status, 'toString': to_status}]}
+
+    def _add_issue(self, key: str, fields: dict, history: Optional[list] = None) -> None:
+        self.issues[key] = {'key': key, 'id': str(10000 + int(key.split('-')[1])), 'fields': fields,
+                            'history': history or [], 'comments': []}
+
+    def _view(self, key: str, fields: Optional[str] = None, expand: str = '') -> dict:
+        issue = self.issues[key]
+        data = dict(issue['fields'])
+        status = data['status']
+        data.update({
+            'status': {'name': status, 'statusCategory': {'key': STATUS_CATEGORIES.get(status, 'indeterminate')}},
+            'issuetype': {'name': data['issuetype'], 'subtask': data['issuetype'] == 'Sub-task'},
+            'project': {'key': 'TENP'},
+            'priority': {'name': 'Medium'},
+            'assignee': None,
+            'created': '2025-01-01T09:00:00.000+0000',
+            'updated': '2025-01-03T09:00:00.000+0000',
+            'comment': {'comments': issue['comments'], 'total': len(issue['comments'])},
+            'issuelinks': [self._link_view(link, key) for link in self.links if key in link[1:]],
+        })
+        # Like Jira, fields without a value are left out
+        if data['parent']:
+            data['parent'] = {'key': data['parent']}
+        else:
+            del data['parent']
+        if fields and '*all' not in fields.split(','):
+            data = {name: data[name] for name in fields.split(',') if name in data}
+        view = {'key': key, 'id': issue['id'], 'fields': data}
+        if 'transitions' in expand:
+            view['transitions'] = self._transitions(key)
+        if 'changelog' in expand:
+            view['changelog'] = {'startAt': 0, 'maxResults': 100, 'total': len(issue['history']),
+                                 'histories': issue['history']}
+        return view
+
+    def _link_view(self, link: tuple, key: str) -> dict:
+        link_type, inward, outward = link
+        other, side = (outward, 'outwardIssue') if inward == key else (inward, 'inwardIssue')
+        return {'id': f"{inward}:{outward}", 'type': {'name': link_type, 'inward': 'is blocked by', 'outward': 'blocks'},
+                side: {'key': other, 'fields': {'status': {'name': self.issues[other]['fields']['status']}}}}
+
+    def _transitions(self, key: str) -> List[dict]:
+        current = self.issues[key]['fields']['status']
+        return [{'id': str(11 + index), 'name': status, 'to': {'name': status}}
+                for index, status in enumerate(STATUSES) if status != current]
+
+    def _search(self, jql: str) -> List[str]:
+        keys = sorted(self.issues, key=lambda key: int(key.split('-')[1]))
+        filters = []
+        for field, values in re.findall(r'\b(key|labels|status) in \(([^)]*)\)', jql):
+            filters.append((field, {value.strip().strip('"') for value in values.split(',')}))
+        for field, value in re.findall(r'\b(labels|status) = "([^"]*)"', jql):
+            filters.append((field, {value}))
+        epic = re.search(r'issuetype (!?=) Epic', jql)
+
+        def matches(key: str) -> bool:
+            fields = self.issues[key]['fields']
+            for field, values in filters:
+                have = {key} if field == 'key' else set(fields['labels']) if field == 'labels' else {fields['status']}
+                if not have & values:
+                    return False
+            if epic and (fields['issuetype'] == 'Epic') != (epic.group(1) == '='):
+                return False
+            return True
+
+        return [key for key in keys if matches(key)]
+
+    def _create(self, fields: dict) -> dict:
+        key = f"TENP-{self.next_id}"
+        self.next_id += 1
+        self._add_issue(key, {
+            'summary': fields.get('summary'),
+            'description': fields.get('description'),
+            'status': 'To Do',
+            'issuetype': (fields.get('issuetype') or {}).get('name', 'Task'),
+            'labels': fields.get('labels', []),
+            'parent': (fields.get('parent') or {}).get('key'),
+        })
+        return {'key': key, 'id': self.issues[key]['id']}
+
+    def route(self, method: str, path: str, query: dict, body) -> Tuple[int, object]:
+        match = re.match(r'^/rest/api/\d+/(.*)$', path)
+        resource = match.group(1) if match else ''
+        if resource == 'serverInfo':
+            return 200, {'baseUrl': self.url, 'version': '9.0.0', 'versionNumbers': [9, 0, 0], 'deploymentType': 'Server'}
+        if resource == 'myself':
+            return 200, {'name': 'benchmark', 'displayName': 'Benchmark User', 'accountId': 'benchmark'}
+        if resource in ('search', 'search/jql'):
+            query = body if method == 'POST' else query
+            keys = self._search(query.get('jql', ''))
+            start, limit = int(query.get('startAt', 0)), int(query.get('maxResults', 50))
+            fields = query.get('fields')
+            fields = ','.join(fields) if isinstance(fields, list) else fields
+            return 200, {'startAt': start, 'maxResults': limit, 'total': len(keys),
+                         'issues': [self._view(key, fields, query.get('expand') or '') for key in keys[start:start + limit]]}
+        if resource == 'issue/bulkfetch':
+            keys = [key for key in body['issueIdsOrKeys'] if key in self.issues]
+            fields, expand = ','.join(body.get('fields') or []) or None, ','.join(body.get('expand') or [])
+            return 200, {'issues': [self._view(key, fields, expand) for key in keys], 'issueErrors': []}
+        if resource == 'issue' and method == 'POST':
+            return 201, self._create(body['fields'])
+        if resource == 'issue/bulk' and method == 'POST':
+            return 201, {'issues': [self._create(update['fields']) for update in body['issueUpdates']], 'errors': []}
+        if resource == 'issueLink' and method == 'POST':
+            self.links.add((body['type']['name'], body['inwardIssue']['key'], body['outwardIssue']['key']))
+            return 201, None
+        match = re.match(r'^issueLink/(.+):(.+)$', resource)
+        if match and method == 'DELETE':
+            self.links = {link for link in self.links if link[1:] != match.groups()}
+            return 204, None
+
+        match = re.match(r'^issue/([A-Z]+-\d+)(/\w+)?$', resource)
+        if not match or match.group(1) not in self.issues:
+            return 404, {'errorMessages': [f"No stand-in for {method} {resource}"]}
+        key, sub = match.group(1), match.group(2) or ''
+        issue = self.issues[key]
+        if sub == '' and method == 'GET':
+            return 200, self._view(key, query.get('fields'), query.get('expand', ''))
+        if sub == '' and method == 'PUT':
+            issue['fields'].update({name: value for name, value in body['fields'].items() if name in issue['fields']})
+            return 204, None
+        if sub == '/transitions' and method == 'GET':
+            return 200, {'transitions': self._transitions(key)}
+        if sub == '/transitions' and method == 'POST':
+            transition = next((t for t in self._transitions(key) if t['id'] == str(body['transition']['id'])), None)
+            if transition is None:
+                return 400, {'errorMessages': ['Transition not available']}
+            issue['fields']['status'] = transition['to']['name']
+            return 204, None
+        if sub == '/comment' and method == 'POST':
+            comment = {'id': str(len(issue['comments']) + 1), 'body': body['body']}
+            issue['comments'].append(comment)
+            return 201, comment
+        if sub == '/comment' and method == 'GET':
+            return 200, {'comments': issue['comments'], 'total': len(issue['comments'])}
+        if sub == '/changelog':
+            start, limit = int(query.get('startAt', 0)), int(query.get('maxResults', 100))
+            return 200, {'startAt': start, 'maxResults': limit, 'total': len(issue['history']),
+                         'values': issue['history'][start:start + limit], 'isLast': start + limit >= len(issue['history'])}
+        return 404, {'errorMessages': [f"No stand-in for {method} {resource}"]}
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self, method: str):
+                url = urlparse(self.path)
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length) or b'null') if length else None
+                with stand_in.lock:
+                    stand_in.requests += 1
+                    status, payload = stand_in.route(method, url.path, {k: v[0] for k, v in parse_qs(url.query).items()}, body)
+                data = json.dumps(payload).encode() if payload is not None else b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._handle('GET')
+
+            def do_POST(self):
+                self._handle('POST')
+
+            def do_PUT(self):
+                self._handle('PUT')
+
+            def do_DELETE(self):
+                self._handle('DELETE')
+
+        return Handler
+
+# Per-phase measurement, run in a fresh interpreter per entry point
+
+PROBE = """
+import importlib, json, sys, time
+from contextlib import redirect_stdout
+start = time.perf_counter()
+module_name, argv, result_path = sys.argv[1], json.loads(sys.argv[2]), sys.argv[3]
+spans = {'config': 0.0, 'client': 0.0, 'auth': 0.0}
+calls = []
+main_started = None
+
+def timed(span, fn, exclude=()):
+    def wrapper(*args, **kwargs):
+        before = {name: spans[name] for name in exclude}
+        t = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            # Nested spans (config inside client) are counted once
+            spans[span] += time.perf_counter() - t - sum(spans[name] - before[name] for name in exclude)
+    return wrapper
+
+# Installed before the script is imported, so its from-imports bind the wrappers
+import jira_utils
+from requests.adapters import HTTPAdapter
+jira_utils.load_credentials = timed('config', jira_utils.load_credentials)
+init_jira = jira_utils.init_jira
+def init_jira_and_time_auth():
+    jira, error = init_jira()
+    if jira is not None and not getattr(type(jira).current_user, 'timed', False):
+        type(jira).current_user = timed('auth', type(jira).current_user)
+        type(jira).current_user.timed = True
+    return jira, error
+jira_utils.init_jira = timed('client', init_jira_and_time_auth, exclude=('config', 'auth'))
+jira_utils.init_session = timed('client', jira_utils.init_session, exclude=('config',))
+jira_request = jira_utils.jira_request
+def timed_request(method, path, **kwargs):
+    if path == 'myself':
+        return timed('auth', jira_request)(method, path, **kwargs)
+    return jira_request(method, path, **kwargs)
+jira_utils.jira_request = timed_request
+send = HTTPAdapter.send
+def timed_send(self, request, **kwargs):
+    t = time.perf_counter()
+    try:
+        return send(self, request, **kwargs)
+    finally:
+        calls.append((t, time.perf_counter(), request.path_url.split('?')[0]))
+HTTPAdapter.send = timed_send
+
+module = importlib.import_module(module_name)
+imported = time.perf_counter()
+error = None
+main_started = time.perf_counter()
+try:
+    with redirect_stdout(sys.stderr):
+        module.main(argv)
+except SystemExit as e:
+    if e.code not in (None, 0):
+        error = f'exit status {e.code}'
+except BaseException as e:
+    error = f'{type(e).__name__}: {e}'
+finished = time.perf_counter()
+
+auth_paths = ('/myself', '/serverInfo')
+useful = [end for t, end, path in calls if not path.endswith(auth_paths)]
+with open(result_path, 'w') as f:
+    json.dump({
+        'import': (imported - start) * 1000,
+        'config': spans['config'] * 1000,
+        'client': spans['client'] * 1000,
+        'auth': spans['auth'] * 1000,
+        'first_request': (min(useful) - main_started) * 1000 if useful else None,
+        'total': (finished - start) * 1000,
+        'requests': len(calls),
+        'auth_requests': len(calls) - len(useful),
+        'error': error,
+    }, f)
+"""
+
+def run_probe(name: str, stand_in: StandInJira, work_dir: Path) -> dict:
+    """
+    Run one entry point in a fresh interpreter against the stand-in, with
+    every cache it keeps pointed at a scratch directory
+    Returns the probe's measurements
+    """
+    argv, stdin = BENCHMARKS[name]
+    stand_in.reset()
+    run_dir = Path(tempfile.mkdtemp(dir=work_dir))
+    result_path = run_dir / 'result.json'
+    env = dict(os.environ)
+    env.update({
+        'JIRA_BASE_URL': stand_in.url,
+        'JIRA_EMAIL': 'benchmark@example.com',
+        'JIRA_API_TOKEN': 'benchmark',
+        'JIRA_PROJECT_KEY': 'TENP',
+        'JIRA_WORKFLOW_CACHE': str(run_dir / 'workflow-cache.json'),
+        'JIRA_MIRROR_PATH': str(run_dir / 'mirror.db'),
+        'JIRA_WORK_LOG_INDEX': str(run_dir / 'work-log-index.json'),
+        'JIRA_RATE_STATE_DIR': str(run_dir),
+        'PYTHONPATH': str(SCRIPTS_DIR),
+    })
+    completed = subprocess.run(
+        [sys.executable, '-c', PROBE, name, json.dumps(argv), str(result_path)],
+        cwd=run_dir, env=env, input=stdin, capture_output=True, text=True, timeout=300
+    )
+    try:
+        with open(result_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        last_line = (completed.stderr.strip().splitlines() or ['no output'])[-1]
+        return {'error': f"probe failed: {last_line}"}
+
+def measure(names: List[str], repeat: int) -> Dict[str, dict]:
+    """Median of each phase over repeat runs; request counts from the last run"""
+    stand_in = StandInJira()
+    results = {}
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            for name in names:
+                runs = [run_probe(name, stand_in, Path(work_dir)) for _ in range(repeat)]
+                errors = [run['error'] for run in runs if run.get('error')]
+                if errors:
+                    results[name] = {'error': errors[0]}
+                    continue
+                result = {
+                    phase: round(statistics.median(run[phase] for run in runs), 1)
+                    if runs[-1][phase] is not None else None
+                    for phase in PHASES
+                }
+                result.update({count: runs[-1][count] for count in COUNTS})
+                results[name] = result
+    finally:
+        stand_in.close()
+    return results
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float = REGRESSION_TOLERANCE,
+            noise_ms: float = NOISE_FLOOR_MS) -> List[str]:
+    """
+    Compare measurements with a baseline
+    Returns one line per regression
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or result.get('error') or base.get('error'):
+            continue
+        for phase in PHASES:
+            new, old = result.get(phase), base.get(phase)
+            if new is not None and old is not None and new > old * (1 + tolerance) and new - old > noise_ms:
+                regressions.append(f"{name}: {phase} {old:.1f} -> {new:.1f} ms")
+        for count in COUNTS:
+            if result.get(count, 0) > base.get(count, 0):
+                regressions.append(f"{name}: {count} {base.get(count, 0)} -> {result[count]}")
+    return regressions
+
+def print_results(results: Dict[str, dict], baseline: Dict[str, dict]) -> None:
+    width = max(len(name) for name in results)
+    header = ''.join(f"{phase:>16}" for phase in PHASES) + f"{'requests':>10}{'auth':>6}"
+    print(f"{'entry point':{width}}{header}")
+    for name, result in results.items():
+        if result.get('error'):
+            print(f"{name:{width}}  ERROR {result['error']}")
+            continue
+        cells = ''
+        for phase in PHASES:
+            value, old = result.get(phase), baseline.get(name, {}).get(phase)
+            text = '-' if value is None else f"{value:.1f}"
+            if value is not None and old:
+                text += f" ({(value - old) / old:+.0%})"
+            cells += f"{text:>16}"
+        print(f"{name:{width}}{cells}{result['requests']:>10}{result['auth_requests']:>6}")
+    print("\nTimes in ms (median), first_request measured from the start of main; "
+          "auth counts the serverInfo and myself requests")
+
+def load_baseline(path: Path) -> Dict[str, dict]:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure startup and first-request latency of every Jira script against a local stand-in server'
+    )
+    parser.add_argument('entry_points', nargs='*', help='Scripts to measure (default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per script; timings are medians')
+    parser.add_argument('--baseline', default=str(BASELINE_PATH), help='Baseline file to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the new baseline')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    args = parser.parse_args(argv)
+
+    names = args.entry_points or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown entry points: {', '.join(unknown)}")
+
+    results = measure(names, max(1, args.repeat))
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results, baseline)
+
+    failed = [name for name, result in results.items() if result.get('error')]
+    if args.save_baseline:
+        baseline.update({name: result for name, result in results.items() if not result.get('error')})
+        tmp_path = baseline_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, baseline_path)
+        print(f"\nBaseline saved to {baseline_path}")
+        regressions = []
+    else:
+        regressions = compare(results, baseline)
+        if not baseline:
+            print(f"\nNo baseline at {baseline_path}; run with --save-baseline to store one")
+        elif regressions:
+            print(f"\nRegressions against {baseline_path}:")
+            for regression in regressions:
+                print(f"  {regression}")
+        else:
+            print(f"\nNo regressions against {baseline_path}")
+
+    if failed:
+        print(f"\nFailed: {', '.join(failed)}")
+    if failed or regressions:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
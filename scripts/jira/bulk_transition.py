@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+import argparse
+import sys
+import requests
+from typing import Dict, List, Optional, Tuple
+from jira_utils import BULK_WORKERS, bulk_transition, init_jira, iter_issues
+
+def read_key_file(path: str) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Read issue keys from a file ('-' for stdin), one per line, optionally
+    followed by a comment to add after the move. Blank lines and lines
+    starting with '#' are ignored.
+    Returns: (issue_keys, comments)
+    """
+    stream = sys.stdin if path == '-' else open(path, 'r')
+    keys, comments = [], {}
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split(None, 1)
+            keys.append(parts[0])
+            if len(parts) > 1:
+                comments[parts[0]] = parts[1]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return keys, comments
+
+def search_keys(jql: str) -> List[str]:
+    """Resolve a JQL query to issue keys, walking every result page"""
+    return [issue['key'] for issue in iter_issues(jql, 'keys')]
+
+def print_results(results: List[Tuple[str, bool, Optional[str]]], target_status: str) -> None:
+    """Print a per-issue result table"""
+    width = max([len('KEY')] + [len(key) for key, _, _ in results])
+    print(f"\n{'KEY'.ljust(width)}  RESULT  DETAIL")
+    print(f"{'-' * width}  ------  {'-' * 40}")
+    for key, success, error in results:
+        status = "✓" if success else "✗"
+        detail = f"moved to {target_status}" if success else error
+        print(f"{key.ljust(width)}  {status.ljust(6)}  {detail}")
+
+    failed = sum(1 for _, success, _ in results if not success)
+    print(f"\n{len(results) - failed} moved, {failed} failed")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Move many Jira issues to a status concurrently')
+    parser.add_argument('keys', nargs='*', help='Issue keys (e.g., TENP-79 TENP-80)')
+    parser.add_argument('--status', required=True, help='Target status (e.g., Done)')
+    parser.add_argument('--file', help="File with one issue key per line, optionally followed by a comment ('-' for stdin)")
+    parser.add_argument('--jql', help='JQL query selecting the issues to move')
+    parser.add_argument('--comment', help='Comment to add to every moved issue')
+    parser.add_argument('--workers', type=int, default=BULK_WORKERS, help='Maximum concurrent moves')
+    args = parser.parse_args(argv)
+
+    jira, error = init_jira()
+    if error:
+        print(f"\nError: {error}")
+        sys.exit(1)
+
+    keys = list(args.keys)
+    comments = {}
+    try:
+        if args.file:
+            file_keys, comments = read_key_file(args.file)
+            keys.extend(file_keys)
+        if args.jql:
+            keys.extend(search_keys(args.jql))
+    except (OSError, requests.exceptions.RequestException) as e:
+        print(f"\nError: {str(e)}")
+        sys.exit(1)
+    if args.comment:
+        comments = {key: comments.get(key, args.comment) for key in keys}
+
+    # Preserve order, drop duplicates
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        print("No issues to move. Pass keys, --file or --jql.")
+        sys.exit(1)
+
+    results = bulk_transition(jira, keys, args.status, comments, args.workers)
+    print_results(results, args.status)
+
+    if not all(success for _, success, _ in results):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
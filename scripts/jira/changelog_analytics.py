@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+import argparse
+import sqlite3
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+import requests
+from jira_mirror import JiraMirror, format_age, parse_staleness
+
+DAY = 86400.0
+DEFAULT_PERCENTILES = (50, 85, 95)
+NO_EPIC = '(no epic)'
+
+# Status categories, as codes
+CATEGORY_NEW, CATEGORY_IN_PROGRESS, CATEGORY_DONE = 0, 1, 2
+CATEGORY_CODES = {'new': CATEGORY_NEW, 'indeterminate': CATEGORY_IN_PROGRESS, 'done': CATEGORY_DONE}
+# Fallbacks for statuses the mirror has no category for (only seen in changelogs)
+NEW_STATUSES = ('to do', 'selected for development', 'backlog', 'open')
+DONE_STATUSES = ('done', 'closed', 'resolved')
+
+def parse_jira_times(values: Sequence[Optional[str]]) -> np.ndarray:
+    """
+    Parse Jira timestamps ('2025-01-01T10:00:00.000+0000') into UTC epoch
+    seconds, vectorized; missing values become NaN
+    """
+    text = np.asarray([value or '' for value in values], dtype='U28')
+    if not len(text):
+        return np.empty(0)
+    # Each character as its code point: columns 23-27 hold the UTC offset
+    codes = text.view(np.uint32).reshape(len(text), 28)
+    present = codes[:, 0] != 0
+    local = np.where(present, text, '1970-01-01T00:00:00.000').astype('U23').astype('datetime64[ms]')
+
+    digits = codes[:, 24:28].astype(np.int64) - ord('0')
+    offset = (digits[:, 0] * 10 + digits[:, 1]) * 3600 + (digits[:, 2] * 10 + digits[:, 3]) * 60
+    sign = np.select([codes[:, 23] == ord('+'), codes[:, 23] == ord('-')], [1, -1], 0)
+
+    seconds = local.astype(np.int64) / 1000.0 - sign * offset
+    return np.where(present, seconds, np.nan)
+
+def status_category(name: str, categories: Dict[str, Optional[str]]) -> int:
+    category = categories.get(name)
+    if category in CATEGORY_CODES:
+        return CATEGORY_CODES[category]
+    if (name or '').lower() in DONE_STATUSES:
+        return CATEGORY_DONE
+    if (name or '').lower() in NEW_STATUSES:
+        return CATEGORY_NEW
+    return CATEGORY_IN_PROGRESS
+
+def codes_for(values: Sequence[str], names: List[str]) -> np.ndarray:
+    """Integer codes of values in a list of names"""
+    index = {name: code for code, name in enumerate(names)}
+    return np.array([index[value] for value in values], dtype=np.int32)
+
+class StatusTable:
+    """
+    Columnar status history of a project in NumPy arrays: one row per issue
+    (type, epic, created, current status) and one row per status change
+    (issue row, from/to status, time), sorted by issue then time. Types,
+    epics and statuses are integer codes into the name lists.
+    """
+
+    def __init__(self, mirror: JiraMirror, project: str):
+        issues = mirror.project_issues(project)
+        self.keys = [row['key'] for row in issues]
+        index = {key: number for number, key in enumerate(self.keys)}
+
+        types = [row['issuetype'] or 'Unknown' for row in issues]
+        self.type_names = sorted(set(types))
+        self.types = codes_for(types, self.type_names)
+
+        rows = {row['key']: row for row in issues}
+        epics = [self._epic(row['key'], rows) for row in issues]
+        self.epic_names = sorted(set(epics))
+        self.epics = codes_for(epics, self.epic_names)
+        self.epic_summaries = {row['key']: row['summary'] for row in issues if row['issuetype'] == 'Epic'}
+
+        changes = [row for row in mirror.project_status_changes(project) if row['issue_key'] in index]
+        self.status_names = sorted({row['status'] for row in issues if row['status']}
+                                   | {row['from_string'] for row in changes if row['from_string']}
+                                   | {row['to_string'] for row in changes if row['to_string']})
+        status_index = {name: number for number, name in enumerate(self.status_names)}
+        categories = mirror.status_categories()
+        self.categories = np.array([status_category(name, categories) for name in self.status_names], dtype=np.int8)
+
+        self.created = parse_jira_times([row['created'] for row in issues])
+        self.current = np.array([status_index.get(row['status'], -1) for row in issues], dtype=np.int32)
+
+        issue_rows = np.array([index[row['issue_key']] for row in changes], dtype=np.int32)
+        from_status = np.array([status_index.get(row['from_string'], -1) for row in changes], dtype=np.int32)
+        to_status = np.array([status_index.get(row['to_string'], -1) for row in changes], dtype=np.int32)
+        times = parse_jira_times([row['created'] for row in changes])
+        order = np.lexsort((times, issue_rows))
+        self.change_issue = issue_rows[order]
+        self.change_from = from_status[order]
+        self.change_to = to_status[order]
+        self.change_time = times[order]
+
+    @staticmethod
+    def _epic(key: str, rows: Dict[str, dict]) -> str:
+        """The epic an issue rolls up to through its parents (an epic is its own)"""
+        seen = set()
+        while key in rows and key not in seen:
+            if rows[key]['issuetype'] == 'Epic':
+                return key
+            seen.add(key)
+            key = rows[key]['parent']
+        return NO_EPIC
+
+    def category_of(self, statuses: np.ndarray) -> np.ndarray:
+        """Category codes for status codes; unknown statuses (-1) count as in progress"""
+        return np.where(statuses >= 0, self.categories[np.maximum(statuses, 0)], CATEGORY_IN_PROGRESS)
+
+    def flow_times(self):
+        """
+        Per-issue lead time (created to done) and cycle time (first in
+        progress to done), in seconds; NaN for issues not currently done.
+        Done means the last move into a done status.
+        Returns: (lead_times, cycle_times)
+        """
+        count = len(self.keys)
+        to_category = self.category_of(self.change_to)
+
+        done_at = np.full(count, -np.inf)
+        into_done = to_category == CATEGORY_DONE
+        np.maximum.at(done_at, self.change_issue[into_done], self.change_time[into_done])
+        done_at[np.isinf(done_at) | (self.category_of(self.current) != CATEGORY_DONE)] = np.nan
+
+        started_at = np.full(count, np.inf)
+        into_progress = to_category == CATEGORY_IN_PROGRESS
+        np.minimum.at(started_at, self.change_issue[into_progress], self.change_time[into_progress])
+        # Issues moved straight from new to done have no cycle time
+        started_at[np.isinf(started_at)] = np.nan
+
+        return done_at - self.created, done_at - started_at
+
+    def status_stays(self):
+        """
+        Every finished stay of an issue in a status: from creation to its
+        first change, and between consecutive changes. Time in an issue's
+        current status isn't counted until it moves on.
+        Returns: (issue_rows, status_codes, durations_in_seconds)
+        """
+        if not len(self.change_issue):
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty, np.empty(0)
+
+        first = np.r_[True, self.change_issue[1:] != self.change_issue[:-1]]
+        has_next = np.r_[~first[1:], False]
+
+        # Stays ended by a later change of the same issue
+        between = np.flatnonzero(has_next)
+        issues = [self.change_issue[between], self.change_issue[first]]
+        statuses = [self.change_to[between], self.change_from[first]]
+        durations = [self.change_time[between + 1] - self.change_time[between],
+                     self.change_time[first] - self.created[self.change_issue[first]]]
+
+        issues, statuses, durations = np.concatenate(issues), np.concatenate(statuses), np.concatenate(durations)
+        keep = (statuses >= 0) & ~np.isnan(durations)
+        return issues[keep], statuses[keep], np.maximum(durations[keep], 0)
+
+    def groups(self, by: str):
+        """Group codes per issue and group names, for by='type' or by='epic'"""
+        if by == 'epic':
+            return self.epics, self.epic_names
+        return self.types, self.type_names
+
+def group_percentiles(groups: np.ndarray, values: np.ndarray, percentiles: Sequence[float]):
+    """
+    Percentiles of values per group code, skipping NaN
+    Returns: {group_code: (count, [percentile values])}
+    """
+    keep = ~np.isnan(values)
+    groups, values = groups[keep], values[keep]
+    if not len(values):
+        return {}
+    order = np.lexsort((values, groups))
+    groups, values = groups[order], values[order]
+    codes, starts = np.unique(groups, return_index=True)
+    ends = np.r_[starts[1:], len(groups)]
+    return {
+        int(code): (int(end - start), np.percentile(values[start:end], percentiles).tolist())
+        for code, start, end in zip(codes, starts, ends)
+    }
+
+def flow_report(table: StatusTable, by: str, percentiles: Sequence[float]) -> List[dict]:
+    """Lead and cycle time percentiles (days) per issue type or epic"""
+    codes, names = table.groups(by)
+    lead, cycle = table.flow_times()
+    leads = group_percentiles(codes, lead / DAY, percentiles)
+    cycles = group_percentiles(codes, cycle / DAY, percentiles)
+    totals = np.bincount(codes, minlength=len(names))
+    return [
+        {
+            'group': name,
+            'issues': int(totals[code]),
+            'done': leads.get(code, (0, []))[0],
+            'lead': leads.get(code, (0, []))[1],
+            'cycle': cycles.get(code, (0, []))[1],
+        }
+        for code, name in enumerate(names) if totals[code]
+    ]
+
+def time_in_status_report(table: StatusTable, by: str, percentiles: Sequence[float]) -> List[dict]:
+    """Time-in-status percentiles (days) per issue type or epic and status"""
+    codes, names = table.groups(by)
+    issues, statuses, durations = table.status_stays()
+    status_count = len(table.status_names)
+    combined = codes[issues].astype(np.int64) * status_count + statuses
+    stats = group_percentiles(combined, durations / DAY, percentiles)
+    return [
+        {'group': names[code // status_count], 'status': table.status_names[code % status_count],
+         'stays': count, 'days': values}
+        for code, (count, values) in sorted(stats.items())
+    ]
+
+def format_days(values: List[float], width: int) -> str:
+    if not values:
+        return '-'.rjust(width)
+    return '/'.join(f"{value:.1f}" for value in values).rjust(width)
+
+def print_reports(table: StatusTable, by: str, percentiles: Sequence[float]) -> None:
+    label = '/'.join(f"p{p:g}" for p in percentiles)
+    width = max(len(label), 8 * len(percentiles))
+
+    def group_name(name: str) -> str:
+        summary = table.epic_summaries.get(name)
+        return f"{name} {summary}"[:40] if summary else name
+
+    print(f"\nLead and cycle time in days ({label}) by {by}:")
+    print(f"{'':40} {'issues':>6} {'done':>6} {'lead':>{width}} {'cycle':>{width}}")
+    for row in flow_report(table, by, percentiles):
+        print(f"{group_name(row['group']):40} {row['issues']:>6} {row['done']:>6} "
+              f"{format_days(row['lead'], width)} {format_days(row['cycle'], width)}")
+
+    print(f"\nTime in status in days ({label}) by {by}:")
+    print(f"{'':40} {'status':24} {'stays':>6} {'days':>{width}}")
+    for row in time_in_status_report(table, by, percentiles):
+        print(f"{group_name(row['group']):40} {row['status'][:24]:24} {row['stays']:>6} {format_days(row['days'], width)}")
+
+def parse_percentiles(value: str) -> List[float]:
+    """argparse type for a comma-separated percentile list such as 50,85,95"""
+    try:
+        percentiles = [float(part) for part in value.split(',') if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid percentiles '{value}' (e.g. 50,85,95)")
+    if not percentiles or any(p < 0 or p > 100 for p in percentiles):
+        raise argparse.ArgumentTypeError("percentiles must be between 0 and 100")
+    return percentiles
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Lead time, cycle time and time-in-status percentiles from the mirrored changelog')
+    parser.add_argument('--project', default='TENP', help='Project key (default: TENP)')
+    parser.add_argument('--by', choices=('type', 'epic'), default='type', help='Group by issue type or epic')
+    parser.add_argument('--percentiles', type=parse_percentiles, default=list(DEFAULT_PERCENTILES),
+                        help='Comma-separated percentiles (default: 50,85,95)')
+    parser.add_argument('--max-staleness', type=parse_staleness, default=0,
+                        help='Skip the mirror delta sync if it ran within this budget (e.g. 1h)')
+    args = parser.parse_args(argv)
+
+    mirror = JiraMirror()
+    try:
+        last_sync = mirror.last_sync(args.project)
+        if last_sync is None or time.time() - last_sync > args.max_staleness:
+            try:
+                mirror.sync(args.project)
+            except (requests.exceptions.RequestException, sqlite3.Error) as e:
+                if last_sync is None:
+                    print(f"Error: {str(e)}")
+                    sys.exit(1)
+                print(f"\nWarning: could not sync {args.project} ({str(e)}); "
+                      f"using the mirror from {format_age(time.time() - last_sync)} ago")
+
+        started = time.perf_counter()
+        table = StatusTable(mirror, args.project)
+        print_reports(table, args.by, args.percentiles)
+        print(f"\n{len(table.keys)} issues, {len(table.change_issue)} status changes "
+              f"analysed in {time.perf_counter() - started:.2f}s")
+    finally:
+        mirror.close()
+
+if __name__ == '__main__':
+    main()
@@ -1,40 +1,61 @@
 #!/usr/bin/env python3
-import os
+import argparse
 import sys
-from jira import JIRA
-from dotenv import load_dotenv
+from jira_mirror import JiraMirror, fetch_remaining_history, parse_staleness
+from jira_utils import get_issue, init_jira
 
-def main():
-    # Load environment variables
-    load_dotenv()
-    
-    # Get Jira credentials from environment
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
-    server = os.getenv('JIRA_BASE_URL')
-    
-    if not all([email, api_token, server]):
-        print("Error: Missing required environment variables")
+def check_mirrored_issue(issue_key, max_staleness):
+    """Show an issue from the local mirror, refetching it only if older than max_staleness seconds"""
+    mirror = JiraMirror()
+    try:
+        rows, error = mirror.fresh_issues([issue_key], max_staleness)
+        history = mirror.status_history(issue_key)
+    finally:
+        mirror.close()
+
+    if error:
+        print(f"\nWarning: could not revalidate {issue_key} ({error}); showing mirror copy")
+
+    issue = rows.get(issue_key)
+    if issue is None:
+        print(f"\nError: {issue_key} not found")
         sys.exit(1)
-    
+
+    print(f"\nIssue {issue_key} details:")
+    print(f"Status: {issue['status']}")
+    print(f"Summary: {issue['summary']}")
+
+    print("\nStatus history:")
+    for item in history:
+        print(f"From '{item['from_string']}' to '{item['to_string']}' on {item['created']}")
+
+def main(argv=None):
     # Check command line arguments
-    if len(sys.argv) != 2:
-        print("Usage: python check_issue.py <issue-key>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Show an issue and its status history')
+    parser.add_argument('issue_key', help='Issue key (e.g., TENP-71)')
+    parser.add_argument('--max-staleness', type=parse_staleness,
+                        help='Answer from the local mirror if checked within this budget (e.g. 5m)')
+    args = parser.parse_args(argv)
+
+    issue_key = args.issue_key
     
-    issue_key = sys.argv[1]
+    if args.max_staleness is not None:
+        check_mirrored_issue(issue_key, args.max_staleness)
+        return
+    
+    # Initialize Jira
+    jira, error = init_jira()
+    if error:
+        print(f"\nError: {error}")
+        sys.exit(1)
     
     try:
-        # Initialize Jira client
-        jira = JIRA(
-            server=server,
-            basic_auth=(email, api_token)
-        )
-        
         print(f"\nSuccessfully authenticated as: {jira.current_user()}")
         
-        # Get the issue
-        issue = jira.issue(issue_key)
+        # Get the issue with its changelog in one request; only histories
+        # past the embedded page cost more
+        issue = get_issue(jira, issue_key, 'check_issue')
+        fetch_remaining_history(issue.raw)
         
         # Get issue details
         print(f"\nIssue {issue_key} details:")
@@ -43,10 +64,10 @@ def main():
         
         # Get issue history
         print("\nStatus history:")
-        for history in jira.issue_changelog(issue):
-            for item in history.items:
-                if item.field == 'status':
-                    print(f"From '{item.fromString}' to '{item.toString}' on {history.created}")
+        for history in issue.raw['changelog']['histories']:
+            for item in history.get('items', []):
+                if item.get('field') == 'status':
+                    print(f"From '{item.get('fromString')}' to '{item.get('toString')}' on {history.get('created')}")
         
     except Exception as e:
         print(f"\nError: {str(e)}")
@@ -1,17 +1,17 @@
 import os
-from dotenv import load_dotenv
+import threading
 from pathlib import Path
+from typing import Dict
 
-# Load environment variables from .env file
-env_path = Path(__file__).parent / '.env'
-load_dotenv(dotenv_path=env_path)
-
-# Configuration settings
-JIRA_EMAIL = os.getenv('JIRA_EMAIL')
-JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
-JIRA_BASE_URL = os.getenv('JIRA_BASE_URL')
-JIRA_API_VERSION = os.getenv('JIRA_API_VERSION', '2')
-JIRA_PROJECT_KEY = os.getenv('JIRA_PROJECT_KEY')
+# Configuration settings, read from .env on first use (config.get_config()
+# or any config.JIRA_* attribute) rather than at import
+CONFIG_VARS = {
+    'JIRA_EMAIL': None,
+    'JIRA_API_TOKEN': None,
+    'JIRA_BASE_URL': None,
+    'JIRA_API_VERSION': '2',
+    'JIRA_PROJECT_KEY': None,
+}
 
 # Validate required environment variables
 required_vars = [
@@ -21,10 +21,34 @@ required_vars = [
     'JIRA_PROJECT_KEY'
 ]
 
-missing_vars = [var for var in required_vars if not os.getenv(var)]
-if missing_vars:
-    raise EnvironmentError(
-        f"Missing required environment variables: {', '.join(missing_vars)}\n"
-        f"Please check your .env file and ensure all required variables are set.\n"
-        f"You can use .env.template as a reference."
-    )
+_lock = threading.Lock()
+_config = None
+
+def get_config() -> Dict[str, str]:
+    """
+    Load and validate the Jira settings once
+    Raises EnvironmentError if a required variable is missing
+    """
+    global _config
+    with _lock:
+        if _config is None:
+            from dotenv import load_dotenv
+
+            # Load environment variables from .env file
+            load_dotenv(dotenv_path=Path(__file__).parent / '.env')
+
+            missing_vars = [var for var in required_vars if not os.getenv(var)]
+            if missing_vars:
+                raise EnvironmentError(
+                    f"Missing required environment variables: {', '.join(missing_vars)}\n"
+                    f"Please check your .env file and ensure all required variables are set.\n"
+                    f"You can use .env.template as a reference."
+                )
+            _config = {name: os.getenv(name, default) for name, default in CONFIG_VARS.items()}
+        return _config
+
+def __getattr__(name: str) -> str:
+    # PEP 562: config.JIRA_EMAIL and friends resolve through get_config()
+    if name in CONFIG_VARS:
+        return get_config()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
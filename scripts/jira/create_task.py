@@ -1,39 +1,31 @@
 #!/usr/bin/env python3
+import argparse
 import os
 import sys
-from jira import JIRA
-from dotenv import load_dotenv
+from jira_utils import create_issue_idempotent, init_jira
 
-def main():
-    # Load environment variables
-    load_dotenv()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Create an issue in the project')
+    parser.add_argument('summary', help='Issue summary')
+    parser.add_argument('description', help='Issue description')
+    parser.add_argument('issue_type', help='Issue type (e.g. Task)')
+    args = parser.parse_args(argv)
+    summary = args.summary
+    description = args.description
+    issue_type = args.issue_type
     
-    # Get Jira credentials from environment
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
-    server = os.getenv('JIRA_BASE_URL')
-    project_key = os.getenv('JIRA_PROJECT_KEY')
-    
-    if not all([email, api_token, server, project_key]):
-        print("Error: Missing required environment variables")
+    # Initialize Jira
+    jira, error = init_jira()
+    if error:
+        print(f"\nError: {error}")
         sys.exit(1)
     
-    # Check command line arguments
-    if len(sys.argv) != 4:
-        print("Usage: python create_task.py <summary> <description> <issue_type>")
+    project_key = os.getenv('JIRA_PROJECT_KEY')
+    if not project_key:
+        print("Error: Missing required environment variables")
         sys.exit(1)
     
-    summary = sys.argv[1]
-    description = sys.argv[2]
-    issue_type = sys.argv[3]
-    
     try:
-        # Initialize Jira client
-        jira = JIRA(
-            server=server,
-            basic_auth=(email, api_token)
-        )
-        
         print(f"\nSuccessfully authenticated as: {jira.current_user()}")
         
         # Create issue
@@ -44,9 +36,13 @@ def main():
             'issuetype': {'name': issue_type},
         }
         
-        new_issue = jira.create_issue(fields=issue_dict)
+        # Retried safely: a timed-out attempt the server committed is found, not duplicated
+        issue_key, error = create_issue_idempotent(issue_dict)
+        if error:
+            print(f"\nError: {error}")
+            sys.exit(1)
         
-        print(f"\nSuccessfully created issue: {new_issue.key}")
+        print(f"\nSuccessfully created issue: {issue_key}")
         print(f"Summary: {summary}")
         
     except Exception as e:
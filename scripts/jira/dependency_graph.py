@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import requests
+from jira_utils import iter_issues
+
+# Link types that mean "inward issue must finish before outward issue"
+DEPENDENCY_LINK_TYPES = ('Blocks',)
+# Status names treated as finished when Jira sends no status category
+DONE_STATUSES = ('done',)
+
+def blocking_links(issue_key: str, issuelinks: Iterable[dict]) -> List[Tuple[str, str, Optional[str]]]:
+    """
+    Read an issue's dependency links as (blocker, blocked, link_id): an
+    outwardIssue is blocked by this issue, an inwardIssue blocks it
+    """
+    links = []
+    for link in issuelinks or []:
+        if (link.get('type') or {}).get('name') not in DEPENDENCY_LINK_TYPES:
+            continue
+        if 'outwardIssue' in link:
+            links.append((issue_key, link['outwardIssue']['key'], link.get('id')))
+        elif 'inwardIssue' in link:
+            links.append((link['inwardIssue']['key'], issue_key, link.get('id')))
+    return links
+
+def is_done_status(status: Optional[dict]) -> bool:
+    status = status or {}
+    category = (status.get('statusCategory') or {}).get('key')
+    if category:
+        return category == 'done'
+    return (status.get('name') or '').lower() in DONE_STATUSES
+
+class DependencyGraph:
+    """
+    In-memory Blocks graph of a project: blocker -> blocked adjacency in both
+    directions plus each issue's status, loaded in one paginated search so
+    dependency questions need no further requests
+    """
+
+    def __init__(self):
+        self.blocks: Dict[str, Set[str]] = {}
+        self.blocked_by: Dict[str, Set[str]] = {}
+        self.status: Dict[str, str] = {}
+        self.summary: Dict[str, str] = {}
+        self.done: Set[str] = set()
+        # (blocker, blocked): link ID, for removing links
+        self.link_ids: Dict[Tuple[str, str], Optional[str]] = {}
+
+    @classmethod
+    def load(cls, project: str) -> 'DependencyGraph':
+        """
+        Load every issue of a project with its links
+        Raises requests.exceptions.RequestException on transport or HTTP errors
+        """
+        graph = cls()
+        graph.add_issues(iter_issues(f'project = "{project}" ORDER BY key ASC', 'dependency_graph'))
+        return graph
+
+    def add_issues(self, issues: Iterable[dict]) -> None:
+        """Add raw issue dicts (with status and issuelinks) to the graph"""
+        for issue in issues:
+            key, fields = issue['key'], issue.get('fields', {})
+            status = fields.get('status') or {}
+            self.status[key] = status.get('name')
+            self.summary[key] = fields.get('summary')
+            if is_done_status(status):
+                self.done.add(key)
+            else:
+                self.done.discard(key)
+            for blocker, blocked, link_id in blocking_links(key, fields.get('issuelinks')):
+                self.add_edge(blocker, blocked, link_id)
+
+    def add_edge(self, blocker: str, blocked: str, link_id: Optional[str] = None) -> None:
+        self.blocks.setdefault(blocker, set()).add(blocked)
+        self.blocked_by.setdefault(blocked, set()).add(blocker)
+        if link_id or (blocker, blocked) not in self.link_ids:
+            self.link_ids[(blocker, blocked)] = link_id
+
+    def edges(self) -> List[Tuple[str, str]]:
+        """Every (blocker, blocked) pair in the graph"""
+        return sorted(self.link_ids)
+
+    def has_edge(self, blocker: str, blocked: str) -> bool:
+        return blocked in self.blocks.get(blocker, ())
+
+    def is_done(self, key: str) -> bool:
+        return key in self.done
+
+    def blockers(self, key: str) -> List[str]:
+        """Issues that directly block key"""
+        return sorted(self.blocked_by.get(key, ()))
+
+    def dependents(self, key: str) -> List[str]:
+        """Issues that key directly blocks"""
+        return sorted(self.blocks.get(key, ()))
+
+    def transitive_blockers(self, key: str) -> List[str]:
+        """Every issue that must finish before key, however indirectly"""
+        seen, stack = set(), [key]
+        while stack:
+            for blocker in self.blocked_by.get(stack.pop(), ()):
+                if blocker not in seen and blocker != key:
+                    seen.add(blocker)
+                    stack.append(blocker)
+        return sorted(seen)
+
+    def open_blockers(self, key: str, transitive: bool = False) -> List[str]:
+        """Blockers of key that aren't done yet"""
+        blockers = self.transitive_blockers(key) if transitive else self.blockers(key)
+        return [blocker for blocker in blockers if not self.is_done(blocker)]
+
+    def newly_unblocked(self, completed_key: str) -> List[str]:
+        """
+        Open issues that completing completed_key leaves with no open
+        blockers (completed_key counts as done even if the graph predates it)
+        """
+        return [
+            blocked for blocked in self.dependents(completed_key)
+            if not self.is_done(blocked)
+            and all(blocker == completed_key or self.is_done(blocker) for blocker in self.blocked_by[blocked])
+        ]
+
+    def cycles(self) -> List[List[str]]:
+        """
+        Groups of issues that block each other in a loop (strongly connected
+        components with more than one issue, or an issue blocking itself)
+        """
+        # Iterative Tarjan, so long chains don't hit the recursion limit
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        found: List[List[str]] = []
+
+        for root in sorted(self.blocks):
+            if root in index:
+                continue
+            work = [(root, iter(sorted(self.blocks.get(root, ()))))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self.blocks.get(child, ())))))
+                    elif child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or self.has_edge(node, node):
+                        found.append(sorted(component))
+        return found
+
+def print_dependencies(graph: DependencyGraph, issue_key: str) -> None:
+    def describe(keys: List[str]) -> str:
+        return ', '.join(f"{key} ({graph.status.get(key) or 'unknown'})" for key in keys) or 'none'
+
+    print(f"\n{issue_key}: {graph.summary.get(issue_key) or ''} [{graph.status.get(issue_key) or 'unknown'}]")
+    print(f"Blocked by: {describe(graph.blockers(issue_key))}")
+    print(f"All blockers: {describe(graph.transitive_blockers(issue_key))}")
+    print(f"Open blockers: {describe(graph.open_blockers(issue_key, transitive=True))}")
+    print(f"Blocks: {describe(graph.dependents(issue_key))}")
+    print(f"Completing it unblocks: {describe(graph.newly_unblocked(issue_key))}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Show dependencies and Blocks cycles from the project link graph')
+    parser.add_argument('issue_keys', nargs='*', help='Issues to show dependencies for (e.g., TENP-75)')
+    parser.add_argument('--project', default=os.getenv('JIRA_PROJECT_KEY', 'TENP'), help='Project to load')
+    args = parser.parse_args(argv)
+
+    try:
+        graph = DependencyGraph.load(args.project)
+    except requests.exceptions.RequestException as e:
+        print(f"Error loading dependency graph: {str(e)}")
+        sys.exit(1)
+
+    for issue_key in args.issue_keys:
+        print_dependencies(graph, issue_key)
+
+    cycles = graph.cycles()
+    if cycles:
+        print(f"\nDependency cycles ({len(cycles)}):")
+        for cycle in cycles:
+            print(f"  {' <-> '.join(cycle)}")
+    elif not args.issue_keys:
+        print(f"\nNo dependency cycles among {len(graph.status)} issues")
+
+if __name__ == '__main__':
+    main()
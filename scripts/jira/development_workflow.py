@@ -1,61 +1,107 @@
 #!/usr/bin/env python3
+import argparse
 import os
 import sys
-from jira import JIRA
-from dotenv import load_dotenv
+import requests
+from jira_mirror import JiraMirror, parse_staleness
+from jira_utils import fetch_issues, get_jira, perform_transition
 import json
 from datetime import datetime
 
-# Load environment variables
-load_dotenv()
-
-# Jira connection setup
-JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
-JIRA_EMAIL = os.getenv('JIRA_EMAIL')
-JIRA_URL = os.getenv('JIRA_BASE_URL')
-
-# Initialize Jira client
-jira = JIRA(
-    basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN),
-    server=JIRA_URL
-)
-
 class DevelopmentWorkflow:
     def __init__(self):
         self.project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.work_log_dir = os.path.join(self.project_root, 'task_work_logs')
         self.program_file = os.path.join(self.project_root, 'development_program.json')
         os.makedirs(self.work_log_dir, exist_ok=True)
+        # Session cache of program task state: loaded in one batched read and
+        # dropped by the transitions this workflow performs
+        self.task_states = {}
 
-    def get_parent_story(self, issue):
-        """Get the parent story of a task"""
-        if hasattr(issue.fields, 'parent'):
-            return issue.fields.parent
-        return None
+    def load_task_states(self, task_ids):
+        """Load the state of program tasks not yet cached, in one batched read"""
+        missing = [task_id for task_id in task_ids if task_id not in self.task_states]
+        if not missing:
+            return
+        try:
+            issues = fetch_issues(missing, 'program_task')
+        except requests.exceptions.RequestException as e:
+            print(f"Error loading task statuses: {str(e)}")
+            return
+        for key, issue in issues.items():
+            fields = issue['fields']
+            self.task_states[key] = {
+                'summary': fields['summary'],
+                'status': fields['status']['name'],
+                'issuetype': fields['issuetype']['name'],
+                'parent': fields.get('parent')
+            }
+
+    def get_task_status(self, task_id):
+        """Get a program task's status from the session cache"""
+        self.load_task_states([task_id])
+        return self.cached_status(task_id)
+
+    def cached_status(self, task_id):
+        """A program task's cached status, None if it couldn't be loaded"""
+        return self.task_states.get(task_id, {}).get('status')
+
+    def tasks_in_status(self, tasks, status):
+        """
+        Filter program tasks by status without a request per task; if the
+        batched read fails its error is shown once and no task matches
+        """
+        self.load_task_states([task['id'] for task in tasks])
+        return [task for task in tasks if self.cached_status(task['id']) == status]
+
+    def transition_task(self, task_id, target_status):
+        """Move a task; its session cache entry is reloaded on the next read"""
+        state = self.task_states.get(task_id, {})
+        success, error = perform_transition(get_jira(), task_id, target_status, state.get('status'), state.get('issuetype'))
+        if not success:
+            print(f"Could not move {task_id} to {target_status}: {error}")
+            return False
+        # Transitions match by name as well as destination, so the issue may
+        # have landed in a status other than target_status: drop the entry and
+        # let the next batched read load the real one
+        self.task_states.pop(task_id, None)
+        return True
+
+    def get_parent_story(self, task_id):
+        """Get the parent story of a task (raw key and fields) from the session cache"""
+        self.load_task_states([task_id])
+        return self.task_states.get(task_id, {}).get('parent')
 
     def create_development_program(self):
         """Create or update the development program"""
         print("\nCreating Development Program")
         print("Enter task IDs to include (one per line, empty line to finish):")
         
-        tasks = []
+        task_ids = []
         while True:
             task_id = input().strip()
             if not task_id:
                 break
-            try:
-                issue = jira.issue(task_id)
-                tasks.append({
-                    'id': task_id,
-                    'summary': issue.fields.summary,
-                    'status': issue.fields.status.name,
-                    'priority': len(tasks) + 1
-                })
-                # Move to Selected for Development if not already
-                if issue.fields.status.name not in ['Selected for Development', 'In Progress', 'Testing', 'Review']:
-                    jira.transition_issue(issue, 'Selected for Development')
-            except Exception as e:
-                print(f"Error with task {task_id}: {str(e)}")
+            task_ids.append(task_id)
+        
+        # Read every entered task in one batched request
+        self.load_task_states(task_ids)
+        
+        tasks = []
+        for task_id in task_ids:
+            state = self.task_states.get(task_id)
+            if not state:
+                print(f"Error with task {task_id}: not found")
+                continue
+            tasks.append({
+                'id': task_id,
+                'summary': state['summary'],
+                'status': state['status'],
+                'priority': len(tasks) + 1
+            })
+            # Move to Selected for Development if not already
+            if state['status'] not in ['Selected for Development', 'In Progress', 'Testing', 'Review']:
+                self.transition_task(task_id, 'Selected for Development')
         
         if tasks:
             with open(self.program_file, 'w') as f:
@@ -78,7 +124,7 @@ class DevelopmentWorkflow:
         with open(work_log_path, 'w') as f:
             f.write(f"# Task Work Log - {task_id}\n\n")
             if parent_story:
-                f.write(f"Parent Story: {parent_story.key} - {parent_story.fields.summary}\n\n")
+                f.write(f"Parent Story: {parent_story['key']} - {parent_story.get('fields', {}).get('summary')}\n\n")
             f.write(f"## {summary}\n\n")
             f.write(f"### Development Started: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
             f.write("#### Implementation Details\n- \n\n")
@@ -104,14 +150,14 @@ class DevelopmentWorkflow:
 
     def start_task(self, task):
         """Start working on a task"""
-        issue = jira.issue(task['id'])
+        # Read before the transition drops the task's cached state
+        parent_story = self.get_parent_story(task['id'])
         
         # Move to In Progress
-        if issue.fields.status.name != 'In Progress':
-            jira.transition_issue(issue, 'In Progress')
+        if self.get_task_status(task['id']) != 'In Progress':
+            self.transition_task(task['id'], 'In Progress')
         
         # Create work log
-        parent_story = self.get_parent_story(issue)
         work_log = self.create_work_log(task['id'], task['summary'], parent_story)
         print(f"\nTask {task['id']} moved to In Progress")
         print(f"Work log created at: {work_log}")
@@ -128,23 +174,24 @@ class DevelopmentWorkflow:
         with open(work_log_path, 'a') as f:
             f.write(f"\n### Development Completed: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
         
-        issue = jira.issue(task['id'])
+        self.load_task_states([task['id']])
+        summary = self.task_states.get(task['id'], task)['summary']
         
         # Determine next status based on task type
-        if 'test' in issue.fields.summary.lower() or 'testing' in issue.fields.summary.lower():
+        if 'test' in summary.lower() or 'testing' in summary.lower():
             next_status = 'Review'
         else:
             next_status = 'Testing'
         
         # Move to next status
-        jira.transition_issue(issue, next_status)
+        if not self.transition_task(task['id'], next_status):
+            return
         print(f"\nTask {task['id']} moved to {next_status}")
         print("Don't forget to update the work log with final details!")
 
     def complete_review(self, task):
         """Handle review completion"""
-        issue = jira.issue(task['id'])
-        parent_story = self.get_parent_story(issue)
+        parent_story = self.get_parent_story(task['id'])
         
         print("\nReview Completion Options:")
         print("1. Approve and Move to Done")
@@ -161,14 +208,15 @@ class DevelopmentWorkflow:
                 f.write("Status: Approved\n")
             
             # Move to Done
-            jira.transition_issue(issue, 'Done')
+            if not self.transition_task(task['id'], 'Done'):
+                return
             
             # If this completes a story feature, update PROJECT_BRIEF
             if parent_story:
-                print("\nThis task is part of story:", parent_story.key)
+                print("\nThis task is part of story:", parent_story['key'])
                 update_brief = input("Would you like to update PROJECT_BRIEF with story documentation? (y/n): ")
                 if update_brief.lower() == 'y':
-                    self.update_project_brief(parent_story.key, task['id'], task['summary'])
+                    self.update_project_brief(parent_story['key'], task['id'], task['summary'])
             
             print(f"\nTask {task['id']} completed and moved to Done")
             
@@ -182,7 +230,8 @@ class DevelopmentWorkflow:
                 f.write(f"Reason: {reason}\n")
             
             # Move back to In Progress
-            jira.transition_issue(issue, 'In Progress')
+            if not self.transition_task(task['id'], 'In Progress'):
+                return
             print(f"\nTask {task['id']} moved back to In Progress")
             
         elif choice == '3':
@@ -194,22 +243,45 @@ class DevelopmentWorkflow:
                 f.write(f"Reason: {reason}\n")
             
             # Move to Won't Do or similar status
-            jira.transition_issue(issue, "Won't Do")
+            if not self.transition_task(task['id'], "Won't Do"):
+                return
             print(f"\nTask {task['id']} discarded")
 
-    def show_program_status(self):
-        """Show the current status of all tasks in the program"""
+    def get_mirrored_statuses(self, tasks, max_staleness):
+        """Get program task statuses from the local mirror, refetching only stale ones"""
+        mirror = JiraMirror()
+        try:
+            rows, error = mirror.fresh_issues([task['id'] for task in tasks], max_staleness)
+        finally:
+            mirror.close()
+        
+        if error:
+            print(f"Warning: could not revalidate stale tasks ({error}); showing mirror copies")
+        return {key: row['status'] for key, row in rows.items()}
+
+    def show_program_status(self, max_staleness=None):
+        """
+        Show the current status of all tasks in the program
+        With max_staleness (seconds) the statuses come from the local mirror
+        """
         tasks = self.load_development_program()
         if not tasks:
             print("No development program found.")
             return
             
+        if max_staleness is not None:
+            mirrored = self.get_mirrored_statuses(tasks, max_staleness)
+        else:
+            self.load_task_states([task['id'] for task in tasks])
+        
         print("\nDevelopment Program Status:")
         print("---------------------------")
         
         for task in tasks:
-            issue = jira.issue(task['id'])
-            current_status = issue.fields.status.name
+            if max_staleness is not None:
+                current_status = mirrored.get(task['id'], 'Unknown')
+            else:
+                current_status = self.cached_status(task['id']) or 'Unknown'
             print(f"{task['id']} - {task['summary']}")
             print(f"Priority: {task['priority']}")
             print(f"Status: {current_status}")
@@ -221,9 +293,19 @@ class DevelopmentWorkflow:
                 print("Work Log: ")
             print("---------------------------")
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Interactive development workflow')
+    parser.add_argument('--max-staleness', type=parse_staleness,
+                        help='Show program status from the local mirror if checked within this budget (e.g. 5m)')
+    args = parser.parse_args(argv)
+    
     workflow = DevelopmentWorkflow()
     
+    # Load every program task's status up front; menu screens read the cache
+    program = workflow.load_development_program()
+    if program:
+        workflow.load_task_states([task['id'] for task in program])
+    
     while True:
         print("\nDevelopment Workflow Menu:")
         print("1. Create New Development Program")
@@ -240,7 +322,7 @@ def main():
                 workflow.create_development_program()
             
             elif choice == '2':
-                workflow.show_program_status()
+                workflow.show_program_status(args.max_staleness)
             
             elif choice == '3':
                 tasks = workflow.load_development_program()
@@ -249,10 +331,8 @@ def main():
                     continue
                     
                 print("\nAvailable tasks:")
-                for task in tasks:
-                    issue = jira.issue(task['id'])
-                    if issue.fields.status.name == 'Selected for Development':
-                        print(f"{task['priority']}. {task['id']} - {task['summary']}")
+                for task in workflow.tasks_in_status(tasks, 'Selected for Development'):
+                    print(f"{task['priority']}. {task['id']} - {task['summary']}")
                 
                 task_num = int(input("\nEnter task priority number to start: "))
                 task = next((t for t in tasks if t['priority'] == task_num), None)
@@ -268,12 +348,9 @@ def main():
                     continue
                     
                 print("\nIn Progress tasks:")
-                in_progress = []
-                for task in tasks:
-                    issue = jira.issue(task['id'])
-                    if issue.fields.status.name == 'In Progress':
-                        in_progress.append(task)
-                        print(f"{task['priority']}. {task['id']} - {task['summary']}")
+                in_progress = workflow.tasks_in_status(tasks, 'In Progress')
+                for task in in_progress:
+                    print(f"{task['priority']}. {task['id']} - {task['summary']}")
                 
                 if not in_progress:
                     print("No tasks in progress!")
@@ -293,12 +370,9 @@ def main():
                     continue
                     
                 print("\nTasks in Review:")
-                in_review = []
-                for task in tasks:
-                    issue = jira.issue(task['id'])
-                    if issue.fields.status.name == 'Review':
-                        in_review.append(task)
-                        print(f"{task['priority']}. {task['id']} - {task['summary']}")
+                in_review = workflow.tasks_in_status(tasks, 'Review')
+                for task in in_review:
+                    print(f"{task['priority']}. {task['id']} - {task['summary']}")
                 
                 if not in_review:
                     print("No tasks in review!")
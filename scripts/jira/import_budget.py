@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+# Longest a script module may take to import in a fresh interpreter
+IMPORT_BUDGET_MS = float(os.getenv('JIRA_IMPORT_BUDGET_MS', '250'))
+
+# Run in the child: refuse any connection, then time the import itself
+# (interpreter startup excluded)
+PROBE = """
+import json, sys, time
+def refuse_network(event, args):
+    if event == 'socket.connect':
+        raise ConnectionRefusedError('network access during import')
+sys.addaudithook(refuse_network)
+start = time.perf_counter()
+try:
+    __import__(sys.argv[1])
+    print(json.dumps({'ms': (time.perf_counter() - start) * 1000, 'error': None}))
+except BaseException as e:
+    print(json.dumps({'ms': (time.perf_counter() - start) * 1000, 'error': f'{type(e).__name__}: {e}'}))
+"""
+
+def script_modules() -> List[str]:
+    return sorted(path.stem for path in SCRIPTS_DIR.glob('*.py') if path.stem != Path(__file__).stem)
+
+def measure_import(module: str) -> Tuple[float, Optional[str]]:
+    """
+    Import a module in a fresh interpreter with network access refused
+    Returns: (milliseconds, error_message)
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE, module],
+        cwd=SCRIPTS_DIR, capture_output=True, text=True, timeout=60
+    )
+    try:
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return 0.0, (result.stderr.strip().splitlines() or ['no output'])[-1]
+    return report['ms'], report['error']
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check that every Jira script imports quickly and without connecting')
+    parser.add_argument('modules', nargs='*', help='Modules to check (default: every script here)')
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET_MS, help='Import budget in milliseconds')
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for module in args.modules or script_modules():
+        ms, error = measure_import(module)
+        if error:
+            failures += 1
+            print(f"FAIL  {module:28s} {error.splitlines()[0]}")
+        elif ms > args.budget:
+            failures += 1
+            print(f"SLOW  {module:28s} {ms:7.1f} ms")
+        else:
+            print(f"ok    {module:28s} {ms:7.1f} ms")
+
+    print(f"\n{failures} modules over the {args.budget:.0f} ms budget or failing")
+    if failures:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 import { execSync } from 'child_process';
+import net from 'net';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import fs from 'fs';
@@ -18,10 +19,13 @@ class JiraSync {
   private taskCachePath: string;
   private taskCache: Map<string, TaskInfo>;
   private pythonScriptPath: string;
+  private daemonSocketPath: string;
+  private nextRequestId = 1;
 
   constructor() {
     this.taskCachePath = path.join(__dirname, '.task-cache.json');
     this.pythonScriptPath = path.join(__dirname, 'task_workflow.py');
+    this.daemonSocketPath = process.env.JIRA_DAEMON_SOCKET || path.join(__dirname, '.jira-daemon.sock');
     this.taskCache = new Map();
     this.loadCache();
   }
@@ -65,7 +69,64 @@ class JiraSync {
     }
   }
 
+  // One JSON-RPC call to jira_daemon.py; rejects with ENOENT/ECONNREFUSED when it isn't running
+  private callDaemon<T>(method: string, params: Record<string, unknown>): Promise<T> {
+    return new Promise((resolve, reject) => {
+      const id = this.nextRequestId++;
+      const socket = net.createConnection(this.daemonSocketPath);
+      let buffer = '';
+
+      socket.setEncoding('utf-8');
+      socket.setTimeout(60000, () => socket.destroy(new Error(`Jira daemon timed out on ${method}`)));
+      socket.on('connect', () => {
+        socket.write(JSON.stringify({ jsonrpc: '2.0', id, method, params }) + '\n');
+      });
+      socket.on('data', chunk => {
+        buffer += chunk;
+        const newline = buffer.indexOf('\n');
+        if (newline === -1) return;
+        socket.end();
+        try {
+          const response = JSON.parse(buffer.slice(0, newline));
+          if (response.error) {
+            reject(new Error(response.error.message));
+          } else {
+            resolve(response.result as T);
+          }
+        } catch (error) {
+          reject(error);
+        }
+      });
+      socket.on('error', reject);
+    });
+  }
+
+  private async updateTaskStatusFromDaemon(taskId: string): Promise<boolean> {
+    try {
+      const info = await this.callDaemon<{ summary: string; status: string }>('task.info', { task_id: taskId });
+      this.taskCache.set(taskId, {
+        id: taskId,
+        summary: info.summary,
+        status: info.status,
+        lastUpdate: new Date()
+      });
+      this.saveCache();
+      return true;
+    } catch (error) {
+      const code = (error as NodeJS.ErrnoException).code;
+      if (code !== 'ENOENT' && code !== 'ECONNREFUSED') {
+        logger.warn('Jira daemon call failed, falling back to task_workflow.py', { taskId, error });
+      }
+      return false;
+    }
+  }
+
   private async updateTaskStatus(taskId: string) {
+    // The daemon answers from a warm client without blocking the event loop
+    if (await this.updateTaskStatusFromDaemon(taskId)) {
+      return;
+    }
+
     try {
       // Run Python script to update task status
       execSync(`python3 "${this.pythonScriptPath}" ${taskId}`, {
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+import argparse
+import inspect
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from dependency_graph import DependencyGraph
+from jira_utils import (
+    BULK_WORKERS, POOL_MAXSIZE, bulk_create_issues, bulk_transition, create_issue_links,
+    delete_issue_links, fetch_issues, init_jira, init_session, perform_transition, update_issue
+)
+from task_workflow import TaskWorkflow
+
+# The socket lives next to the scripts, like the workflow cache
+SOCKET_PATH = Path(os.getenv('JIRA_DAEMON_SOCKET', Path(__file__).parent / '.jira-daemon.sock'))
+# Requests handled at once across every client; all of them share
+# jira_utils' connection pool, so keep this at or below POOL_MAXSIZE
+DAEMON_WORKERS = int(os.getenv('JIRA_DAEMON_WORKERS', str(POOL_MAXSIZE)))
+# Seconds a project's dependency graph is reused before it is reloaded
+GRAPH_TTL = float(os.getenv('JIRA_DAEMON_GRAPH_TTL', '60'))
+# Seconds a task's info is served from memory; the daemon's own writes to an
+# issue drop its entry straight away
+ISSUE_TTL = float(os.getenv('JIRA_DAEMON_ISSUE_TTL', '15'))
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+class RPCError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+class JiraDaemon:
+    """
+    Long-lived holder of the warm Jira client, connection pool, workflow
+    cache and per-project dependency graphs, with the task_workflow and
+    jira_utils operations exposed as JSON-RPC methods
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._graphs: Dict[str, tuple] = {}
+        self._task_infos: Dict[str, tuple] = {}
+        self.methods: Dict[str, Callable] = {
+            'ping': self.ping,
+            'task.info': self.task_info,
+            'task.work_log': self.task_work_log,
+            'task.dependencies': self.task_dependencies,
+            'task.start': self.task_start,
+            'task.complete': self.task_complete,
+            'issues.fetch': self.issues_fetch,
+            'issues.create': self.issues_create,
+            'issues.transition': self.issues_transition,
+            'issue.transition': self.issue_transition,
+            'issue.update': self.issue_update,
+            'issue.comment': self.issue_comment,
+            'links.create': self.links_create,
+            'links.delete': self.links_delete,
+        }
+
+    def connect(self) -> Optional[str]:
+        """Authenticate both clients up front so the first call is already warm"""
+        jira, error = init_jira()
+        if error:
+            return error
+        _, error = init_session()
+        return error
+
+    def call(self, method: str, params) -> object:
+        handler = self.methods.get(method)
+        if handler is None:
+            raise RPCError(METHOD_NOT_FOUND, f"Unknown method {method}")
+        with self._lock:
+            self.requests += 1
+        try:
+            if isinstance(params, dict):
+                bound = inspect.signature(handler).bind(**params)
+            else:
+                bound = inspect.signature(handler).bind(*(params or []))
+        except TypeError as e:
+            raise RPCError(INVALID_PARAMS, str(e))
+        return handler(*bound.args, **bound.kwargs)
+
+    # Dependency graphs
+
+    def graph(self, project: str, refresh: bool = False) -> DependencyGraph:
+        with self._lock:
+            loaded = self._graphs.get(project)
+        if loaded and not refresh and time.time() - loaded[0] < GRAPH_TTL:
+            return loaded[1]
+        graph = DependencyGraph.load(project)
+        with self._lock:
+            self._graphs[project] = (time.time(), graph)
+        return graph
+
+    def workflow(self, task_id: str) -> TaskWorkflow:
+        workflow = TaskWorkflow(task_id)
+        workflow.graph = self.graph(task_id.split('-')[0])
+        return workflow
+
+    # Task info
+
+    def forget(self, *issue_keys: str) -> None:
+        """Drop cached task info after the daemon changes the issues"""
+        with self._lock:
+            for issue_key in issue_keys:
+                self._task_infos.pop(issue_key, None)
+
+    # Methods
+
+    def ping(self) -> dict:
+        return {'pid': os.getpid(), 'uptime': time.time() - self.started, 'requests': self.requests}
+
+    def task_info(self, task_id: str, refresh: bool = False) -> dict:
+        with self._lock:
+            cached = self._task_infos.get(task_id)
+        if cached and not refresh and time.time() - cached[0] < ISSUE_TTL:
+            return cached[1]
+        info = TaskWorkflow(task_id).get_task_info()
+        with self._lock:
+            self._task_infos[task_id] = (time.time(), info)
+        return info
+
+    def task_work_log(self, task_id: str) -> str:
+        return TaskWorkflow(task_id).create_work_log()
+
+    def task_dependencies(self, task_id: str) -> dict:
+        return self.workflow(task_id).check_dependencies()
+
+    def task_start(self, task_id: str) -> str:
+        try:
+            return TaskWorkflow(task_id).start_development()
+        finally:
+            self.forget(task_id)
+
+    def task_complete(self, task_id: str) -> list:
+        workflow = self.workflow(task_id)
+        try:
+            workflow.complete_task()
+        finally:
+            self.forget(task_id)
+        # complete_task reloaded the graph; keep the fresh one
+        with self._lock:
+            self._graphs[task_id.split('-')[0]] = (time.time(), workflow.graph)
+        return workflow.graph.newly_unblocked(task_id)
+
+    def issues_fetch(self, issue_keys: list, field_set: str) -> dict:
+        return fetch_issues(issue_keys, field_set)
+
+    def issues_create(self, issues: list, idempotency_keys: Optional[list] = None) -> list:
+        return [
+            {'key': key, 'error': error}
+            for key, error in bulk_create_issues(issues, idempotency_keys)
+        ]
+
+    def issues_transition(self, issue_keys: list, target_status: str, comments: Optional[dict] = None) -> list:
+        jira, _ = init_jira()
+        results = bulk_transition(jira, issue_keys, target_status, comments, BULK_WORKERS)
+        self.forget(*issue_keys)
+        return [{'key': key, 'success': success, 'error': error} for key, success, error in results]
+
+    def issue_transition(self, issue_key: str, target_status: str) -> dict:
+        jira, _ = init_jira()
+        success, error = perform_transition(jira, issue_key, target_status)
+        self.forget(issue_key)
+        return {'success': success, 'error': error}
+
+    def issue_update(self, issue_key: str, fields: dict) -> dict:
+        jira, _ = init_jira()
+        success, error = update_issue(jira, issue_key, fields)
+        self.forget(issue_key)
+        return {'success': success, 'error': error}
+
+    def issue_comment(self, issue_key: str, body: str) -> dict:
+        jira, _ = init_jira()
+        comment = jira.add_comment(issue_key, body)
+        return {'id': comment.id}
+
+    def links_create(self, links: list, link_type: str = 'Blocks') -> list:
+        return [
+            {'inward': inward, 'outward': outward, 'error': error}
+            for inward, outward, error in create_issue_links([tuple(link) for link in links], link_type)
+        ]
+
+    def links_delete(self, link_ids: list) -> list:
+        return [{'id': link_id, 'error': error} for link_id, error in delete_issue_links(link_ids)]
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """
+    One client connection: newline-delimited JSON-RPC requests, answered as
+    they finish (matched by id), so one client can have many in flight
+    """
+
+    def handle(self):
+        write_lock = threading.Lock()
+
+        def respond(response: dict) -> None:
+            data = (json.dumps(response, default=str) + '\n').encode()
+            with write_lock:
+                try:
+                    self.wfile.write(data)
+                    self.wfile.flush()
+                except OSError:
+                    # Client went away; nothing left to answer
+                    pass
+
+        def run(request_id, method: str, params) -> None:
+            try:
+                response = {'jsonrpc': '2.0', 'id': request_id, 'result': self.server.jira_daemon.call(method, params)}
+            except RPCError as e:
+                response = {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': e.code, 'message': str(e)}}
+            except Exception as e:
+                response = {'jsonrpc': '2.0', 'id': request_id,
+                            'error': {'code': SERVER_ERROR, 'message': f"{type(e).__name__}: {str(e)}"}}
+            if request_id is not None:
+                respond(response)
+
+        pending = []
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                respond({'jsonrpc': '2.0', 'id': None, 'error': {'code': PARSE_ERROR, 'message': str(e)}})
+                continue
+            if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+                respond({'jsonrpc': '2.0', 'id': None,
+                         'error': {'code': INVALID_REQUEST, 'message': 'Expected an object with a method'}})
+                continue
+            pending.append(self.server.executor.submit(run, request.get('id'), request['method'], request.get('params')))
+        # Answer everything already sent before the connection is closed
+        wait(pending)
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, daemon: JiraDaemon, workers: int = DAEMON_WORKERS):
+        self.jira_daemon = daemon
+        # One pool for every connection's requests
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        super().__init__(str(path), RequestHandler)
+
+def is_running(path: Path = SOCKET_PATH) -> bool:
+    """Whether a daemon is accepting connections on the socket"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+            return True
+        except OSError:
+            return False
+
+def call(method: str, params=None, path: Path = SOCKET_PATH, timeout: float = 60):
+    """
+    Call one daemon method over a fresh connection
+    Raises OSError if no daemon is listening, RPCError for a failed call
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall((json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params or {}}) + '\n').encode())
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    if not line:
+        raise OSError('Daemon closed the connection')
+    response = json.loads(line)
+    if 'error' in response:
+        raise RPCError(response['error']['code'], response['error']['message'])
+    return response['result']
+
+def serve(path: Path = SOCKET_PATH, workers: int = DAEMON_WORKERS) -> bool:
+    """
+    Run the daemon in the foreground until interrupted
+    Returns False if it couldn't start
+    """
+    if path.exists():
+        if is_running(path):
+            print(f"Error: a daemon is already listening on {path}")
+            return False
+        # Left behind by a daemon that didn't shut down cleanly
+        path.unlink()
+
+    daemon = JiraDaemon()
+    error = daemon.connect()
+    if error:
+        print(f"Error: {error}")
+        return False
+
+    # The daemon acts with the user's Jira credentials: owner-only socket
+    old_umask = os.umask(0o177)
+    try:
+        server = DaemonServer(path, daemon, workers)
+    finally:
+        os.umask(old_umask)
+
+    print(f"Jira daemon listening on {path} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.executor.shutdown(wait=False)
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve Jira operations over a local Unix socket (JSON-RPC)')
+    parser.add_argument('--socket', default=str(SOCKET_PATH), help='Socket path')
+    parser.add_argument('--workers', type=int, default=DAEMON_WORKERS, help='Maximum concurrent requests')
+    parser.add_argument('--status', action='store_true', help='Report whether a daemon is running and exit')
+    parser.add_argument('--call', metavar='METHOD', help='Call a method on the running daemon and print the result')
+    parser.add_argument('--params', default='{}', help='JSON parameters for --call')
+    args = parser.parse_args(argv)
+    path = Path(args.socket)
+
+    if args.status:
+        try:
+            info = call('ping', path=path)
+            print(f"Running (pid {info['pid']}, up {info['uptime']:.0f}s, {info['requests']} requests)")
+        except OSError:
+            print('Not running')
+            sys.exit(1)
+    elif args.call:
+        try:
+            print(json.dumps(call(args.call, json.loads(args.params), path), indent=2, default=str))
+        except (OSError, ValueError, RPCError) as e:
+            print(f"Error: {str(e)}")
+            sys.exit(1)
+    elif not serve(path, args.workers):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+import argparse
+import math
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import requests
+from jira_utils import BULK_WORKERS, SEARCH_PAGE_SIZE, fetch_issues, iter_issues, jira_request
+
+MIRROR_PATH = Path(os.getenv('JIRA_MIRROR_PATH', Path(__file__).parent / '.jira-mirror.db'))
+# Re-read this many minutes before the last sync to absorb clock skew
+SYNC_OVERLAP_MINUTES = int(os.getenv('JIRA_SYNC_OVERLAP_MINUTES', '5'))
+STALENESS_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    summary TEXT,
+    status TEXT,
+    issuetype TEXT,
+    parent TEXT,
+    priority TEXT,
+    created TEXT,
+    updated TEXT,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_status ON issues (project, status);
+CREATE INDEX IF NOT EXISTS issues_parent ON issues (parent);
+
+CREATE TABLE IF NOT EXISTS statuses (
+    name TEXT PRIMARY KEY,
+    category TEXT
+);
+
+-- Stored the way the scripts create them: inward_key blocks outward_key
+CREATE TABLE IF NOT EXISTS links (
+    link_id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    inward_key TEXT NOT NULL,
+    outward_key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS links_inward ON links (inward_key);
+CREATE INDEX IF NOT EXISTS links_outward ON links (outward_key);
+
+CREATE TABLE IF NOT EXISTS changelog (
+    history_id TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    item_index INTEGER NOT NULL,
+    field TEXT,
+    from_string TEXT,
+    to_string TEXT,
+    created TEXT,
+    PRIMARY KEY (issue_key, history_id, item_index)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    last_sync REAL NOT NULL,
+    last_full_sync REAL
+);
+"""
+
+def parse_staleness(value: str) -> float:
+    """
+    Parse a staleness budget such as '90s', '5m', '2h' or '1d' (bare numbers
+    are seconds); used as an argparse type for --max-staleness
+    Returns: the budget in seconds
+    """
+    value = value.strip().lower()
+    unit = STALENESS_UNITS.get(value[-1:]) if value else None
+    number = value[:-1] if unit else value
+    try:
+        seconds = float(number) * (unit or 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid staleness '{value}' (use e.g. 30s, 5m, 2h, 1d)")
+    if seconds < 0:
+        raise argparse.ArgumentTypeError("staleness cannot be negative")
+    return seconds
+
+def format_age(seconds: float) -> str:
+    """Render an age in seconds as a short human string (e.g. '4m')"""
+    for unit in ('d', 'h', 'm'):
+        if seconds >= STALENESS_UNITS[unit]:
+            return f"{int(seconds // STALENESS_UNITS[unit])}{unit}"
+    return f"{int(seconds)}s"
+
+def fetch_remaining_history(issue: dict) -> None:
+    """Append the changelog pages a search or bulk fetch left out of an issue"""
+    changelog = issue['changelog']
+    histories = changelog.setdefault('histories', [])
+    while len(histories) < changelog.get('total', 0):
+        page = jira_request('GET', f"issue/{issue['key']}/changelog",
+                            params={'startAt': len(histories), 'maxResults': 100}).json()
+        values = page.get('values', [])
+        if not values:
+            return
+        histories.extend(values)
+
+def complete_changelogs(issues: Iterable[dict], batch_size: int = SEARCH_PAGE_SIZE,
+                        max_workers: int = BULK_WORKERS) -> Iterable[dict]:
+    """
+    Pass issues through, a page at a time, after fetching the rest of every
+    changelog longer than the embedded limit in parallel
+    """
+    def complete(batch: List[dict]) -> List[dict]:
+        partial = [issue for issue in batch if 'changelog' in issue
+                   and len(issue['changelog'].get('histories', [])) < issue['changelog'].get('total', 0)]
+        if partial:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(partial)))) as executor:
+                list(executor.map(fetch_remaining_history, partial))
+        return batch
+
+    batch = []
+    for issue in issues:
+        batch.append(issue)
+        if len(batch) >= batch_size:
+            yield from complete(batch)
+            batch = []
+    yield from complete(batch)
+
+class JiraMirror:
+    """Local SQLite copy of a project's issues, statuses, parents, links and changelog"""
+
+    def __init__(self, path: Path = MIRROR_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        # WAL lets readers in other processes keep reading while a sync writes
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # Reads
+
+    def last_sync(self, project: str) -> Optional[float]:
+        """Epoch seconds of the last completed sync, or None if never synced"""
+        row = self.conn.execute('SELECT last_sync FROM sync_state WHERE project = ?', (project,)).fetchone()
+        return row['last_sync'] if row else None
+
+    def get_issue(self, key: str) -> Optional[sqlite3.Row]:
+        return self.conn.execute('SELECT * FROM issues WHERE key = ?', (key,)).fetchone()
+
+    def get_issues(self, keys: Iterable[str]) -> Dict[str, sqlite3.Row]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        placeholders = ','.join('?' * len(keys))
+        rows = self.conn.execute(f'SELECT * FROM issues WHERE key IN ({placeholders})', keys)
+        return {row['key']: row for row in rows}
+
+    def project_issues(self, project: str, statuses: Optional[List[str]] = None) -> List[sqlite3.Row]:
+        query = 'SELECT * FROM issues WHERE project = ?'
+        params = [project]
+        if statuses:
+            query += f" AND status IN ({','.join('?' * len(statuses))})"
+            params.extend(statuses)
+        # Numeric key order, like ORDER BY key in JQL
+        query += " ORDER BY CAST(substr(key, instr(key, '-') + 1) AS INTEGER)"
+        return self.conn.execute(query, params).fetchall()
+
+    def status_history(self, key: str) -> List[sqlite3.Row]:
+        return self.conn.execute(
+            "SELECT * FROM changelog WHERE issue_key = ? AND field = 'status' ORDER BY created, item_index",
+            (key,)
+        ).fetchall()
+
+    def project_status_changes(self, project: str) -> List[sqlite3.Row]:
+        """Every status change of a project's issues, as (issue_key, from_string, to_string, created)"""
+        return self.conn.execute(
+            """
+            SELECT c.issue_key, c.from_string, c.to_string, c.created FROM changelog c
+            JOIN issues i ON i.key = c.issue_key
+            WHERE i.project = ? AND c.field = 'status'
+            """,
+            (project,)
+        ).fetchall()
+
+    def status_categories(self) -> Dict[str, Optional[str]]:
+        """Status name: category key (new, indeterminate or done) for every status seen"""
+        return {row['name']: row['category'] for row in self.conn.execute('SELECT name, category FROM statuses')}
+
+    def checked_at(self, row: sqlite3.Row) -> float:
+        """
+        When an issue was last known to be current: its own fetch, or the last
+        project sync, which would have picked it up had it changed
+        """
+        return max(row['synced_at'], self.last_sync(row['project']) or 0)
+
+    # Bounded-staleness reads
+
+    def fresh_issues(self, keys: Iterable[str], max_staleness: float) -> Tuple[Dict[str, sqlite3.Row], Optional[str]]:
+        """
+        Serve issues from the mirror when checked within max_staleness seconds;
+        only missing or stale keys are refetched, in one batched fetch
+        Returns: (rows by key, error_message) - on error the stale copies are
+        still returned so callers can keep working offline
+        """
+        keys = list(dict.fromkeys(keys))
+        rows = self.get_issues(keys)
+        now = time.time()
+        stale = [key for key in keys if key not in rows or now - self.checked_at(rows[key]) > max_staleness]
+        if not stale:
+            return rows, None
+
+        try:
+            self.upsert_issues(fetch_issues(stale, 'mirror').values(), synced_at=now)
+        except (requests.exceptions.RequestException, sqlite3.Error) as e:
+            # Unreachable Jira, or another process holding the mirror's write lock
+            return rows, str(e)
+
+        return self.get_issues(keys), None
+
+    def fresh_project(self, project: str, max_staleness: float,
+                      statuses: Optional[List[str]] = None) -> Tuple[List[sqlite3.Row], Optional[str]]:
+        """
+        Serve a project listing from the mirror when it was synced within
+        max_staleness seconds, otherwise run a delta sync first
+        Returns: (rows, error_message) - on error the mirror's copy is still returned
+        """
+        last_sync = self.last_sync(project)
+        error = None
+        if last_sync is None or time.time() - last_sync > max_staleness:
+            try:
+                self.sync(project)
+            except (requests.exceptions.RequestException, sqlite3.Error) as e:
+                error = str(e)
+        return self.project_issues(project, statuses), error
+
+    # Writes
+
+    def upsert_issues(self, issues: Iterable[dict], synced_at: Optional[float] = None) -> int:
+        """
+        Insert or replace raw issues fetched with the 'mirror' field set,
+        committing a page at a time: the write lock is never held across a
+        request, and an error part-way through keeps the pages already written
+        """
+        synced_at = synced_at or time.time()
+        count = 0
+        page = []
+        for issue in complete_changelogs(issues):
+            page.append(issue)
+            if len(page) >= SEARCH_PAGE_SIZE:
+                count += self._write_page(page, synced_at)
+                page = []
+        return count + self._write_page(page, synced_at)
+
+    def _write_page(self, issues: List[dict], synced_at: float) -> int:
+        if not issues:
+            return 0
+        with self._lock, self.conn:
+            for issue in issues:
+                self._upsert_issue(issue, synced_at)
+        return len(issues)
+
+    def _upsert_issue(self, issue: dict, synced_at: float) -> None:
+        key = issue['key']
+        fields = issue['fields']
+        status = fields.get('status') or {}
+
+        self.conn.execute(
+            """
+            INSERT INTO issues (key, project, summary, status, issuetype, parent, priority, created, updated, synced_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (key) DO UPDATE SET
+                project = excluded.project, summary = excluded.summary, status = excluded.status,
+                issuetype = excluded.issuetype, parent = excluded.parent, priority = excluded.priority,
+                created = excluded.created, updated = excluded.updated, synced_at = excluded.synced_at
+            """,
+            (
+                key,
+                (fields.get('project') or {}).get('key', key.split('-')[0]),
+                fields.get('summary'),
+                status.get('name'),
+                (fields.get('issuetype') or {}).get('name'),
+                (fields.get('parent') or {}).get('key'),
+                (fields.get('priority') or {}).get('name'),
+                fields.get('created'),
+                fields.get('updated'),
+                synced_at,
+            )
+        )
+
+        if status.get('name'):
+            self.conn.execute(
+                'INSERT OR REPLACE INTO statuses (name, category) VALUES (?, ?)',
+                (status['name'], (status.get('statusCategory') or {}).get('key'))
+            )
+
+        if 'issuelinks' in fields:
+            self._replace_links(key, fields['issuelinks'])
+
+        if 'changelog' in issue:
+            for history in issue['changelog'].get('histories', []):
+                for index, item in enumerate(history.get('items', [])):
+                    self.conn.execute(
+                        """
+                        INSERT OR REPLACE INTO changelog
+                            (history_id, issue_key, item_index, field, from_string, to_string, created)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (history['id'], key, index, item.get('field'),
+                         item.get('fromString'), item.get('toString'), history.get('created'))
+                    )
+
+    def _replace_links(self, key: str, issuelinks: List[dict]) -> None:
+        self.conn.execute('DELETE FROM links WHERE inward_key = ? OR outward_key = ?', (key, key))
+        for link in issuelinks:
+            # Same reading as TaskWorkflow.check_dependencies: an outwardIssue is
+            # blocked by this issue, an inwardIssue blocks it
+            if 'outwardIssue' in link:
+                inward_key, outward_key = key, link['outwardIssue']['key']
+            elif 'inwardIssue' in link:
+                inward_key, outward_key = link['inwardIssue']['key'], key
+            else:
+                continue
+            self.conn.execute(
+                'INSERT OR REPLACE INTO links (link_id, type, inward_key, outward_key) VALUES (?, ?, ?, ?)',
+                (link['id'], link['type']['name'], inward_key, outward_key)
+            )
+
+    def delete_missing(self, project: str, seen_keys: set) -> int:
+        """Drop issues a full sync no longer sees (deleted or moved out of the project)"""
+        with self._lock, self.conn:
+            stale = [row['key'] for row in self.conn.execute('SELECT key FROM issues WHERE project = ?', (project,))
+                     if row['key'] not in seen_keys]
+            for key in stale:
+                self.conn.execute('DELETE FROM issues WHERE key = ?', (key,))
+                self.conn.execute('DELETE FROM links WHERE inward_key = ? OR outward_key = ?', (key, key))
+                self.conn.execute('DELETE FROM changelog WHERE issue_key = ?', (key,))
+        return len(stale)
+
+    def mark_synced(self, project: str, synced_at: float, full: bool) -> None:
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO sync_state (project, last_sync, last_full_sync) VALUES (?, ?, ?)
+                ON CONFLICT (project) DO UPDATE SET
+                    last_sync = excluded.last_sync,
+                    last_full_sync = COALESCE(excluded.last_full_sync, sync_state.last_full_sync)
+                """,
+                (project, synced_at, synced_at if full else None)
+            )
+
+    # Sync
+
+    def sync(self, project: str, full: bool = False) -> int:
+        """
+        Pull the project into the mirror: everything on the first or a full
+        sync, otherwise only issues updated since the last sync
+        Returns the number of issues upserted
+        """
+        started_at = time.time()
+        last_sync = None if full else self.last_sync(project)
+
+        jql = f'project = "{project}"'
+        if last_sync is not None:
+            # Relative JQL avoids guessing the Jira profile's timezone
+            minutes = math.ceil((started_at - last_sync) / 60) + SYNC_OVERLAP_MINUTES
+            jql += f' AND updated >= "-{minutes}m"'
+        jql += ' ORDER BY updated ASC'
+
+        seen_keys = set()
+
+        def track(issues: Iterable[dict]) -> Iterable[dict]:
+            for issue in issues:
+                seen_keys.add(issue['key'])
+                yield issue
+
+        count = self.upsert_issues(track(iter_issues(jql, 'mirror')), synced_at=started_at)
+        if last_sync is None:
+            self.delete_missing(project, seen_keys)
+        self.mark_synced(project, started_at, full=last_sync is None)
+        return count
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sync the local SQLite mirror of a Jira project')
+    parser.add_argument('--project', default='TENP', help='Project key (default: TENP)')
+    parser.add_argument('--full', action='store_true', help='Reload every issue instead of the delta since the last sync')
+    args = parser.parse_args(argv)
+
+    mirror = JiraMirror()
+    try:
+        previous = mirror.last_sync(args.project)
+        count = mirror.sync(args.project, full=args.full)
+    except (requests.exceptions.RequestException, sqlite3.Error) as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
+    finally:
+        mirror.close()
+
+    if args.full or previous is None:
+        print(f"Full sync of {args.project}: {count} issues")
+    else:
+        print(f"Delta sync of {args.project}: {count} issues updated since {time.strftime('%Y-%m-%d %H:%M', time.localtime(previous))}")
+
+if __name__ == '__main__':
+    main()
@@ -1,94 +1,715 @@
 #!/usr/bin/env python3
 import os
-from typing import Optional, Tuple
-from jira import JIRA
-from dotenv import load_dotenv
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+import requests
+from requests.adapters import HTTPAdapter
+from rate_limiter import AdaptiveRateLimiter, RateLimitedAdapter, get_rate_budget
+from workflow_cache import get_workflow_cache
 
-def init_jira() -> Tuple[Optional[JIRA], Optional[str]]:
+if TYPE_CHECKING:
+    # The jira package is imported when the client is first built, so
+    # scripts that only use REST helpers never pay for it
+    from jira import JIRA
+
+# Connection pool tuning; one pool is shared by the jira client and raw REST calls
+POOL_CONNECTIONS = int(os.getenv('JIRA_POOL_CONNECTIONS', '4'))
+POOL_MAXSIZE = int(os.getenv('JIRA_POOL_MAXSIZE', '20'))
+REQUEST_TIMEOUT = float(os.getenv('JIRA_REQUEST_TIMEOUT', '30'))
+# Concurrent moves for bulk commands; keep at or below POOL_MAXSIZE
+BULK_WORKERS = int(os.getenv('JIRA_BULK_WORKERS', '8'))
+# Issues requested per search page; the server may return fewer
+SEARCH_PAGE_SIZE = int(os.getenv('JIRA_SEARCH_PAGE_SIZE', '100'))
+# Keys per bulk fetch request (the endpoint's limit)
+BULK_FETCH_SIZE = 100
+# Longest search URL sent for key-in chunks; proxies commonly reject ~8KB
+MAX_URL_LENGTH = int(os.getenv('JIRA_MAX_URL_LENGTH', '6000'))
+# Retries for issue creation after timeouts and server errors, and the
+# first backoff in seconds (doubled per retry, with jitter)
+CREATE_RETRIES = int(os.getenv('JIRA_CREATE_RETRIES', '4'))
+CREATE_BACKOFF = float(os.getenv('JIRA_CREATE_BACKOFF', '1'))
+# Label carrying a create's idempotency key (prefix + 16 hex digits), so a
+# retry or a re-applied plan can find an issue the server already committed.
+# A label rather than an issue property because JQL only searches properties
+# an installed app indexes. Pick a prefix your boards and filters don't use;
+# changing it orphans the labels of issues already created
+IDEMPOTENCY_LABEL_PREFIX = os.getenv('JIRA_IDEMPOTENCY_LABEL_PREFIX', 'idem-')
+# Issue payloads per bulk create request (the endpoint's limit)
+BULK_CREATE_SIZE = 50
+
+# Fields and expansions each command reads; every search and issue fetch
+# names one of these so only what is printed or used comes over the wire
+FIELD_SETS: Dict[str, Tuple[str, Optional[str]]] = {
+    # command: (fields, expand)
+    'transition': ('status,issuetype,project', 'transitions'),
+    'transition_state': ('status,issuetype', None),
+    'keys': ('status', None),
+    'idempotency': ('labels', None),
+    'plan_state': ('summary,description,status,issuetype,issuelinks,comment', None),
+    'list_tasks': ('summary,status,issuetype,parent', None),
+    'track_progress': ('summary,status', None),
+    'check_issue': ('summary,status', 'changelog'),
+    'workflow_trigger': ('summary,status', None),
+    'task_workflow': ('summary,description,status,assignee,issuelinks', None),
+    'issue_links': ('issuelinks', None),
+    'dependency_graph': ('summary,status,issuelinks', None),
+    'program_task': ('summary,status,issuetype,parent', None),
+    'epics': ('summary,status', None),
+    'project_tasks': ('summary,status,priority,parent,description', None),
+    'mirror': ('summary,status,issuetype,parent,priority,project,created,updated,issuelinks', 'changelog'),
+}
+
+_lock = threading.Lock()
+_adapter: Optional[HTTPAdapter] = None
+_session: Optional[requests.Session] = None
+_jira: Optional['JIRA'] = None
+# None until the first bulk fetch tells us whether the server has the endpoint
+_bulk_fetch_supported: Optional[bool] = None
+
+def load_credentials() -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Load Jira credentials from the environment (.env next to the scripts or cwd)
+    Returns: (credentials, error_message)
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv(dotenv_path=Path(__file__).parent / '.env')
+    load_dotenv()
+
+    credentials = {
+        'email': os.getenv('JIRA_EMAIL'),
+        'api_token': os.getenv('JIRA_API_TOKEN'),
+        'server': os.getenv('JIRA_BASE_URL'),
+        'api_version': os.getenv('JIRA_API_VERSION', '2'),
+    }
+
+    if not all([credentials['email'], credentials['api_token'], credentials['server']]):
+        return None, "Missing required environment variables"
+
+    return credentials, None
+
+def get_adapter() -> HTTPAdapter:
+    """
+    Get the keep-alive connection pool shared by every Jira session; its
+    rate limiter paces all requests and retries throttled ones
+    """
+    global _adapter
+    with _lock:
+        if _adapter is None:
+            _adapter = RateLimitedAdapter(
+                AdaptiveRateLimiter(
+                    get_rate_budget(os.getenv('JIRA_BASE_URL', '')),
+                    max_concurrency=POOL_MAXSIZE
+                ),
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE
+            )
+        return _adapter
+
+def _mount_pool(session: requests.Session) -> None:
+    """Route a session's HTTP(S) traffic through the shared connection pool"""
+    adapter = get_adapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+def init_session() -> Tuple[Optional[requests.Session], Optional[str]]:
+    """Initialize the shared, authenticated REST session with error handling"""
+    global _session
+    if _session is not None:
+        return _session, None
+
+    credentials, error = load_credentials()
+    if error:
+        return None, error
+
+    session = requests.Session()
+    session.auth = (credentials['email'], credentials['api_token'])
+    session.headers.update({
+        'Accept': 'application/json',
+        'Content-Type': 'application/json'
+    })
+    _mount_pool(session)
+
+    with _lock:
+        if _session is None:
+            _session = session
+    return _session, None
+
+def api_url(path: str) -> str:
+    """Build a REST API URL for the configured server and API version"""
+    server = os.getenv('JIRA_BASE_URL', '').rstrip('/')
+    version = os.getenv('JIRA_API_VERSION', '2')
+    return f"{server}/rest/api/{version}/{path.lstrip('/')}"
+
+def jira_request(method: str, path: str, **kwargs) -> requests.Response:
+    """
+    Send a raw REST request through the pooled session
+    Raises requests.exceptions.RequestException on transport or HTTP errors
+    """
+    session, error = init_session()
+    if error:
+        raise requests.exceptions.RequestException(error)
+
+    kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+    response = session.request(method, api_url(path), **kwargs)
+    response.raise_for_status()
+    return response
+
+def field_params(field_set: str) -> Dict[str, str]:
+    """Build the fields/expand query parameters registered for a command"""
+    fields, expand = FIELD_SETS[field_set]
+    params = {'fields': fields}
+    if expand:
+        params['expand'] = expand
+    return params
+
+def get_issue(jira: 'JIRA', issue_key: str, field_set: str):
+    """Fetch an issue with only the fields and expansions registered for a command"""
+    return jira.issue(issue_key, **field_params(field_set))
+
+def iter_issues(jql: str, field_set: str, page_size: int = SEARCH_PAGE_SIZE,
+                validate_query: Optional[str] = None) -> Iterator[dict]:
+    """
+    Lazily walk every page of a JQL search, yielding raw issue dicts as each
+    page arrives; only one page is held in memory at a time
+    validate_query='warn' turns unknown keys in the JQL into warnings
+    Raises requests.exceptions.RequestException on transport or HTTP errors
+    """
+    start_at = 0
+    while True:
+        params = {'jql': jql, 'startAt': start_at, 'maxResults': page_size}
+        params.update(field_params(field_set))
+        if validate_query:
+            params['validateQuery'] = validate_query
+
+        page = jira_request('GET', 'search', params=params).json()
+        issues = page.get('issues', [])
+        yield from issues
+
+        # Advance by what was returned; the server may cap the page size
+        start_at += len(issues)
+        if not issues or start_at >= page.get('total', 0):
+            return
+
+def _bulk_fetch(keys: List[str], field_set: str) -> Optional[List[dict]]:
+    """
+    Fetch up to BULK_FETCH_SIZE issues with POST issue/bulkfetch
+    Returns: the issues, or None if the server has no bulk fetch endpoint
+    """
+    global _bulk_fetch_supported
+    fields, expand = FIELD_SETS[field_set]
+    body = {'issueIdsOrKeys': keys, 'fields': fields.split(',')}
+    if expand:
+        body['expand'] = expand.split(',')
+
+    try:
+        response = jira_request('POST', 'issue/bulkfetch', json=body)
+    except requests.exceptions.HTTPError as e:
+        # Jira Server/Data Center and older Cloud APIs lack the endpoint
+        if e.response is not None and e.response.status_code in (404, 405):
+            _bulk_fetch_supported = False
+            return None
+        raise
+
+    _bulk_fetch_supported = True
+    return response.json().get('issues', [])
+
+def _key_chunks(keys: List[str], field_set: str) -> List[List[str]]:
+    """Split keys into key-in JQL chunks whose search URL stays under MAX_URL_LENGTH"""
+    base = {'jql': 'key in ()', 'startAt': 0, 'maxResults': SEARCH_PAGE_SIZE, 'validateQuery': 'warn'}
+    base.update(field_params(field_set))
+    base_length = len(api_url('search')) + 1 + len(urlencode(base))
+
+    chunks, chunk, length = [], [], base_length
+    for key in keys:
+        # Each key adds its encoded text plus an encoded ', ' separator
+        key_length = len(urlencode({'': key})) - 1 + len('%2C+')
+        if chunk and (length + key_length > MAX_URL_LENGTH or len(chunk) >= SEARCH_PAGE_SIZE):
+            chunks.append(chunk)
+            chunk, length = [], base_length
+        chunk.append(key)
+        length += key_length
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+def _search_keys(keys: List[str], field_set: str) -> List[dict]:
+    jql = f"key in ({', '.join(keys)})"
+    return list(iter_issues(jql, field_set, validate_query='warn'))
+
+def fetch_issues(issue_keys: List[str], field_set: str, max_workers: int = BULK_WORKERS) -> Dict[str, dict]:
+    """
+    Fetch any number of issues in a few requests: bulk fetch batches where the
+    server supports it, otherwise URL-length-aware key-in JQL chunks, run in
+    parallel either way
+    Returns: {issue_key: raw issue} in input order; unknown keys are omitted
+    Raises requests.exceptions.RequestException on transport or HTTP errors
+    """
+    keys = list(dict.fromkeys(issue_keys))
+    if not keys:
+        return {}
+
+    def run(fetch, chunks):
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            return list(executor.map(lambda chunk: fetch(chunk, field_set), chunks))
+
+    pages = None
+    if _bulk_fetch_supported is not False:
+        batches = [keys[i:i + BULK_FETCH_SIZE] for i in range(0, len(keys), BULK_FETCH_SIZE)]
+        # Probe with the first batch so an unsupported server costs one request
+        first = _bulk_fetch(batches[0], field_set)
+        if first is not None:
+            pages = [first]
+            if len(batches) > 1:
+                pages.extend(run(_bulk_fetch, batches[1:]))
+    if pages is None:
+        pages = run(_search_keys, _key_chunks(keys, field_set))
+
+    found = {issue['key']: issue for page in pages for issue in page}
+    return {key: found[key] for key in keys if key in found}
+
+def init_jira() -> Tuple[Optional['JIRA'], Optional[str]]:
     """Initialize JIRA client with error handling"""
+    global _jira
+    if _jira is not None:
+        return _jira, None
+
     try:
-        load_dotenv()
-        
-        email = os.getenv('JIRA_EMAIL')
-        api_token = os.getenv('JIRA_API_TOKEN')
-        server = os.getenv('JIRA_BASE_URL')
-        
-        if not all([email, api_token, server]):
-            return None, "Missing required environment variables"
-        
+        credentials, error = load_credentials()
+        if error:
+            return None, error
+
+        from jira import JIRA
+
         jira = JIRA(
-            server=server,
-            basic_auth=(email, api_token)
+            server=credentials['server'],
+            basic_auth=(credentials['email'], credentials['api_token']),
+            timeout=REQUEST_TIMEOUT
         )
-        
-        return jira, None
-        
+        _mount_pool(jira._session)
+
+        with _lock:
+            if _jira is None:
+                _jira = jira
+        return _jira, None
+
     except Exception as e:
         return None, f"Failed to initialize JIRA: {str(e)}"
 
-def validate_transition(jira: JIRA, issue_key: str, target_status: str) -> Tuple[bool, Optional[str], Optional[str]]:
+def get_jira() -> 'JIRA':
+    """Get the shared JIRA client, raising if it cannot be initialized"""
+    jira, error = init_jira()
+    if error:
+        raise EnvironmentError(error)
+    return jira
+
+def get_transition_snapshot(jira: 'JIRA', issue_key: str) -> dict:
+    """Fetch an issue's status and its available transitions in a single request"""
+    issue = get_issue(jira, issue_key, 'transition')
+    get_workflow_cache().record(issue.raw)
+    return issue.raw
+
+def find_transition(transitions: List[dict], target_status: str) -> Optional[dict]:
+    """Find the transition named after target_status or leading to it"""
+    target = target_status.lower()
+    return next(
+        (t for t in transitions
+         if t['name'].lower() == target or t.get('to', {}).get('name', '').lower() == target),
+        None
+    )
+
+def resolve_transition(snapshot: dict, target_status: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Validate a transition against an issue snapshot and resolve its ID
+    Returns: (transition_id, error_message, current_status)
+    """
+    issue_key = snapshot['key']
+    current_status = snapshot['fields']['status']['name']
+
+    # Check if already in target status
+    if current_status.lower() == target_status.lower():
+        return None, f"Issue {issue_key} is already in {target_status} status", current_status
+
+    transition = find_transition(snapshot.get('transitions', []), target_status)
+    if not transition:
+        return None, f"No transition to {target_status} available from {current_status}", current_status
+
+    return transition['id'], None, current_status
+
+def validate_transition(jira: 'JIRA', issue_key: str, target_status: str) -> Tuple[bool, Optional[str], Optional[str]]:
     """
     Validate if a transition to target_status is valid and necessary
     Returns: (is_valid, error_message, current_status)
     """
     try:
-        issue = jira.issue(issue_key)
-        current_status = issue.fields.status.name
-        
-        # Check if already in target status
-        if current_status.lower() == target_status.lower():
-            return False, f"Issue {issue_key} is already in {target_status} status", current_status
-        
-        # Get available transitions
-        transitions = jira.transitions(issue)
-        valid_transition = any(
-            t['name'].lower() == target_status.lower() 
-            for t in transitions
-        )
-        
-        if not valid_transition:
-            return False, f"No transition to {target_status} available from {current_status}", current_status
-            
-        return True, None, current_status
-        
+        snapshot = get_transition_snapshot(jira, issue_key)
+        transition_id, error_msg, current_status = resolve_transition(snapshot, target_status)
+        return transition_id is not None, error_msg, current_status
+
     except Exception as e:
         return False, f"Error validating transition: {str(e)}", None
 
-def get_transition_id(jira: JIRA, issue_key: str, target_status: str) -> Optional[str]:
+def get_transition_id(jira: 'JIRA', issue_key: str, target_status: str) -> Optional[str]:
     """Get the ID for a specific transition"""
     try:
-        issue = jira.issue(issue_key)
-        transitions = jira.transitions(issue)
-        
-        transition = next(
-            (t for t in transitions if t['name'].lower() == target_status.lower()),
-            None
-        )
-        
+        snapshot = get_transition_snapshot(jira, issue_key)
+        transition = find_transition(snapshot.get('transitions', []), target_status)
         return transition['id'] if transition else None
-        
+
     except Exception:
         return None
 
-def perform_transition(jira: JIRA, issue_key: str, target_status: str) -> Tuple[bool, Optional[str]]:
+def _cached_transition(issue_key: str, target_status: str, current_status: str,
+                       issue_type: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Resolve a transition from the workflow cache without contacting the server
+    Returns: (transition_id, error_message); both None on a cache miss, which
+    includes a target the cached graph doesn't reach - only the server can
+    say it is unreachable, and discovery refreshes the entry
+    """
+    if current_status.lower() == target_status.lower():
+        return None, f"Issue {issue_key} is already in {target_status} status"
+
+    project = issue_key.split('-')[0]
+    return get_workflow_cache().lookup(project, issue_type, current_status, target_status), None
+
+def perform_transition(jira: 'JIRA', issue_key: str, target_status: str,
+                       current_status: Optional[str] = None,
+                       issue_type: Optional[str] = None) -> Tuple[bool, Optional[str]]:
     """
     Perform status transition with validation
+    Callers that already know the issue's status and type can pass them to
+    skip discovery when the workflow cache knows the transition
     Returns: (success, error_message)
     """
+    # Already loaded: the caller holds a client
+    from jira import JIRAError
+
     try:
-        # Validate transition
-        is_valid, error_msg, current_status = validate_transition(jira, issue_key, target_status)
-        if not is_valid:
-            return False, error_msg
-            
-        # Get transition ID
-        transition_id = get_transition_id(jira, issue_key, target_status)
+        if current_status and issue_type:
+            transition_id, error_msg = _cached_transition(issue_key, target_status, current_status, issue_type)
+            if error_msg:
+                return False, error_msg
+            if transition_id:
+                try:
+                    jira.transition_issue(issue_key, transition_id)
+                    return True, None
+                except JIRAError:
+                    # Stale graph or stale status: forget it and rediscover below
+                    get_workflow_cache().invalidate(issue_key.split('-')[0], issue_type, current_status)
+
+        # Validate and resolve the transition from a single issue snapshot
+        snapshot = get_transition_snapshot(jira, issue_key)
+        transition_id, error_msg, current_status = resolve_transition(snapshot, target_status)
         if not transition_id:
-            return False, f"Could not find transition ID for {target_status}"
-            
+            return False, error_msg
+
         # Perform transition
         jira.transition_issue(issue_key, transition_id)
         return True, None
-        
+
     except Exception as e:
         return False, f"Error performing transition: {str(e)}"
+
+def bulk_transition(jira: 'JIRA', issue_keys: List[str], target_status: str,
+                    comments: Optional[Dict[str, str]] = None,
+                    max_workers: int = BULK_WORKERS) -> List[Tuple[str, bool, Optional[str]]]:
+    """
+    Move many issues to target_status concurrently on a bounded thread pool,
+    adding each issue's comment (if any) after a successful move
+    Returns: [(issue_key, success, error_message)] in input order
+    """
+    comments = comments or {}
+
+    # One batched read of every status and type lets the workflow cache
+    # resolve transitions without a discovery request per issue
+    try:
+        states = fetch_issues(issue_keys, 'transition_state', max_workers)
+    except requests.exceptions.RequestException:
+        states = {}
+
+    def move(issue_key: str) -> Tuple[str, bool, Optional[str]]:
+        fields = states.get(issue_key, {}).get('fields', {})
+        success, error = perform_transition(
+            jira, issue_key, target_status,
+            (fields.get('status') or {}).get('name'),
+            (fields.get('issuetype') or {}).get('name')
+        )
+        if success and comments.get(issue_key):
+            try:
+                jira.add_comment(issue_key, comments[issue_key])
+            except Exception as e:
+                return issue_key, False, f"Moved, but failed to add comment: {str(e)}"
+        return issue_key, success, error
+
+    if not issue_keys:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(issue_keys)))) as executor:
+        return list(executor.map(move, issue_keys))
+
+def get_epics(jira: 'JIRA', project: str) -> Iterator[dict]:
+    """Stream the epics of a project as they are loaded"""
+    jql = f'project = "{project}" AND issuetype = Epic ORDER BY key ASC'
+    for issue in iter_issues(jql, 'epics'):
+        yield {
+            'key': issue['key'],
+            'summary': issue['fields']['summary'],
+            'status': issue['fields']['status']['name']
+        }
+
+def get_project_tasks(jira: 'JIRA', project: str, statuses: List[str]) -> Iterator[dict]:
+    """Stream the tasks of a project in the given statuses as they are loaded"""
+    status_list = ', '.join(f'"{status}"' for status in statuses)
+    jql = f'project = "{project}" AND issuetype != Epic AND status in ({status_list}) ORDER BY key ASC'
+    for issue in iter_issues(jql, 'project_tasks'):
+        fields = issue['fields']
+        yield {
+            'key': issue['key'],
+            'summary': fields['summary'],
+            'status': fields['status']['name'],
+            'priority': (fields.get('priority') or {}).get('name'),
+            'epic_link': (fields.get('parent') or {}).get('key'),
+            'description': fields.get('description')
+        }
+
+def new_idempotency_key() -> str:
+    """Generate a client-side idempotency key for one logical create"""
+    return uuid.uuid4().hex[:16]
+
+def find_by_idempotency_key(project: str, idempotency_key: str) -> Optional[str]:
+    """
+    Find the issue created under an idempotency key
+    Raises requests.exceptions.RequestException on transport or HTTP errors
+    """
+    jql = f'project = "{project}" AND labels = "{IDEMPOTENCY_LABEL_PREFIX}{idempotency_key}"'
+    issue = next(iter_issues(jql, 'keys', page_size=1), None)
+    return issue['key'] if issue else None
+
+def _with_idempotency_label(fields: dict, idempotency_key: str) -> dict:
+    marker = f"{IDEMPOTENCY_LABEL_PREFIX}{idempotency_key}"
+    labels = list(fields.get('labels', []))
+    if marker not in labels:
+        labels.append(marker)
+    return dict(fields, labels=labels)
+
+def create_issue_idempotent(fields: dict, idempotency_key: Optional[str] = None,
+                            retries: int = CREATE_RETRIES,
+                            check_first: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Create an issue, retrying timeouts and server errors with exponential
+    backoff and jitter. The issue is labelled with an idempotency key, and
+    before every re-POST the project is searched for that label, so an
+    attempt the server committed is never created twice. check_first also
+    searches before the first POST, for keys an earlier call may have used.
+    Returns: (issue_key, error_message)
+    """
+    idempotency_key = idempotency_key or new_idempotency_key()
+    fields = _with_idempotency_label(fields, idempotency_key)
+    project = fields['project']['key']
+
+    last_error = None
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(CREATE_BACKOFF * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+        if attempt or check_first:
+            try:
+                existing = find_by_idempotency_key(project, idempotency_key)
+            except requests.exceptions.RequestException as e:
+                # Unknown outcome: never re-POST without a clean search
+                last_error = str(e)
+                continue
+            if existing:
+                return existing, None
+
+        try:
+            response = jira_request('POST', 'issue', json={'fields': fields})
+            return response.json()['key'], None
+        except requests.exceptions.HTTPError as e:
+            # Validation and permission errors won't change on retry
+            if e.response is not None and e.response.status_code < 500:
+                return None, f"Error creating issue: {e.response.text}"
+            last_error = str(e)
+        except requests.exceptions.RequestException as e:
+            last_error = str(e)
+
+    return None, f"Error creating issue after {retries + 1} attempts: {last_error}"
+
+def find_by_idempotency_keys(project: str, idempotency_keys: List[str]) -> Dict[str, str]:
+    """
+    Find which of a batch's idempotency keys already have an issue
+    Returns: {idempotency_key: issue_key}
+    Raises requests.exceptions.RequestException on transport or HTTP errors
+    """
+    markers = {f"{IDEMPOTENCY_LABEL_PREFIX}{key}": key for key in idempotency_keys}
+    labels = list(markers)
+    found = {}
+    # One search per bulk-create-sized chunk keeps the JQL short
+    for start in range(0, len(labels), BULK_CREATE_SIZE):
+        chunk = labels[start:start + BULK_CREATE_SIZE]
+        jql = f"project = \"{project}\" AND labels in ({', '.join(chunk)})"
+        for issue in iter_issues(jql, 'idempotency'):
+            for label in issue['fields'].get('labels', []):
+                if label in markers:
+                    found[markers[label]] = issue['key']
+    return found
+
+def _bulk_create_batch(batch: List[dict], idempotency_keys: List[str],
+                       max_workers: int) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Create one batch with POST issue/bulk, falling back to parallel single creates"""
+    try:
+        response = jira_request('POST', 'issue/bulk', json={'issueUpdates': [{'fields': f} for f in batch]})
+        body = response.json()
+    except requests.exceptions.HTTPError as e:
+        body = None
+        if e.response is not None and e.response.status_code == 400:
+            try:
+                body = e.response.json()
+            except ValueError:
+                pass
+        # Per-item validation errors come back as a 400 when every item failed;
+        # anything else means the endpoint rejected the batch as a whole
+        if not body or not isinstance(body.get('errors'), list) or not body['errors']:
+            status = e.response.status_code if e.response is not None else None
+            # 404/405/413 never reached the create; a 5xx might have
+            return _single_creates(batch, idempotency_keys, max_workers, check_first=status not in (404, 405, 413))
+    except requests.exceptions.RequestException:
+        return _single_creates(batch, idempotency_keys, max_workers, check_first=True)
+
+    results: List[Tuple[Optional[str], Optional[str]]] = [None] * len(batch)
+    for error in body.get('errors', []):
+        details = error.get('elementErrors', {})
+        messages = list(details.get('errorMessages', [])) + [f"{field}: {message}" for field, message in details.get('errors', {}).items()]
+        results[error['failedElementNumber']] = (None, f"Error creating issue: {'; '.join(messages) or error.get('status')}")
+
+    # Created issues are listed in input order, skipping the failed elements
+    created = iter(body.get('issues', []))
+    for index, result in enumerate(results):
+        if result is None:
+            issue = next(created, None)
+            results[index] = (issue['key'], None) if issue else (None, "Error creating issue: missing from bulk response")
+    return results
+
+def _single_creates(batch: List[dict], idempotency_keys: List[str], max_workers: int,
+                    check_first: bool) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Create a batch one issue at a time in parallel, skipping issues a failed bulk call already made"""
+    found = {}
+    search_each = False
+    if check_first:
+        # Give a request that timed out server-side time to commit and be indexed
+        time.sleep(CREATE_BACKOFF * random.uniform(0.5, 1.5))
+        try:
+            found = find_by_idempotency_keys(batch[0]['project']['key'], idempotency_keys)
+        except requests.exceptions.RequestException:
+            # Let each create search for its own key instead
+            search_each = True
+
+    def create(item: Tuple[dict, str]) -> Tuple[Optional[str], Optional[str]]:
+        fields, key = item
+        if key in found:
+            return found[key], None
+        return create_issue_idempotent(fields, key, check_first=search_each)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batch)))) as executor:
+        return list(executor.map(create, zip(batch, idempotency_keys)))
+
+def bulk_create_issues(issues: List[dict], idempotency_keys: Optional[List[str]] = None,
+                       max_workers: int = BULK_WORKERS) -> List[Tuple[Optional[str], Optional[str]]]:
+    """
+    Create many issues with POST issue/bulk, BULK_CREATE_SIZE payloads per
+    request. Per-item errors are mapped back to their inputs; a batch the
+    endpoint rejects (or whose outcome is unknown) is finished with parallel
+    idempotent single creates, so nothing is created twice.
+    Returns: [(issue_key, error_message)] in input order
+    """
+    if not issues:
+        return []
+    idempotency_keys = idempotency_keys or [new_idempotency_key() for _ in issues]
+    labelled = [_with_idempotency_label(fields, key) for fields, key in zip(issues, idempotency_keys)]
+
+    results = []
+    for start in range(0, len(labelled), BULK_CREATE_SIZE):
+        end = start + BULK_CREATE_SIZE
+        results.extend(_bulk_create_batch(labelled[start:end], idempotency_keys[start:end], max_workers))
+    return results
+
+def create_issue_links(links: List[Tuple[str, str]], link_type: str = 'Blocks',
+                       max_workers: int = BULK_WORKERS) -> List[Tuple[str, str, Optional[str]]]:
+    """
+    Create many issue links concurrently; each (inward, outward) pair follows
+    create_issue_link, so for Blocks the inward issue blocks the outward one
+    Returns: [(inward_key, outward_key, error_message)] in input order
+    """
+    def link(pair: Tuple[str, str]) -> Tuple[str, str, Optional[str]]:
+        inward_key, outward_key = pair
+        try:
+            jira_request('POST', 'issueLink', json={
+                'type': {'name': link_type},
+                'inwardIssue': {'key': inward_key},
+                'outwardIssue': {'key': outward_key}
+            })
+            return inward_key, outward_key, None
+        except requests.exceptions.RequestException as e:
+            return inward_key, outward_key, f"Error linking {inward_key} -> {outward_key}: {str(e)}"
+
+    if not links:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(links)))) as executor:
+        return list(executor.map(link, links))
+
+def delete_issue_links(link_ids: List[str], max_workers: int = BULK_WORKERS) -> List[Tuple[str, Optional[str]]]:
+    """
+    Delete many issue links concurrently
+    Returns: [(link_id, error_message)] in input order
+    """
+    def unlink(link_id: str) -> Tuple[str, Optional[str]]:
+        try:
+            jira_request('DELETE', f"issueLink/{link_id}")
+            return link_id, None
+        except requests.exceptions.RequestException as e:
+            return link_id, f"Error removing link {link_id}: {str(e)}"
+
+    if not link_ids:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(link_ids)))) as executor:
+        return list(executor.map(unlink, link_ids))
+
+def task_fields(summary: str, description: str, issue_type: str = 'Task',
+                parent_key: Optional[str] = None, project: Optional[str] = None) -> dict:
+    """Build the create payload for a task (or a sub-task under parent_key)"""
+    fields = {
+        'project': {'key': project or os.getenv('JIRA_PROJECT_KEY', 'TENP')},
+        'summary': summary,
+        'description': description,
+        'issuetype': {'name': issue_type},
+    }
+    if parent_key:
+        fields['parent'] = {'key': parent_key}
+    return fields
+
+def create_task(summary: str, description: str, issue_type: str = 'Task',
+                parent_key: Optional[str] = None, project: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Create a task (or a sub-task under parent_key) in the project, safely retried
+    Returns: (issue_key, error_message)
+    """
+    return create_issue_idempotent(task_fields(summary, description, issue_type, parent_key, project))
+
+def update_issue(jira: 'JIRA', issue_key: str, fields: dict) -> Tuple[bool, Optional[str]]:
+    """
+    Update fields of an issue
+    Returns: (success, error_message)
+    """
+    try:
+        jira_request('PUT', f"issue/{issue_key}", json={'fields': fields})
+        return True, None
+    except requests.exceptions.RequestException as e:
+        return False, f"Error updating {issue_key}: {str(e)}"
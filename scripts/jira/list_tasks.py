@@ -1,71 +1,85 @@
-import os
+import argparse
+import time
 import requests
-from requests.auth import HTTPBasicAuth
-from config import *
+from jira_mirror import JiraMirror, format_age, parse_staleness
+from jira_utils import api_url, iter_issues, jira_request
 
-def list_tasks():
-    base_url = f"{JIRA_BASE_URL}/rest/api/{JIRA_API_VERSION}"
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
-    headers = {'Accept': 'application/json'}
+def print_task(key, summary, issuetype, status, parent):
+    print(f"{key}: {summary}")
+    print(f"Type: {issuetype}")
+    print(f"Status: {status}")
+    if parent:
+        print(f"Parent: {parent}")
+    print("-" * 50)
+
+def list_mirrored_tasks(max_staleness):
+    """List TENP from the local mirror, delta-syncing first if it is older than max_staleness seconds"""
+    mirror = JiraMirror()
+    try:
+        rows, error = mirror.fresh_project('TENP', max_staleness)
+        last_sync = mirror.last_sync('TENP')
+    finally:
+        mirror.close()
+
+    if error:
+        print(f"Warning: could not sync with Jira ({error})")
+    if last_sync is not None:
+        print(f"Served from local mirror, synced {format_age(time.time() - last_sync)} ago")
+
+    print(f"\nAll Tasks in TENP Project:")
+    print("=" * 40)
+    for row in rows:
+        print_task(row['key'], row['summary'], row['issuetype'], row['status'], row['parent'])
+
+    if not rows:
+        print("No issues found.")
+
+def list_tasks(max_staleness=None):
+    if max_staleness is not None:
+        list_mirrored_tasks(max_staleness)
+        return
 
     try:
         # First verify authentication
-        response = requests.get(
-            f"{base_url}/myself",
-            auth=auth,
-            headers=headers
-        )
-        response.raise_for_status()
+        response = jira_request('GET', 'myself')
         print("Successfully authenticated as:", response.json()['displayName'])
 
         # Get all issues in the TENP project
-        search_url = f"{base_url}/search"
+        search_url = api_url('search')
         jql = f'project = "TENP" ORDER BY key ASC'
         
-        response = requests.get(
-            search_url,
-            auth=auth,
-            headers=headers,
-            params={
-                'jql': jql,
-                'fields': 'summary,status,issuetype,parent',
-                'maxResults': 100
-            }
-        )
-        response.raise_for_status()
-        data = response.json()
-        
-        if 'issues' not in data:
-            print(f"No issues found. Response: {data}")
-            return
-            
-        issues = data['issues']
-        
+        # Issues are printed page by page as they stream in
         print(f"\nAll Tasks in TENP Project:")
         print("=" * 40)
-        for issue in issues:
+        count = 0
+        for issue in iter_issues(jql, 'list_tasks'):
+            count += 1
             key = issue['key']
             fields = issue['fields']
             summary = fields['summary']
             status = fields['status']['name']
             issuetype = fields['issuetype']['name']
-            parent = fields.get('parent', {}).get('key', 'No parent')
+            parent = fields.get('parent', {}).get('key')
             
-            print(f"{key}: {summary}")
-            print(f"Type: {issuetype}")
-            print(f"Status: {status}")
-            if parent != 'No parent':
-                print(f"Parent: {parent}")
-            print("-" * 50)
+            print_task(key, summary, issuetype, status, parent)
+        
+        if not count:
+            print("No issues found.")
 
     except requests.exceptions.RequestException as e:
         print(f"Error: {str(e)}")
         if hasattr(e, 'response') and e.response is not None:
             print(f"Response content: {e.response.text}")
             print("\nDebug Information:")
-            print(f"URL: {search_url if 'search_url' in locals() else base_url}")
+            print(f"URL: {search_url if 'search_url' in locals() else api_url('myself')}")
             print(f"JQL: {jql if 'jql' in locals() else 'N/A'}")
-            print(f"Headers: {headers}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='List all tasks in the TENP project')
+    parser.add_argument('--max-staleness', type=parse_staleness,
+                        help='Answer from the local mirror if synced within this budget (e.g. 5m)')
+    args = parser.parse_args(argv)
+    list_tasks(args.max_staleness)
 
 if __name__ == "__main__":
-    list_tasks()
+    main()
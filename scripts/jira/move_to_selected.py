@@ -1,74 +1,34 @@
-import os
+import argparse
 import requests
-from requests.auth import HTTPBasicAuth
-from config import *
-
-def get_transition_id(auth, headers, issue_key):
-    base_url = f"{JIRA_BASE_URL}/rest/api/{JIRA_API_VERSION}"
-    transitions_url = f"{base_url}/issue/{issue_key}/transitions"
-    
-    response = requests.get(
-        transitions_url,
-        auth=auth,
-        headers=headers
-    )
-    response.raise_for_status()
-    
-    transitions = response.json()['transitions']
-    # Look for any transition that moves to "Selected for Development"
-    selected_transition = next(
-        (t for t in transitions if 'Selected for Development' in t['name']),
-        None
-    )
-    
-    if not selected_transition:
-        print(f"Available transitions for {issue_key}:", [t['name'] for t in transitions])
-        return None
-        
-    return selected_transition['id']
+from jira_utils import bulk_transition, init_jira, jira_request
 
 def move_to_selected(task_keys):
-    base_url = f"{JIRA_BASE_URL}/rest/api/{JIRA_API_VERSION}"
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
-    headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+    jira, error = init_jira()
+    if error:
+        print(f"Error: {error}")
+        return
 
     try:
         # First verify authentication
-        response = requests.get(
-            f"{base_url}/myself",
-            auth=auth,
-            headers=headers
-        )
-        response.raise_for_status()
+        response = jira_request('GET', 'myself')
         print("Successfully authenticated as:", response.json()['displayName'])
 
-        # Process each task
-        for key in task_keys:
-            print(f"\nProcessing {key}...")
-            
-            # Get the transition ID
-            transition_id = get_transition_id(auth, headers, key)
-            if not transition_id:
-                print(f"Could not find 'Selected for Development' transition for {key}")
-                continue
-            
-            # Move the issue
-            transitions_url = f"{base_url}/issue/{key}/transitions"
-            response = requests.post(
-                transitions_url,
-                auth=auth,
-                headers=headers,
-                json={'transition': {'id': transition_id}}
-            )
-            response.raise_for_status()
-            print(f"Successfully moved {key} to Selected for Development")
+        # Move all tasks concurrently; transition discovery goes through the workflow cache
+        for key, success, error in bulk_transition(jira, task_keys, 'Selected for Development'):
+            if success:
+                print(f"Successfully moved {key} to Selected for Development")
+            else:
+                print(f"Could not move {key} to Selected for Development: {error}")
 
     except requests.exceptions.RequestException as e:
         print(f"Error: {str(e)}")
         if hasattr(e, 'response') and e.response is not None:
             print(f"Response content: {e.response.text}")
 
-if __name__ == "__main__":
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Move the testing tasks to Selected for Development')
+    parser.parse_args(argv)
+
     # Previously selected tasks
     previously_selected = [
         # Core API Framework tasks
@@ -103,3 +63,6 @@ if __name__ == "__main__":
     
     # Move only the new testing tasks
     move_to_selected(testing_tasks)
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,12 @@
 #!/usr/bin/env python3
+import argparse
 import sys
 from jira_utils import init_jira, perform_transition
 
-def main():
-    # Check command line arguments
-    if len(sys.argv) != 2:
-        print("Usage: python move_to_testing.py <issue-key>")
-        sys.exit(1)
-    
-    issue_key = sys.argv[1]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Move an issue to Testing')
+    parser.add_argument('issue_key', help='Issue key (e.g. TENP-123)')
+    issue_key = parser.parse_args(argv).issue_key
     
     # Initialize Jira
     jira, error = init_jira()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+from requests.adapters import HTTPAdapter
+
+try:
+    import fcntl
+except ImportError:
+    # No flock (Windows): each process keeps its own budget
+    fcntl = None
+
+# Sustained requests per second and burst size of the token bucket, shared
+# by every Jira script running on the machine against the same server
+RATE_LIMIT = float(os.getenv('JIRA_RATE_LIMIT', '10'))
+RATE_BURST = float(os.getenv('JIRA_RATE_BURST', '20'))
+# Set to 0 to give each process its own budget
+RATE_SHARED = os.getenv('JIRA_RATE_SHARED', '1') != '0'
+# Directory holding the shared budget files, one per server
+RATE_STATE_DIR = Path(os.getenv('JIRA_RATE_STATE_DIR', tempfile.gettempdir()))
+# AIMD window of requests in flight: starts at INITIAL, stays within MIN..max_concurrency
+INITIAL_CONCURRENCY = int(os.getenv('JIRA_INITIAL_CONCURRENCY', '4'))
+MIN_CONCURRENCY = int(os.getenv('JIRA_MIN_CONCURRENCY', '1'))
+# Responses slower than this (seconds) count as congestion
+LATENCY_TARGET = float(os.getenv('JIRA_LATENCY_TARGET', '2'))
+# Times a throttled request is retried before the 429/503 is handed back
+THROTTLE_RETRIES = int(os.getenv('JIRA_THROTTLE_RETRIES', '5'))
+# Exponential backoff for throttled responses without Retry-After
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+# Longest Retry-After honoured; the pause stops every script on the machine,
+# so a longer one is capped and its response handed back instead of waited out
+RETRY_AFTER_MAX = float(os.getenv('JIRA_RETRY_AFTER_MAX', str(BACKOFF_MAX)))
+
+THROTTLE_STATUSES = (429, 503)
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds from now"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given retry attempt"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+class LocalRateBudget:
+    """In-process token bucket with a Retry-After pause"""
+
+    def __init__(self, rate: float = RATE_LIMIT, burst: float = RATE_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.blocked_until = 0.0
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> float:
+        """
+        Take one token if the budget allows a request now
+        Returns: 0 when a token was taken, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            if self.blocked_until > now:
+                return self.blocked_until - now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def block(self, pause: float) -> None:
+        """Pause every request for pause seconds and drain the bucket"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + pause)
+            # Don't let a full bucket burst straight back into the limit
+            self.tokens = min(self.tokens, 0.0)
+
+class SharedRateBudget:
+    """
+    Token bucket with a Retry-After pause kept in a state file, so every
+    process on the machine draws from one budget; updates are serialized
+    with flock. Times are wall-clock since they cross processes.
+    """
+
+    def __init__(self, path: Path, rate: float = RATE_LIMIT, burst: float = RATE_BURST):
+        self.path = Path(path)
+        self.rate = rate
+        self.burst = burst
+        # flock doesn't exclude threads sharing one descriptor
+        self._lock = threading.Lock()
+        self._fd = None
+
+    def _update(self, change):
+        """Apply change(state, now) to the state file under an exclusive lock"""
+        with self._lock:
+            if self._fd is None:
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                try:
+                    state = json.loads(os.read(self._fd, 4096) or b'{}')
+                except ValueError:
+                    state = {}
+                now = time.time()
+                tokens = state.get('tokens', self.burst)
+                refilled_at = state.get('refilled_at', now)
+                state['tokens'] = min(self.burst, tokens + max(0.0, now - refilled_at) * self.rate)
+                state['refilled_at'] = now
+                state.setdefault('blocked_until', 0.0)
+
+                result = change(state, now)
+
+                data = json.dumps(state).encode()
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, data)
+                os.ftruncate(self._fd, len(data))
+                return result
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def take(self) -> float:
+        """
+        Take one token if the shared budget allows a request now
+        Returns: 0 when a token was taken, otherwise seconds to wait before retrying
+        """
+        def change(state, now):
+            if state['blocked_until'] > now:
+                return state['blocked_until'] - now
+            if state['tokens'] >= 1:
+                state['tokens'] -= 1
+                return 0.0
+            return (1 - state['tokens']) / self.rate
+
+        return self._update(change)
+
+    def block(self, pause: float) -> None:
+        """Pause every process's requests for pause seconds and drain the bucket"""
+        def change(state, now):
+            state['blocked_until'] = max(state['blocked_until'], now + pause)
+            state['tokens'] = min(state['tokens'], 0.0)
+
+        self._update(change)
+
+def get_rate_budget(server: str):
+    """
+    Get the request budget for a Jira server: shared machine-wide through a
+    state file where flock is available, otherwise per process
+    """
+    if not RATE_SHARED or fcntl is None:
+        return LocalRateBudget()
+    host = re.sub(r'[^A-Za-z0-9.-]+', '_', re.sub(r'^\w+://', '', server).strip('/')) or 'default'
+    return SharedRateBudget(RATE_STATE_DIR / f"jira-rate-budget-{host}.json")
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket capping the request rate, plus an AIMD window capping
+    requests in flight: the window grows by about one per window of healthy
+    responses and halves on throttling or slow responses. A Retry-After
+    pauses every caller sharing the budget.
+    """
+
+    def __init__(self, budget=None, max_concurrency: int = 16,
+                 min_concurrency: int = MIN_CONCURRENCY,
+                 initial_concurrency: int = INITIAL_CONCURRENCY,
+                 latency_target: float = LATENCY_TARGET):
+        self.budget = budget or LocalRateBudget()
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.latency_target = latency_target
+        self.limit = float(min(self.max_concurrency, max(self.min_concurrency, initial_concurrency)))
+        self.in_flight = 0
+        # Responses to requests sent before the last decrease don't shrink the window again
+        self._decreased_at = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> float:
+        """
+        Block until a window slot and a budget token are free and no
+        Retry-After pause is active
+        Returns: the send time to pass back to release()
+        """
+        with self._cond:
+            while True:
+                if self.in_flight >= int(self.limit):
+                    # Woken by release()
+                    self._cond.wait()
+                    continue
+                wait = self.budget.take()
+                if wait <= 0:
+                    self.in_flight += 1
+                    return time.monotonic()
+                self._cond.wait(wait)
+
+    def release(self, sent_at: float, throttled: bool = False, pause: float = 0.0,
+                failed: bool = False) -> None:
+        """
+        Record a finished request and adapt the window to how it went; a
+        transport failure (timeout, reset) counts as congestion
+        """
+        with self._cond:
+            now = time.monotonic()
+            self.in_flight -= 1
+            if throttled:
+                self.budget.block(pause)
+                self._decrease(sent_at, now)
+            elif failed or now - sent_at > self.latency_target:
+                self._decrease(sent_at, now)
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def _decrease(self, sent_at: float, now: float) -> None:
+        if sent_at >= self._decreased_at:
+            self.limit = max(self.min_concurrency, self.limit / 2)
+            self._decreased_at = now
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that sends every request through an AdaptiveRateLimiter and
+    retries 429s (and 503s that are safe to repeat) after the server's
+    Retry-After, or an exponential backoff when it gives none
+    """
+
+    def __init__(self, limiter: AdaptiveRateLimiter, throttle_retries: int = THROTTLE_RETRIES, **kwargs):
+        self.limiter = limiter
+        self.throttle_retries = throttle_retries
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        attempt = 0
+        while True:
+            sent_at = self.limiter.acquire()
+            try:
+                response = super().send(request, **kwargs)
+            except Exception:
+                self.limiter.release(sent_at, failed=True)
+                raise
+
+            if response.status_code not in THROTTLE_STATUSES:
+                self.limiter.release(sent_at)
+                return response
+
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            pause = retry_after if retry_after is not None else backoff_delay(attempt)
+            self.limiter.release(sent_at, throttled=True, pause=min(pause, RETRY_AFTER_MAX))
+
+            # A 429 was never processed; a bare 503 on a POST might have been
+            retryable = (response.status_code == 429 or retry_after is not None
+                         or request.method in IDEMPOTENT_METHODS)
+            if attempt >= self.throttle_retries or not retryable or pause > RETRY_AFTER_MAX:
+                return response
+
+            # Drain the body so the keep-alive connection goes back to the pool
+            response.content
+            response.close()
+            attempt += 1
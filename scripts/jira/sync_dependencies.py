@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+import requests
+from dependency_graph import DependencyGraph
+from jira_utils import BULK_WORKERS, create_issue_links, delete_issue_links, fetch_issues
+from task_plan import PlanError, is_issue_key, load_plan
+
+def read_edges(path) -> List[Tuple[str, str]]:
+    """
+    Read (blocker, blocked) edges from a plan file (.json/.yaml/.yml, whose
+    blocks/depends_on must name issue keys) or a text file with one
+    "BLOCKER BLOCKED" pair per line; # starts a comment
+    """
+    path = Path(path)
+    if path.suffix in ('.json', '.yaml', '.yml'):
+        edges = load_plan(path).links()
+    else:
+        edges = []
+        with open(path, 'r') as f:
+            for number, line in enumerate(f, 1):
+                fields = line.split('#', 1)[0].split()
+                if not fields:
+                    continue
+                if len(fields) != 2:
+                    raise PlanError(f"{path.name}:{number}: expected 'BLOCKER BLOCKED'")
+                edges.append((fields[0], fields[1]))
+
+    for blocker, blocked in edges:
+        for ref in (blocker, blocked):
+            if not is_issue_key(ref):
+                raise PlanError(f"'{ref}' is not an issue key")
+    return list(dict.fromkeys(edges))
+
+def diff_dependencies(edges: List[Tuple[str, str]], max_workers: int = BULK_WORKERS
+                      ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str, Optional[str]]], Optional[str]]:
+    """
+    Read the Blocks links of every issue in an edge list in one batched fetch
+    and compare them with the list. Stale links are those between two issues
+    of the list that the list doesn't contain; links to other issues are
+    never touched.
+    Returns: (missing_edges, stale_links as (blocker, blocked, link_id), error_message)
+    """
+    issue_keys = list(dict.fromkeys(key for edge in edges for key in edge))
+    try:
+        issues = fetch_issues(issue_keys, 'issue_links', max_workers)
+    except requests.exceptions.RequestException as e:
+        return [], [], f"Error reading existing links: {str(e)}"
+
+    unknown = [key for key in issue_keys if key not in issues]
+    if unknown:
+        return [], [], f"Issues not found: {', '.join(unknown)}"
+
+    graph = DependencyGraph()
+    graph.add_issues(issues.values())
+
+    wanted = set(edges)
+    involved = set(issue_keys)
+    missing = [edge for edge in edges if not graph.has_edge(*edge)]
+    stale = [
+        (blocker, blocked, graph.link_ids[(blocker, blocked)])
+        for blocker, blocked in graph.edges()
+        if blocker in involved and blocked in involved and (blocker, blocked) not in wanted
+    ]
+    return missing, stale, None
+
+def sync_dependencies(edges: List[Tuple[str, str]], prune: bool = False, show_only: bool = False,
+                      max_workers: int = BULK_WORKERS) -> bool:
+    """
+    Create the Blocks links of an edge list that don't exist yet, and with
+    prune remove stale ones; both concurrently
+    Returns True if nothing failed
+    """
+    missing, stale, error = diff_dependencies(edges, max_workers)
+    if error:
+        print(f"\nError: {error}")
+        return False
+    if not prune:
+        stale = []
+
+    if not missing and not stale:
+        print(f"\nNo changes: all {len(edges)} dependencies are in place")
+        return True
+
+    if missing:
+        print(f"\nLink ({len(missing)}):")
+        for blocker, blocked in missing:
+            print(f"  + {blocker} blocks {blocked}")
+    if stale:
+        print(f"\nUnlink ({len(stale)}):")
+        for blocker, blocked, _ in stale:
+            print(f"  - {blocker} blocks {blocked}")
+    if show_only:
+        return True
+
+    print()
+    errors = [error for _, _, error in create_issue_links(missing, 'Blocks', max_workers) if error]
+    errors.extend(error for _, error in delete_issue_links([link_id for _, _, link_id in stale], max_workers) if error)
+    for error in errors:
+        print(f"Error: {error}")
+    print(f"Linked {len(missing)}, unlinked {len(stale)}, {len(errors)} failed")
+    return not errors
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Create the missing Blocks links of an edge list')
+    parser.add_argument('edges', help="Plan file, or text file of 'BLOCKER BLOCKED' lines")
+    parser.add_argument('--prune', action='store_true',
+                        help='Also remove Blocks links between listed issues that the list leaves out')
+    parser.add_argument('--dry-run', action='store_true', help='Print the changes without applying them')
+    parser.add_argument('--workers', type=int, default=BULK_WORKERS, help='Maximum concurrent requests')
+    args = parser.parse_args(argv)
+
+    try:
+        edges = read_edges(args.edges)
+    except (OSError, ValueError) as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
+
+    if not sync_dependencies(edges, args.prune, args.dry_run, args.workers):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import requests
+from dependency_graph import DependencyGraph
+from jira_utils import (BULK_WORKERS, bulk_create_issues, create_issue_links,
+                        fetch_issues, find_by_idempotency_keys, init_jira,
+                        perform_transition, task_fields, update_issue)
+
+try:
+    import yaml
+except ImportError:
+    # JSON plans work without PyYAML
+    yaml = None
+
+PLANS_DIR = Path(__file__).parent / 'plans'
+
+# Real Jira keys; anything else in a reference is a local plan ID
+ISSUE_KEY_PATTERN = re.compile(r'^[A-Z][A-Z0-9]+-\d+$')
+# ${started} and ${key:<local-id>} in summaries and descriptions
+VARIABLE_PATTERN = re.compile(r'\$\{(started|key:([^}]+))\}')
+# What ${started} renders to, so text applied by an earlier run still matches
+STARTED_PATTERN = r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}'
+# Fields a plan entry may set on its issue
+PLAN_FIELDS = ('summary', 'description')
+
+class PlanError(ValueError):
+    """A plan file that cannot be compiled"""
+
+def is_issue_key(ref: str) -> bool:
+    return bool(ISSUE_KEY_PATTERN.match(ref))
+
+class TaskPlan:
+    """
+    The desired state of a set of issues. Entries with an id are issues the
+    plan creates, named by local IDs; entries with a key are existing issues.
+    Either may set summary/description, a status, comments that must be
+    present, and blocks/depends_on edges to local IDs or issue keys:
+
+        project: TENP
+        issues:
+          - id: logger
+            parent: TENP-78
+            summary: "[Subtask] Configure Logger"
+            blocks: [request-logging]
+          - key: TENP-291
+            status: Done
+            comments: ["# Work Log ..."]
+    """
+
+    def __init__(self, name: str, project: str, issues: List[dict]):
+        self.name = name
+        self.project = project
+        # Issues to create, and existing issues the plan only updates
+        self.issues = [issue for issue in issues if 'key' not in issue]
+        self.existing = [issue for issue in issues if 'key' in issue]
+        self.by_id: Dict[str, dict] = {}
+        self.waves: List[List[dict]] = []
+        self.compile()
+
+    def entries(self) -> List[dict]:
+        return self.issues + self.existing
+
+    def compile(self) -> None:
+        """Validate references and group issues into waves that can be created together"""
+        self.by_id = {}
+        for issue in self.issues:
+            local_id = issue.get('id')
+            if not local_id:
+                raise PlanError(f"Issue without an id or key: {issue.get('summary', issue)}")
+            if is_issue_key(local_id):
+                raise PlanError(f"Local id '{local_id}' looks like an issue key")
+            if local_id in self.by_id:
+                raise PlanError(f"Duplicate id '{local_id}'")
+            if not issue.get('summary'):
+                raise PlanError(f"Issue '{local_id}' has no summary")
+            self.by_id[local_id] = issue
+
+        seen = set()
+        for issue in self.existing:
+            if 'id' in issue or 'parent' in issue:
+                raise PlanError(f"Existing issue {issue['key']} can't have an id or parent")
+            if not is_issue_key(issue['key']):
+                raise PlanError(f"'{issue['key']}' is not an issue key")
+            if issue['key'] in seen:
+                raise PlanError(f"Duplicate key '{issue['key']}'")
+            seen.add(issue['key'])
+
+        for issue in self.entries():
+            for ref in self._refs(issue):
+                if not is_issue_key(ref) and ref not in self.by_id:
+                    raise PlanError(f"Issue '{plan_ref(issue)}' refers to unknown id '{ref}'")
+
+        # An issue needs the keys of its parent and of any issue its text names
+        levels: Dict[str, int] = {}
+
+        def level(local_id: str, path: Tuple[str, ...]) -> int:
+            if local_id in path:
+                raise PlanError(f"Creation cycle: {' -> '.join(path + (local_id,))}")
+            if local_id not in levels:
+                needs = [ref for ref in self.creation_refs(self.by_id[local_id]) if not is_issue_key(ref)]
+                levels[local_id] = 1 + max((level(ref, path + (local_id,)) for ref in needs), default=-1)
+            return levels[local_id]
+
+        for issue in self.issues:
+            level(issue['id'], ())
+
+        self.waves = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+        for issue in self.issues:
+            self.waves[levels[issue['id']]].append(issue)
+
+        cycle = self._blocking_cycle()
+        if cycle:
+            raise PlanError(f"Dependency cycle: {' -> '.join(cycle)}")
+
+    def creation_refs(self, issue: dict) -> List[str]:
+        """References whose keys must exist before the issue can be created"""
+        refs = [issue['parent']] if issue.get('parent') else []
+        for text in (issue.get('summary', ''), issue.get('description', '')):
+            refs.extend(match.group(2) for match in VARIABLE_PATTERN.finditer(text) if match.group(2))
+        return refs
+
+    def _refs(self, issue: dict) -> List[str]:
+        refs = self.creation_refs(issue) + list(issue.get('blocks', [])) + list(issue.get('depends_on', []))
+        for comment in issue.get('comments', []):
+            refs.extend(match.group(2) for match in VARIABLE_PATTERN.finditer(comment) if match.group(2))
+        return refs
+
+    def links(self) -> List[Tuple[str, str]]:
+        """Blocks edges as (blocker, blocked) references, without duplicates"""
+        edges = []
+        for issue in self.entries():
+            ref = plan_ref(issue)
+            edges.extend((ref, blocked) for blocked in issue.get('blocks', []))
+            edges.extend((blocker, ref) for blocker in issue.get('depends_on', []))
+        return list(dict.fromkeys(edges))
+
+    def _blocking_cycle(self) -> Optional[List[str]]:
+        graph: Dict[str, List[str]] = {}
+        for blocker, blocked in self.links():
+            graph.setdefault(blocker, []).append(blocked)
+
+        visiting, done = [], set()
+
+        def visit(node: str) -> Optional[List[str]]:
+            if node in visiting:
+                return visiting[visiting.index(node):] + [node]
+            if node in done:
+                return None
+            visiting.append(node)
+            for blocked in graph.get(node, []):
+                cycle = visit(blocked)
+                if cycle:
+                    return cycle
+            visiting.pop()
+            done.add(node)
+            return None
+
+        for node in list(graph):
+            cycle = visit(node)
+            if cycle:
+                return cycle
+        return None
+
+    def idempotency_key(self, local_id: str) -> str:
+        """Stable per plan and local ID, so re-applying a plan finds what it already created"""
+        return hashlib.sha1(f"{self.project}:{self.name}:{local_id}".encode()).hexdigest()[:16]
+
+def plan_ref(issue: dict) -> str:
+    """The reference naming a plan entry: its local id, or its key for an existing issue"""
+    return issue.get('id') or issue['key']
+
+def load_plan(path) -> TaskPlan:
+    """
+    Load a JSON or YAML plan file
+    Raises OSError if it can't be read, PlanError if it isn't a valid plan
+    """
+    path = Path(path)
+    with open(path, 'r') as f:
+        if path.suffix in ('.yaml', '.yml'):
+            if yaml is None:
+                raise PlanError(f"PyYAML is required for {path.name} (pip install PyYAML)")
+            try:
+                data = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise PlanError(f"{path.name} is not valid YAML: {str(e)}")
+        else:
+            try:
+                data = json.load(f)
+            except ValueError as e:
+                raise PlanError(f"{path.name} is not valid JSON: {str(e)}")
+    if not isinstance(data, dict):
+        raise PlanError(f"{path.name} must be a mapping with name, project and issues")
+    issues = data.get('issues', [])
+    if not isinstance(issues, list) or not all(isinstance(issue, dict) for issue in issues):
+        raise PlanError(f"{path.name}: issues must be a list of mappings")
+    return TaskPlan(data.get('name', path.stem), data.get('project', 'TENP'), issues)
+
+def resolve(ref: str, keys: Dict[str, str]) -> Optional[str]:
+    """Resolve a reference to a real key; None if its local issue wasn't created"""
+    return ref if is_issue_key(ref) else keys.get(ref)
+
+def render(text: str, keys: Dict[str, str], started: str) -> str:
+    def substitute(match):
+        return started if match.group(1) == 'started' else keys[match.group(2)]
+    return VARIABLE_PATTERN.sub(substitute, text)
+
+def normalize_text(text) -> str:
+    return (text or '').replace('\r\n', '\n').strip()
+
+def text_matches(template: str, value, keys: Dict[str, str]) -> Optional[bool]:
+    """
+    Check whether Jira text is what a plan template renders to, with
+    ${started} matching any timestamp
+    Returns: None if the template names an issue that doesn't exist yet
+    """
+    if not isinstance(value, (str, type(None))):
+        # Rich-text (ADF) bodies can't be compared; treat them as matching
+        return True
+    template = normalize_text(template)
+    pattern, end = [], 0
+    for match in VARIABLE_PATTERN.finditer(template):
+        pattern.append(re.escape(template[end:match.start()]))
+        if match.group(1) == 'started':
+            pattern.append(STARTED_PATTERN)
+        elif match.group(2) in keys:
+            pattern.append(re.escape(keys[match.group(2)]))
+        else:
+            return None
+        end = match.end()
+    pattern.append(re.escape(template[end:]))
+    return re.fullmatch(''.join(pattern), normalize_text(value)) is not None
+
+class PlanDiff:
+    """
+    The changes that bring Jira in line with a plan, naming issues by plan
+    reference. keys maps the references whose issues already exist.
+    """
+
+    def __init__(self):
+        self.keys: Dict[str, str] = {}
+        # issue_key: (status, issue_type) as read, for cached transitions
+        self.states: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self.creates: List[str] = []
+        self.updates: List[Tuple[str, List[str]]] = []
+        self.transitions: List[Tuple[str, Optional[str], str]] = []
+        self.comments: List[Tuple[str, str]] = []
+        self.links: List[Tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return (len(self.creates) + len(self.updates) + len(self.transitions)
+                + len(self.comments) + len(self.links))
+
+def diff_plan(plan: TaskPlan, max_workers: int = BULK_WORKERS) -> Tuple[Optional[PlanDiff], Optional[str]]:
+    """
+    Read the current state of every issue a plan names (one label search and
+    one batched fetch) and work out the creates, field updates, transitions,
+    comments and links still missing
+    Returns: (diff, error_message)
+    """
+    diff = PlanDiff()
+    idempotency_keys = {issue['id']: plan.idempotency_key(issue['id']) for issue in plan.issues}
+    try:
+        existing = find_by_idempotency_keys(plan.project, list(idempotency_keys.values()))
+        diff.keys = {local_id: existing[key] for local_id, key in idempotency_keys.items() if key in existing}
+        diff.keys.update((issue['key'], issue['key']) for issue in plan.existing)
+        issues = fetch_issues(list(dict.fromkeys(diff.keys.values())), 'plan_state', max_workers)
+    except requests.exceptions.RequestException as e:
+        return None, f"Error reading current state: {str(e)}"
+
+    for issue in plan.existing:
+        if issue['key'] not in issues:
+            return None, f"Issue {issue['key']} not found"
+    # A label match the fetch didn't return (deleted since the search was
+    # indexed, or not visible) no longer stands in for the planned issue
+    diff.keys = {ref: key for ref, key in diff.keys.items() if key in issues}
+
+    for issue in plan.entries():
+        ref = plan_ref(issue)
+        key = diff.keys.get(ref)
+        if key is None:
+            diff.creates.append(ref)
+            status, comments = None, []
+        else:
+            fields = issues[key]['fields']
+            status = (fields.get('status') or {}).get('name')
+            diff.states[key] = (status, (fields.get('issuetype') or {}).get('name'))
+            comments = [comment.get('body') for comment in (fields.get('comment') or {}).get('comments', [])]
+            changed = [name for name in PLAN_FIELDS
+                       if name in issue and not text_matches(issue[name], fields.get(name), diff.keys)]
+            if changed:
+                diff.updates.append((ref, changed))
+
+        if issue.get('status') and (status or '').lower() != issue['status'].lower():
+            diff.transitions.append((ref, status, issue['status']))
+        for comment in issue.get('comments', []):
+            if not any(text_matches(comment, body, diff.keys) for body in comments):
+                diff.comments.append((ref, comment))
+
+    present = DependencyGraph()
+    present.add_issues(issues.values())
+    for blocker, blocked in plan.links():
+        if not present.has_edge(resolve(blocker, diff.keys), resolve(blocked, diff.keys)):
+            diff.links.append((blocker, blocked))
+
+    return diff, None
+
+def apply_diff(plan: TaskPlan, diff: PlanDiff, max_workers: int = BULK_WORKERS) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Make only the changes in a diff: create issues wave by wave (each wave in
+    bulk), update, transition and comment on issues concurrently, then create
+    links in one concurrent pass
+    Returns: ({reference: issue_key}, error_messages)
+    """
+    started = datetime.now().strftime('%Y-%m-%d %H:%M')
+    errors: List[str] = []
+    keys = dict(diff.keys)
+
+    creates = set(diff.creates)
+    for wave in plan.waves:
+        pending, payloads = [], []
+        for issue in wave:
+            if issue['id'] not in creates:
+                continue
+            missing = [ref for ref in plan.creation_refs(issue) if not resolve(ref, keys)]
+            if missing:
+                errors.append(f"Skipped '{issue['id']}': {', '.join(missing)} not created")
+                continue
+            parent = resolve(issue['parent'], keys) if issue.get('parent') else None
+            fields = task_fields(
+                render(issue['summary'], keys, started),
+                render(issue.get('description', ''), keys, started),
+                issue.get('type', 'Sub-task' if parent else 'Task'),
+                parent,
+                plan.project
+            )
+            if issue.get('labels'):
+                fields['labels'] = list(issue['labels'])
+            pending.append(issue['id'])
+            payloads.append(fields)
+
+        results = bulk_create_issues(payloads, [plan.idempotency_key(local_id) for local_id in pending], max_workers)
+        for local_id, (issue_key, error) in zip(pending, results):
+            if error:
+                errors.append(f"Failed to create '{local_id}': {error}")
+            else:
+                keys[local_id] = issue_key
+
+    # New issues start in their workflow's initial status, which may already be the target
+    states = dict(diff.states)
+    new_keys = [keys[ref] for ref, _, _ in diff.transitions if ref in creates and ref in keys]
+    if new_keys:
+        try:
+            for issue_key, issue in fetch_issues(new_keys, 'transition_state', max_workers).items():
+                fields = issue['fields']
+                states[issue_key] = ((fields.get('status') or {}).get('name'),
+                                     (fields.get('issuetype') or {}).get('name'))
+        except requests.exceptions.RequestException:
+            # perform_transition discovers the status itself
+            pass
+
+    # Group each issue's changes so its transition lands before its comments
+    changes: Dict[str, List[Tuple[str, object]]] = {}
+    for ref, names in diff.updates:
+        changes.setdefault(ref, []).append(('update', names))
+    for ref, _, target in diff.transitions:
+        changes.setdefault(ref, []).append(('transition', target))
+    for ref, body in diff.comments:
+        changes.setdefault(ref, []).append(('comment', body))
+
+    jira = None
+    if changes:
+        jira, error = init_jira()
+        if error:
+            errors.append(error)
+            changes = {}
+
+    entries = {plan_ref(issue): issue for issue in plan.entries()}
+
+    def change(item: Tuple[str, List[Tuple[str, object]]]) -> List[str]:
+        ref, operations = item
+        issue_key = resolve(ref, keys)
+        if not issue_key:
+            return [f"Skipped changes to '{ref}': issue not created"]
+
+        problems = []
+        for operation, value in operations:
+            try:
+                if operation == 'update':
+                    fields = {name: render(entries[ref][name], keys, started) for name in value}
+                    _, error = update_issue(jira, issue_key, fields)
+                elif operation == 'transition':
+                    status, issue_type = states.get(issue_key, (None, None))
+                    if status and status.lower() == value.lower():
+                        continue
+                    _, error = perform_transition(jira, issue_key, value, status, issue_type)
+                else:
+                    jira.add_comment(issue_key, render(value, keys, started))
+                    error = None
+            except KeyError as e:
+                error = f"Skipped {operation} of {issue_key}: '{e.args[0]}' not created"
+            except Exception as e:
+                error = f"Error applying {operation} to {issue_key}: {str(e)}"
+            if error:
+                problems.append(error)
+        return problems
+
+    if changes:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(changes)))) as executor:
+            for problems in executor.map(change, changes.items()):
+                errors.extend(problems)
+
+    links = []
+    for blocker, blocked in diff.links:
+        blocker_key, blocked_key = resolve(blocker, keys), resolve(blocked, keys)
+        if blocker_key and blocked_key:
+            links.append((blocker_key, blocked_key))
+        else:
+            errors.append(f"Skipped link {blocker} -> {blocked}: issue not created")
+
+    for _, _, error in create_issue_links(links, 'Blocks', max_workers):
+        if error:
+            errors.append(error)
+
+    return keys, errors
+
+def apply_plan(plan: TaskPlan, max_workers: int = BULK_WORKERS) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Bring Jira in line with a plan, sending only the changes it doesn't
+    already have. Issues a previous run created are found by their
+    idempotency labels and reused.
+    Returns: ({reference: issue_key}, error_messages)
+    """
+    diff, error = diff_plan(plan, max_workers)
+    if error:
+        return {}, [error]
+    return apply_diff(plan, diff, max_workers)
+
+def print_diff(plan: TaskPlan, diff: PlanDiff) -> None:
+    """Print the changes in a diff, creates grouped by wave"""
+    if not len(diff):
+        print("\nNo changes: Jira already matches the plan")
+        return
+
+    def name(ref: str) -> str:
+        key = diff.keys.get(ref)
+        return f"{ref} ({key})" if key and key != ref else ref
+
+    creates = set(diff.creates)
+    for number, wave in enumerate(plan.waves, 1):
+        new = [issue for issue in wave if issue['id'] in creates]
+        if new:
+            print(f"\nCreate, wave {number} ({len(new)} issues):")
+            for issue in new:
+                parent = f" (under {issue['parent']})" if issue.get('parent') else ''
+                print(f"  + {issue['id']}: {issue['summary']}{parent}")
+    if diff.updates:
+        print(f"\nUpdate ({len(diff.updates)}):")
+        for ref, names in diff.updates:
+            print(f"  ~ {name(ref)}: {', '.join(names)}")
+    if diff.transitions:
+        print(f"\nTransition ({len(diff.transitions)}):")
+        for ref, status, target in diff.transitions:
+            print(f"  > {name(ref)}: {status or 'new'} -> {target}")
+    if diff.comments:
+        print(f"\nComment ({len(diff.comments)}):")
+        for ref, body in diff.comments:
+            first_line = normalize_text(body).split('\n')[0]
+            print(f"  + {name(ref)}: {first_line}")
+    if diff.links:
+        print(f"\nLink ({len(diff.links)}):")
+        for blocker, blocked in diff.links:
+            print(f"  + {name(blocker)} blocks {name(blocked)}")
+
+def run_plan(plan: TaskPlan, max_workers: int = BULK_WORKERS, show_only: bool = False) -> bool:
+    """
+    Print the changes a plan needs, then apply them unless show_only.
+    Returns True if nothing failed
+    """
+    diff, error = diff_plan(plan, max_workers)
+    if error:
+        print(f"\nError: {error}")
+        return False
+
+    print_diff(plan, diff)
+    if show_only or not len(diff):
+        return True
+
+    print()
+    keys, errors = apply_diff(plan, diff, max_workers)
+    for ref in diff.creates:
+        if ref in keys:
+            print(f"{ref}: {keys[ref]} - {plan.by_id[ref]['summary']}")
+    for error in errors:
+        print(f"Error: {error}")
+    return not errors
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bring Jira in line with a task plan file')
+    parser.add_argument('plan', help='Plan file (.json, .yaml or .yml)')
+    parser.add_argument('--dry-run', action='store_true', help='Print the changes Jira needs without applying them')
+    parser.add_argument('--workers', type=int, default=BULK_WORKERS, help='Maximum concurrent requests')
+    args = parser.parse_args(argv)
+
+    try:
+        plan = load_plan(args.plan)
+    except (OSError, ValueError) as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
+
+    if not run_plan(plan, args.workers, args.dry_run):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -1,31 +1,20 @@
 #!/usr/bin/env python3
+import argparse
 import os
 import sys
 from datetime import datetime
-from jira import JIRA
-from dotenv import load_dotenv
+from dependency_graph import DependencyGraph
+from jira_utils import bulk_create_issues, create_issue_links, get_issue, get_jira
 import json
 import re
 
-# Load environment variables
-load_dotenv()
-
-# Jira connection setup
-JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
-JIRA_EMAIL = os.getenv('JIRA_EMAIL')
-JIRA_URL = os.getenv('JIRA_BASE_URL')
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Initialize Jira client
-jira = JIRA(
-    basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN),
-    server=JIRA_URL
-)
-
 class TaskWorkflow:
     def __init__(self, task_id):
         self.task_id = task_id
-        self.task = jira.issue(task_id)
+        self.task = get_issue(get_jira(), task_id, 'task_workflow')
+        self.graph = None
         self.work_log_dir = os.path.join(PROJECT_ROOT, 'task_work_logs')
         os.makedirs(self.work_log_dir, exist_ok=True)
 
@@ -59,21 +48,20 @@ class TaskWorkflow:
         
         return work_log_path
 
+    def load_dependency_graph(self, refresh=False):
+        """Load the project's Blocks graph once; refresh it after statuses change"""
+        if self.graph is None or refresh:
+            self.graph = DependencyGraph.load(self.task_id.split('-')[0])
+        return self.graph
+
     def check_dependencies(self):
-        """Check and manage task dependencies"""
-        links = self.task.fields.issuelinks
-        blocking = []
-        blocked = []
-        
-        for link in links:
-            if hasattr(link, 'outwardIssue'):
-                blocked.append(link.outwardIssue.key)
-            if hasattr(link, 'inwardIssue'):
-                blocking.append(link.inwardIssue.key)
-        
+        """Check task dependencies, following blockers transitively"""
+        graph = self.load_dependency_graph()
         return {
-            'blocking': blocking,
-            'blocked': blocked
+            'blocking': graph.blockers(self.task_id),
+            'blocked': graph.dependents(self.task_id),
+            'open_blocking': graph.open_blockers(self.task_id, transitive=True),
+            'cycles': [cycle for cycle in graph.cycles() if self.task_id in cycle]
         }
 
     def update_project_brief(self, major_decision=None):
@@ -89,25 +77,28 @@ class TaskWorkflow:
 
     def create_subtasks(self, subtasks):
         """Create subtasks for the current task"""
-        created = []
-        for subtask in subtasks:
-            subtask_dict = {
+        created, links = [], []
+        subtask_dicts = [
+            {
                 'project': {'key': 'TENP'},
                 'summary': subtask['summary'],
                 'description': subtask.get('description', ''),
                 'issuetype': {'name': 'Sub-task'},
                 'parent': {'key': self.task_id}
             }
-            new_subtask = jira.create_issue(fields=subtask_dict)
-            created.append(new_subtask.key)
-            
-            if 'blocks' in subtask:
-                for blocked in subtask['blocks']:
-                    jira.create_issue_link(
-                        type='Blocks',
-                        inwardIssue=new_subtask.key,
-                        outwardIssue=blocked
-                    )
+            for subtask in subtasks
+        ]
+        for subtask, (new_key, error) in zip(subtasks, bulk_create_issues(subtask_dicts)):
+            if error:
+                print(f"Failed to create subtask '{subtask['summary']}': {error}")
+                continue
+            created.append(new_key)
+            links.extend((new_key, blocked) for blocked in subtask.get('blocks', []))
+        
+        # Create every blocking link in one concurrent pass
+        for _, _, error in create_issue_links(links):
+            if error:
+                print(error)
         return created
 
     def start_development(self):
@@ -126,16 +117,15 @@ class TaskWorkflow:
         # Move to Done
         self.task.update(fields={'status': {'name': 'Done'}})
         
-        # Update blocked tasks
-        deps = self.check_dependencies()
-        for blocked in deps['blocked']:
-            blocked_task = jira.issue(blocked)
-            if all(link.inwardIssue.fields.status.name == 'Done' 
-                  for link in blocked_task.fields.issuelinks 
-                  if hasattr(link, 'inwardIssue')):
-                print(f"All blocking tasks for {blocked} are done!")
+        # Update blocked tasks from one refresh of the link graph
+        graph = self.load_dependency_graph(refresh=True)
+        for blocked in graph.newly_unblocked(self.task_id):
+            print(f"All blocking tasks for {blocked} are done!")
 
-def main(task_id=None):
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a task's development workflow (start, subtasks, dependencies, completion)")
+    parser.add_argument('task_id', nargs='?', help='Task ID (e.g. TENP-123); prompted for if omitted')
+    task_id = parser.parse_args(argv).task_id
     if not task_id:
         task_id = input("Enter task ID (e.g., TENP-123): ")
     
@@ -170,6 +160,9 @@ def main(task_id=None):
         print("\nDependencies:")
         print(f"Blocking tasks: {', '.join(deps['blocking'])}")
         print(f"Blocked tasks: {', '.join(deps['blocked'])}")
+        print(f"Open blocking tasks (including indirect): {', '.join(deps['open_blocking'])}")
+        for cycle in deps['cycles']:
+            print(f"Warning: dependency cycle {' <-> '.join(cycle)}")
     elif choice == '4':
         work_log = workflow.create_work_log()
         print(f"Work log available at: {work_log}")
@@ -184,7 +177,4 @@ def main(task_id=None):
         sys.exit(0)
 
 if __name__ == '__main__':
-    if len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main()
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+import argparse
+import difflib
+import importlib
+import shlex
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+# Script module: one-line summary. A command's module is imported only when
+# it runs, so help and completion never load jira or requests
+COMMANDS: Dict[str, str] = {
+    'add_comment': 'Add a comment to an issue',
+    'benchmark': 'Startup and first-request latency of every script, against a baseline',
+    'bulk_transition': 'Move many issues to a status concurrently',
+    'changelog_analytics': 'Lead time, cycle time and time-in-status percentiles',
+    'check_issue': "Show an issue's status and history",
+    'create_auth_ui_tasks': 'Create the authentication UI tasks from their plan',
+    'create_migration_tasks': 'Create the platform migration tasks from their plan',
+    'create_subtasks': 'Create the API subtasks from their plan',
+    'create_task': 'Create an issue in the project',
+    'dependency_graph': "Show an issue's blockers and the project's Blocks cycles",
+    'development_workflow': 'Interactive development workflow for the program tasks',
+    'import_budget': 'Check every script imports quickly and without connecting',
+    'jira_daemon': 'Serve Jira operations over a local Unix socket',
+    'jira_mirror': 'Sync the local mirror of the project',
+    'list_tasks': 'List all tasks in the project',
+    'move_to_done': 'Move an issue to Done',
+    'move_to_progress': 'Move an issue to In Progress',
+    'move_to_review': 'Move an issue to Review',
+    'move_to_selected': 'Move the testing tasks to Selected for Development',
+    'move_to_testing': 'Move an issue to Testing',
+    'sync_dependencies': 'Create the missing Blocks links of an edge list',
+    'task_plan': 'Bring Jira in line with a plan file',
+    'task_workflow': "Run a task's development workflow",
+    'track_progress': 'Track the progress of the selected tasks',
+    'update_completed_tasks': 'Apply the completed-tasks plan',
+    'update_dependencies': 'Add the missing Blocks links between API tasks',
+    'update_migration_tasks': 'Apply the migration-subtasks plan',
+    'update_task_statuses': 'Apply the auth UI progress plan',
+    'update_tasks': 'Update a task, or show the project status',
+    'work_log_index': 'List work logs that still need filling in',
+    'work_log_store': 'Deduplicating snapshots of task_work_logs',
+    'workflow': 'Interactive development workflow for the program tasks',
+    'workflow_trigger': 'List tasks that need workflow attention',
+}
+# Separates the commands of one invocation: tenjira move-to-done TENP-1 :: list-tasks
+COMMAND_SEPARATOR = '::'
+GLOBAL_OPTIONS = ['--help', '--batch', '--keep-going', '--completion']
+REPL_PROMPT = 'tenjira> '
+
+def command_name(module: str) -> str:
+    return module.replace('_', '-')
+
+def command_module(name: str) -> str:
+    return name.replace('-', '_')
+
+def split_commands(words: List[str]) -> List[List[str]]:
+    commands = [[]]
+    for word in words:
+        if word == COMMAND_SEPARATOR:
+            commands.append([])
+        else:
+            commands[-1].append(word)
+    return [command for command in commands if command]
+
+def run_command(words: List[str]) -> int:
+    """
+    Run one subcommand in this process, so its Jira client and connection
+    pool stay warm for the next one
+    Returns the command's exit status
+    """
+    name, args = words[0], words[1:]
+    module_name = command_module(name)
+    if module_name not in COMMANDS:
+        suggestions = difflib.get_close_matches(name, [command_name(module) for module in COMMANDS], n=3)
+        hint = f" (did you mean {', '.join(suggestions)}?)" if suggestions else ''
+        print(f"Error: unknown command '{name}'{hint}")
+        return 2
+
+    # Scripts name themselves after sys.argv[0] in usage messages
+    saved_argv = sys.argv
+    sys.argv = [f"tenjira {name}"] + args
+    try:
+        importlib.import_module(module_name).main(args)
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code)
+        return 1
+    except Exception as e:
+        # One failing command mustn't end a batch or the shell
+        print(f"Error: {str(e)}")
+        return 1
+    except KeyboardInterrupt:
+        print()
+        return 130
+    finally:
+        sys.argv = saved_argv
+
+def run_commands(commands: Iterable[List[str]], keep_going: bool = False) -> int:
+    """Run commands in order, stopping at the first failure unless keep_going"""
+    status = 0
+    for words in commands:
+        result = run_command(words)
+        if result:
+            status = result
+            if not keep_going:
+                break
+    return status
+
+def read_batch(lines: Iterable[str]) -> List[List[str]]:
+    """One command per line, shell-quoted; blank lines and # comments are skipped"""
+    commands = []
+    for line in lines:
+        words = shlex.split(line, comments=True)
+        if words:
+            commands.append(words)
+    return commands
+
+def complete(words: List[str]) -> List[str]:
+    """
+    Candidates for the last of words (the arguments after tenjira, the last
+    one being completed); none means the shell should complete file names
+    """
+    words = words or ['']
+    current, before = words[-1], words[:-1]
+    if before and before[-1] == '--batch':
+        return []
+
+    first = COMMAND_SEPARATOR not in before
+    segment = before[len(before) - before[::-1].index(COMMAND_SEPARATOR):] if not first else before
+    if not any(not word.startswith('-') for word in segment):
+        candidates = [command_name(module) for module in COMMANDS] + (GLOBAL_OPTIONS if first else [])
+    else:
+        candidates = ['--help', COMMAND_SEPARATOR]
+    return sorted(candidate for candidate in candidates if candidate.startswith(current))
+
+def completion_script(shell: str) -> str:
+    script = Path(__file__).resolve()
+    if shell == 'bash':
+        return (
+            '_tenjira() {\n'
+            f'    COMPREPLY=($(python3 "{script}" --complete "${{COMP_WORDS[@]:1:COMP_CWORD}}"))\n'
+            '}\n'
+            'complete -o default -F _tenjira tenjira\n'
+        )
+    return (
+        '#compdef tenjira\n'
+        '_tenjira() {\n'
+        f'    compadd -- $(python3 "{script}" --complete "${{(@)words[2,CURRENT]}}")\n'
+        '}\n'
+        'compdef _tenjira tenjira\n'
+    )
+
+def repl() -> int:
+    """Read commands interactively; the Jira session stays warm between them"""
+    try:
+        import readline
+
+        def completer(text: str, state: int):
+            try:
+                words = shlex.split(readline.get_line_buffer()[:readline.get_endidx()])
+            except ValueError:
+                return None
+            if not text:
+                words.append('')
+            candidates = complete(words)
+            return candidates[state] if state < len(candidates) else None
+
+        readline.set_completer(completer)
+        readline.set_completer_delims(' ')
+        readline.parse_and_bind('tab: complete')
+    except ImportError:
+        pass
+
+    print("Jira commands; 'help' lists them, 'exit' quits")
+    status = 0
+    while True:
+        try:
+            line = input(REPL_PROMPT)
+        except EOFError:
+            print()
+            return status
+        except KeyboardInterrupt:
+            print()
+            continue
+        try:
+            commands = read_batch([line])
+        except ValueError as e:
+            print(f"Error: {str(e)}")
+            continue
+        if not commands:
+            continue
+        if commands[0][0] in ('exit', 'quit'):
+            return status
+        if commands[0][0] == 'help':
+            print(command_list())
+            continue
+        status = run_commands(split_commands(commands[0]))
+
+def command_list() -> str:
+    width = max(len(command_name(module)) for module in COMMANDS)
+    return '\n'.join(f"  {command_name(module):{width}}  {summary}" for module, summary in COMMANDS.items())
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # Hidden: called by the shell completion scripts
+    if argv[:1] == ['--complete']:
+        print('\n'.join(complete(argv[1:])))
+        return
+
+    parser = argparse.ArgumentParser(
+        prog='tenjira',
+        description='Run the Jira scripts as subcommands of one process. With no command, start an interactive shell.',
+        epilog=f"commands:\n{command_list()}\n\n"
+               f"Separate several commands with '{COMMAND_SEPARATOR}'; "
+               "'tenjira COMMAND --help' shows a command's options.",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--batch', metavar='FILE', help="Run one command per line from FILE ('-' for stdin)")
+    parser.add_argument('--keep-going', action='store_true', help='Keep running commands after one fails')
+    parser.add_argument('--completion', choices=['bash', 'zsh'], help='Print a shell completion script')
+    parser.add_argument('command', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.completion:
+        print(completion_script(args.completion), end='')
+        return
+
+    if args.batch:
+        try:
+            if args.batch == '-':
+                commands = read_batch(sys.stdin)
+            else:
+                with open(args.batch, 'r') as f:
+                    commands = read_batch(f)
+        except (OSError, ValueError) as e:
+            print(f"Error: {str(e)}")
+            sys.exit(1)
+        commands.extend(split_commands(args.command))
+        sys.exit(run_commands(commands, args.keep_going))
+
+    if args.command:
+        sys.exit(run_commands(split_commands(args.command), args.keep_going))
+    sys.exit(repl())
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
-from create_subtasks import get_jira_config
+from config import get_config
 
 def test_config():
     try:
-        config = get_jira_config()
+        config = get_config()
         # Print config with redacted sensitive info
         print("Config loaded successfully:")
-        print(f"Email: {'*' * len(config['email'])}")
-        print(f"Token: {'*' * len(config['token'])}")
-        print(f"URL: {config['url']}")
+        print(f"Email: {'*' * len(config['JIRA_EMAIL'])}")
+        print(f"Token: {'*' * len(config['JIRA_API_TOKEN'])}")
+        print(f"URL: {config['JIRA_BASE_URL']}")
         return True
     except Exception as e:
         print(f"Error loading config: {e}")
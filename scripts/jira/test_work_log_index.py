@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+from work_log_index import parse_work_log
+
+def test_adjacent_placeholder_sections():
+    sections = parse_work_log('#### Work Done\n- \n#### Technical Details\n- \n')
+    assert sections == {'work done': False, 'technical details': False}
+
+def test_filled_and_placeholder_sections():
+    sections = parse_work_log('#### Work Done\n- Added the endpoint\n#### Technical Details\n- \n\n#### Notes\n- \n')
+    assert sections == {'work done': True, 'technical details': False, 'notes': False}
+
+if __name__ == '__main__':
+    test_adjacent_placeholder_sections()
+    test_filled_and_placeholder_sections()
+    print("work_log_index tests passed")
@@ -1,75 +1,34 @@
-import os
+import argparse
 import requests
-from requests.auth import HTTPBasicAuth
 from datetime import datetime
-from config import *
+from jira_mirror import JiraMirror, parse_staleness
+from jira_utils import fetch_issues, init_jira, jira_request, perform_transition
 
-def get_auth():
-    return HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
-
-def get_headers():
-    return {
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    }
-
-def get_transition_id(auth, headers, issue_key, target_status):
-    """Get the transition ID for moving to a specific status"""
-    base_url = f"{JIRA_BASE_URL}/rest/api/{JIRA_API_VERSION}"
-    transitions_url = f"{base_url}/issue/{issue_key}/transitions"
-    
-    response = requests.get(
-        transitions_url,
-        auth=auth,
-        headers=headers
-    )
-    response.raise_for_status()
-    
-    transitions = response.json()['transitions']
-    transition = next(
-        (t for t in transitions if target_status.lower() in t['name'].lower()),
-        None
-    )
-    
-    if not transition:
-        print(f"Available transitions for {issue_key}:", [t['name'] for t in transitions])
-        return None
-        
-    return transition['id']
-
-def update_task_status(issue_key, new_status, comment=None):
-    """Update the status of a task and optionally add a comment"""
-    base_url = f"{JIRA_BASE_URL}/rest/api/{JIRA_API_VERSION}"
-    auth = get_auth()
-    headers = get_headers()
+def update_task_status(issue_key, new_status, comment=None, current_status=None, issue_type=None):
+    """
+    Update the status of a task and optionally add a comment
+    Passing the current status and issue type lets the workflow cache skip
+    transition discovery entirely
+    """
+    jira, error = init_jira()
+    if error:
+        print(f"Error updating {issue_key}: {error}")
+        return False
 
     try:
-        # Get the transition ID
-        transition_id = get_transition_id(auth, headers, issue_key, new_status)
-        if not transition_id:
-            print(f"Could not find transition to '{new_status}' for {issue_key}")
-            return False
-
         # Move the issue
-        transitions_url = f"{base_url}/issue/{issue_key}/transitions"
-        response = requests.post(
-            transitions_url,
-            auth=auth,
-            headers=headers,
-            json={'transition': {'id': transition_id}}
-        )
-        response.raise_for_status()
+        success, error = perform_transition(jira, issue_key, new_status, current_status, issue_type)
+        if not success:
+            print(f"Could not move {issue_key} to '{new_status}': {error}")
+            return False
         
         # Add comment if provided
         if comment:
-            comment_url = f"{base_url}/issue/{issue_key}/comment"
-            response = requests.post(
-                comment_url,
-                auth=auth,
-                headers=headers,
+            jira_request(
+                'POST',
+                f"issue/{issue_key}/comment",
                 json={'body': comment}
             )
-            response.raise_for_status()
         
         print(f"Successfully updated {issue_key} to {new_status}")
         if comment:
@@ -82,34 +41,46 @@ def update_task_status(issue_key, new_status, comment=None):
             print(f"Response content: {e.response.text}")
         return False
 
-def get_task_status(issue_key):
-    """Get the current status of a task"""
-    base_url = f"{JIRA_BASE_URL}/rest/api/{JIRA_API_VERSION}"
-    auth = get_auth()
-    headers = get_headers()
-
+def get_task_statuses(issue_keys):
+    """Get the current status of many tasks in a few batched requests"""
     try:
-        response = requests.get(
-            f"{base_url}/issue/{issue_key}",
-            auth=auth,
-            headers=headers,
-            params={'fields': 'status,summary'}
-        )
-        response.raise_for_status()
-        
-        issue = response.json()
-        return {
-            'key': issue_key,
+        issues = fetch_issues(issue_keys, 'track_progress')
+    except requests.exceptions.RequestException as e:
+        print(f"Error getting task statuses: {str(e)}")
+        return {}
+    
+    return {
+        key: {
+            'key': key,
             'summary': issue['fields']['summary'],
             'status': issue['fields']['status']['name']
         }
+        for key, issue in issues.items()
+    }
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error getting status for {issue_key}: {str(e)}")
-        return None
+def get_mirrored_statuses(issue_keys, max_staleness):
+    """
+    Get task statuses from the local mirror, refetching only the issues
+    checked longer than max_staleness seconds ago
+    """
+    mirror = JiraMirror()
+    try:
+        rows, error = mirror.fresh_issues(issue_keys, max_staleness)
+    finally:
+        mirror.close()
 
-def track_selected_tasks():
-    """Track the progress of all selected tasks"""
+    if error:
+        print(f"Warning: could not revalidate stale tasks ({error}); showing mirror copies")
+    return {
+        key: {'key': key, 'summary': row['summary'], 'status': row['status']}
+        for key, row in rows.items()
+    }
+
+def track_selected_tasks(max_staleness=None):
+    """
+    Track the progress of all selected tasks
+    With max_staleness (seconds) the statuses come from the local mirror
+    """
     # List of tasks we're tracking (from move_to_selected.py)
     tasks = [
         # Core API Framework tasks
@@ -140,10 +111,15 @@ def track_selected_tasks():
     print("\nTracking Selected Tasks:")
     print("======================")
     
+    if max_staleness is not None:
+        task_statuses = get_mirrored_statuses(tasks, max_staleness)
+    else:
+        task_statuses = get_task_statuses(tasks)
+    
     # Group tasks by status
     status_groups = {}
     for task_key in tasks:
-        task_info = get_task_status(task_key)
+        task_info = task_statuses.get(task_key)
         if task_info:
             status = task_info['status']
             if status not in status_groups:
@@ -169,5 +145,12 @@ def example_usage():
     
     update_task_status(issue_key, new_status, comment)
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Track the progress of the selected tasks')
+    parser.add_argument('--max-staleness', type=parse_staleness,
+                        help='Answer from the local mirror if checked within this budget (e.g. 5m)')
+    args = parser.parse_args(argv)
+    track_selected_tasks(args.max_staleness)
+
 if __name__ == "__main__":
-    track_selected_tasks()
+    main()
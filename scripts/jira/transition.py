@@ -1,23 +1,10 @@
 #!/usr/bin/env python3
-from jira import JIRA
-from dotenv import load_dotenv
-import os
+from jira_utils import get_jira, perform_transition
 
-# Load environment variables
-load_dotenv()
+def main():
+    # Move TENP-232 to Review
+    success, error = perform_transition(get_jira(), 'TENP-232', 'Review')
+    print("TENP-232 moved to Review" if success else f"Error: {error}")
 
-# Jira connection setup
-JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
-JIRA_EMAIL = os.getenv('JIRA_EMAIL')
-JIRA_URL = os.getenv('JIRA_BASE_URL')
-
-# Initialize Jira client
-jira = JIRA(
-    basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN),
-    server=JIRA_URL
-)
-
-# Move TENP-232 to Review
-issue = jira.issue('TENP-232')
-jira.transition_issue(issue, 'Review')
-print("TENP-232 moved to Review")
+if __name__ == '__main__':
+    main()
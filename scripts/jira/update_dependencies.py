@@ -1,53 +1,24 @@
 #!/usr/bin/env python3
-import os
-from jira import JIRA
-from dotenv import load_dotenv
+import argparse
+import sys
+from sync_dependencies import read_edges, sync_dependencies
+from task_plan import PLANS_DIR
 
-# Load environment variables
-load_dotenv()
+# Blocks links between the API tasks; links already in place are left alone
+PLAN_FILE = PLANS_DIR / 'dependencies.yaml'
 
-# Jira connection setup
-JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
-JIRA_EMAIL = os.getenv('JIRA_EMAIL')
-JIRA_URL = os.getenv('JIRA_BASE_URL')
+def update_dependencies(show_only: bool = False, prune: bool = False) -> bool:
+    return sync_dependencies(read_edges(PLAN_FILE), prune, show_only)
 
-# Initialize Jira client
-jira = JIRA(
-    basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN),
-    server=JIRA_URL
-)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Add the missing Blocks links between API tasks')
+    parser.add_argument('--dry-run', action='store_true', help='Print the changes Jira needs without applying them')
+    parser.add_argument('--prune', action='store_true',
+                        help='Also remove Blocks links between these tasks that the map leaves out')
+    args = parser.parse_args(argv)
 
-# Dependencies to add
-DEPENDENCIES = [
-    # Request Validation depends on Error Handling
-    ('TENP-73', 'TENP-74'),
-    
-    # API Documentation depends on Request Validation and Error Handling
-    ('TENP-74', 'TENP-75'),
-    ('TENP-73', 'TENP-75'),
-    
-    # Request Validation and Data Validation should align
-    ('TENP-74', 'TENP-84'),
-    
-    # Subtask dependencies
-    ('TENP-237', 'TENP-241'),  # Error Types -> Validation Middleware
-    ('TENP-242', 'TENP-257'),  # Schema Definition -> Validation Rules
-]
-
-def update_dependencies():
-    print("Updating dependencies...")
-    
-    for blocker, blocked in DEPENDENCIES:
-        print(f"Setting {blocker} blocks {blocked}")
-        try:
-            jira.create_issue_link(
-                type='Blocks',
-                inwardIssue=blocker,
-                outwardIssue=blocked
-            )
-            print("✓ Link created")
-        except Exception as e:
-            print(f"✗ Error: {str(e)}")
+    if not update_dependencies(args.dry_run, args.prune):
+        sys.exit(1)
 
 if __name__ == '__main__':
-    update_dependencies()
+    main()
@@ -39,14 +39,17 @@ def update_tasks(task_key: str = None, status: str = None, comment: str = None)
     
     return []
 
-if __name__ == "__main__":
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Update Jira task status')
     parser.add_argument('--key', help='Jira task key (e.g., TENP-79)')
     parser.add_argument('--status', help='Target status (e.g., Done)')
     parser.add_argument('--comment', help='Comment to add to the task')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     results = update_tasks(args.key, args.status, args.comment)
     for task_id, success, message in results:
         status = "✓" if success else "✗"
         print(f"{status} {task_id}: {message}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+WORK_LOG_DIR = Path(os.getenv('JIRA_WORK_LOG_DIR', PROJECT_ROOT / 'task_work_logs'))
+# The index lives next to the scripts, like the workflow cache
+INDEX_PATH = Path(os.getenv('JIRA_WORK_LOG_INDEX', Path(__file__).parent / '.work-log-index.json'))
+# Bump when parse_work_log changes so every file is re-parsed
+INDEX_VERSION = 2
+SCAN_WORKERS = int(os.getenv('JIRA_WORK_LOG_SCAN_WORKERS', '8'))
+
+WORK_LOG_SUFFIX = '_work_log.md'
+# Sections that must be filled in before a task's work log counts as updated
+REQUIRED_SECTIONS = ('work done', 'technical details')
+
+# Headings are matched after a newline (the text gets one prepended) rather
+# than with ^ and MULTILINE, so the regex engine can skip ahead by literal search
+SECTION_PATTERN = re.compile(r'\n#### ([^\n]*)')
+# The "- " line TaskWorkflow.create_work_log writes under each new section; the
+# newline after it is only looked at, since it starts the next heading
+PLACEHOLDER_PATTERN = re.compile(r'\n#### ([^\n]*)\n- (?=\n)')
+
+def work_log_name(task_id: str) -> str:
+    return f"{task_id}{WORK_LOG_SUFFIX}"
+
+def parse_work_log(text: str) -> Dict[str, bool]:
+    """
+    Section completeness of a work log: section heading (lowercase): False
+    if any entry still has the empty placeholder under it
+    """
+    text = '\n' + text.lower()
+    sections = {heading.rstrip(' \t'): True for heading in SECTION_PATTERN.findall(text)}
+    for heading in PLACEHOLDER_PATTERN.findall(text):
+        sections[heading.rstrip(' \t')] = False
+    return sections
+
+class WorkLogIndex:
+    """
+    Disk-backed index of work logs: file name -> mtime, size and section
+    completeness. Only files whose mtime or size changed are re-read.
+    """
+
+    def __init__(self, work_log_dir: Path = WORK_LOG_DIR, path: Path = INDEX_PATH):
+        self.work_log_dir = Path(work_log_dir).resolve()
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._files = None
+
+    def _load(self) -> dict:
+        if self._files is None:
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                valid = data.get('version') == INDEX_VERSION and data.get('dir') == str(self.work_log_dir)
+                self._files = data['files'] if valid else {}
+            except (OSError, ValueError, KeyError):
+                self._files = {}
+        return self._files
+
+    def _save(self) -> None:
+        tmp_path = self.path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': INDEX_VERSION, 'dir': str(self.work_log_dir), 'files': self._files}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # The index is an optimization; the next run just re-parses
+            pass
+
+    def _parse(self, name: str, stat: os.stat_result) -> Optional[dict]:
+        try:
+            with open(self.work_log_dir / name, 'r') as f:
+                sections = parse_work_log(f.read())
+        except OSError:
+            return None
+        return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sections': sections}
+
+    def _update(self, stats: Dict[str, Optional[os.stat_result]], drop_missing: bool = False) -> Dict[str, Optional[dict]]:
+        """Re-parse, in parallel, the files whose stat differs from the index"""
+        with self._lock:
+            files = self._load()
+            changed = [
+                (name, stat) for name, stat in stats.items()
+                if stat is not None and (
+                    name not in files
+                    or files[name]['mtime_ns'] != stat.st_mtime_ns
+                    or files[name]['size'] != stat.st_size
+                )
+            ]
+            removed = [name for name, stat in stats.items() if stat is None and name in files]
+            if drop_missing:
+                removed.extend(name for name in files if name not in stats)
+
+            if changed:
+                with ThreadPoolExecutor(max_workers=max(1, min(SCAN_WORKERS, len(changed)))) as executor:
+                    parsed = list(executor.map(lambda item: self._parse(*item), changed))
+                for (name, _), entry in zip(changed, parsed):
+                    if entry is None:
+                        files.pop(name, None)
+                    else:
+                        files[name] = entry
+            for name in removed:
+                files.pop(name, None)
+            if changed or removed:
+                self._save()
+
+            return {name: files.get(name) for name in stats}
+
+    def lookup(self, task_ids: Iterable[str]) -> Dict[str, Optional[dict]]:
+        """
+        Index entries for the given tasks' work logs, refreshing only those
+        that changed on disk
+        Returns: {task_id: entry, or None if the task has no work log}
+        """
+        task_ids = list(task_ids)
+        stats = {}
+        for task_id in task_ids:
+            try:
+                stats[work_log_name(task_id)] = os.stat(self.work_log_dir / work_log_name(task_id))
+            except OSError:
+                stats[work_log_name(task_id)] = None
+        entries = self._update(stats)
+        return {task_id: entries[work_log_name(task_id)] for task_id in task_ids}
+
+    def refresh(self) -> Dict[str, dict]:
+        """
+        Bring the whole index up to date with the work log directory
+        Returns: {task_id: entry} for every work log
+        """
+        stats = {}
+        try:
+            with os.scandir(self.work_log_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(WORK_LOG_SUFFIX) and entry.is_file():
+                        stats[entry.name] = entry.stat()
+        except OSError:
+            pass
+        entries = self._update(stats, drop_missing=True)
+        return {name[:-len(WORK_LOG_SUFFIX)]: entry for name, entry in entries.items() if entry is not None}
+
+def incomplete_sections(entry: dict, sections: Iterable[str] = REQUIRED_SECTIONS) -> List[str]:
+    """Which of the given sections still hold the empty placeholder"""
+    return [section for section in sections if entry['sections'].get(section) is False]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Refresh the work log index and list logs that need filling in')
+    parser.add_argument('--all-sections', action='store_true',
+                        help='Report every unfilled section, not just work done and technical details')
+    args = parser.parse_args(argv)
+
+    index = WorkLogIndex()
+    entries = index.refresh()
+    pending = 0
+    for task_id, entry in sorted(entries.items()):
+        if args.all_sections:
+            sections = [name for name, filled in entry['sections'].items() if not filled]
+        else:
+            sections = incomplete_sections(entry)
+        if sections:
+            pending += 1
+            print(f"{task_id}: {', '.join(sections)}")
+    print(f"\n{len(entries)} work logs indexed, {pending} need filling in")
+
+if __name__ == '__main__':
+    main()
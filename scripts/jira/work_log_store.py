@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+from work_log_index import WORK_LOG_DIR
+
+# Snapshots of task_work_logs: hash-named blobs shared by every snapshot,
+# plus one small manifest per snapshot naming the blob of each file
+STORE_DIR = Path(os.getenv('JIRA_WORK_LOG_STORE', WORK_LOG_DIR / '.store'))
+# Directories the TypeScript tools used to copy work logs into
+BACKUP_DIR_PATTERN = re.compile(r'^backup_(\d+)$')
+
+class WorkLogStore:
+    """
+    Content-addressed, deduplicating store of work log snapshots. Blobs are
+    immutable files named by their SHA-256; a file that didn't change since
+    an earlier snapshot costs a manifest entry, not a copy.
+    """
+
+    def __init__(self, path: Path = STORE_DIR):
+        self.path = Path(path)
+        self.blob_dir = self.path / 'blobs'
+        self.snapshot_dir = self.path / 'snapshots'
+        # Last hash of each source file by (mtime, size), so unchanged files aren't re-read
+        self.hash_cache_path = self.path / 'hash-cache.json'
+        self._lock = threading.Lock()
+        self._hash_cache = None
+
+    # Blobs
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest
+
+    def put_file(self, source: Path) -> str:
+        """Store a file's content if it isn't stored yet. Returns its SHA-256"""
+        source = Path(source)
+        stat = source.stat()
+        cache_key = str(source.resolve())
+        cached = self._load_hash_cache().get(cache_key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size \
+                and self.blob_path(cached[2]).exists():
+            return cached[2]
+
+        data = source.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob.with_name(f"{blob.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            # Read-only, since restores hard-link blobs
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, blob)
+
+        with self._lock:
+            self._hash_cache[cache_key] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def _load_hash_cache(self) -> dict:
+        with self._lock:
+            if self._hash_cache is None:
+                try:
+                    with open(self.hash_cache_path, 'r') as f:
+                        self._hash_cache = json.load(f)
+                except (OSError, ValueError):
+                    self._hash_cache = {}
+            return self._hash_cache
+
+    def _save_hash_cache(self) -> None:
+        if self._hash_cache is None:
+            return
+        tmp_path = self.hash_cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._hash_cache, f)
+            os.replace(tmp_path, self.hash_cache_path)
+        except OSError:
+            # Only an optimization: the next snapshot re-reads the files
+            pass
+
+    def _forget(self, directory: Path) -> None:
+        """Drop the hash cache entries of a removed directory"""
+        prefix = str(directory.resolve()) + os.sep
+        cache = self._load_hash_cache()
+        with self._lock:
+            for key in [key for key in cache if key.startswith(prefix)]:
+                del cache[key]
+
+    # Snapshots
+
+    def _write_manifest(self, manifest: dict) -> None:
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        path = self.snapshot_dir / f"{manifest['id']}.json"
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _new_id(self, created: float) -> str:
+        """backup_<milliseconds>, the naming the backup directories used"""
+        snapshot_id = f"backup_{int(created * 1000)}"
+        suffix = 1
+        while (self.snapshot_dir / f"{snapshot_id}.json").exists():
+            snapshot_id = f"backup_{int(created * 1000)}-{suffix}"
+            suffix += 1
+        return snapshot_id
+
+    def snapshot(self, files: List[Path], snapshot_id: Optional[str] = None,
+                 created: Optional[float] = None) -> Tuple[str, bool]:
+        """
+        Snapshot files (by base name). A snapshot identical to the latest one
+        isn't recorded again.
+        Returns: (snapshot_id, created_new)
+        """
+        created = created or time.time()
+        entries = {Path(source).name: self.put_file(Path(source)) for source in files}
+        self._save_hash_cache()
+
+        latest = self.latest()
+        if snapshot_id is None and latest and latest['files'] == entries:
+            return latest['id'], False
+
+        manifest = {'id': snapshot_id or self._new_id(created), 'created': created, 'files': entries}
+        self._write_manifest(manifest)
+        return manifest['id'], True
+
+    def get(self, snapshot_id: str) -> Optional[dict]:
+        try:
+            with open(self.snapshot_dir / f"{snapshot_id}.json", 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def snapshots(self) -> List[dict]:
+        """Every snapshot manifest, oldest first"""
+        manifests = []
+        if self.snapshot_dir.exists():
+            for path in self.snapshot_dir.glob('*.json'):
+                manifest = self.get(path.stem)
+                if manifest:
+                    manifests.append(manifest)
+        return sorted(manifests, key=lambda manifest: (manifest['created'], manifest['id']))
+
+    def latest(self) -> Optional[dict]:
+        manifests = self.snapshots()
+        return manifests[-1] if manifests else None
+
+    def restore(self, snapshot_id: str, target_dir: Path, names: Optional[List[str]] = None,
+                link: bool = True) -> List[Path]:
+        """
+        Write a snapshot's files into target_dir: hard links to the blobs
+        (read-only) when link is set and the filesystem allows, else copies
+        Returns the restored paths
+        Raises KeyError for an unknown snapshot or file
+        """
+        manifest = self.get(snapshot_id)
+        if manifest is None:
+            raise KeyError(f"Unknown snapshot {snapshot_id}")
+        names = names or sorted(manifest['files'])
+        target_dir = Path(target_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        restored = []
+        for name in names:
+            if name not in manifest['files']:
+                raise KeyError(f"{name} is not in snapshot {snapshot_id}")
+            blob = self.blob_path(manifest['files'][name])
+            target = target_dir / name
+            tmp_path = target.with_name(f".{name}.restore.tmp")
+            if tmp_path.exists():
+                tmp_path.unlink()
+            try:
+                if not link:
+                    raise OSError
+                os.link(blob, tmp_path)
+            except OSError:
+                shutil.copyfile(blob, tmp_path)
+            os.replace(tmp_path, target)
+            restored.append(target)
+        return restored
+
+    def usage(self) -> Tuple[int, int]:
+        """Returns: (blob_count, blob_bytes)"""
+        count = size = 0
+        if self.blob_dir.exists():
+            for blob in self.blob_dir.iterdir():
+                if not blob.name.endswith('.tmp'):
+                    count += 1
+                    size += blob.stat().st_size
+        return count, size
+
+    # Compaction
+
+    def compact(self, work_log_dir: Path = WORK_LOG_DIR, remove: bool = True) -> List[str]:
+        """
+        Fold backup_<ms> directories into the store as snapshots of the same
+        name, then (with remove) delete each directory once its manifest and
+        blobs are written
+        Returns the snapshot IDs created
+        """
+        compacted = []
+        for entry in sorted(Path(work_log_dir).iterdir()):
+            match = BACKUP_DIR_PATTERN.match(entry.name)
+            if not match or not entry.is_dir():
+                continue
+            files = sorted(path for path in entry.iterdir() if path.is_file())
+            if self.get(entry.name) is None:
+                self.snapshot(files, snapshot_id=entry.name, created=int(match.group(1)) / 1000)
+            manifest = self.get(entry.name)
+            intact = manifest is not None and all(
+                self.blob_path(manifest['files'].get(path.name, '')).exists() for path in files
+            )
+            if not intact:
+                raise OSError(f"Snapshot of {entry.name} is incomplete; keeping the directory")
+            if remove:
+                shutil.rmtree(entry)
+                self._forget(entry)
+            compacted.append(entry.name)
+        if remove:
+            self._save_hash_cache()
+        return compacted
+
+def format_size(size: int) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Deduplicating snapshots of task_work_logs')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    snapshot_parser = subparsers.add_parser('snapshot', help='Snapshot work logs (default: every *_work_log.md)')
+    snapshot_parser.add_argument('files', nargs='*', help='Files to snapshot')
+
+    subparsers.add_parser('list', help='List snapshots and store size')
+
+    restore_parser = subparsers.add_parser('restore', help="Restore a snapshot's files")
+    restore_parser.add_argument('snapshot_id', help='Snapshot ID (e.g. backup_1737460523590)')
+    restore_parser.add_argument('--to', help='Target directory (default: a backup_<ms> directory in task_work_logs)')
+    restore_parser.add_argument('--file', action='append', dest='names', help='Only this file (repeatable)')
+    restore_parser.add_argument('--copy', action='store_true', help='Write writable copies instead of hard links')
+
+    compact_parser = subparsers.add_parser('compact', help='Fold backup_<ms> directories into the store')
+    compact_parser.add_argument('--keep', action='store_true', help='Keep the directories after storing them')
+
+    args = parser.parse_args(argv)
+    store = WorkLogStore()
+
+    try:
+        if args.command == 'snapshot':
+            files = [Path(name) for name in args.files] or sorted(WORK_LOG_DIR.glob('*_work_log.md'))
+            snapshot_id, created = store.snapshot(files)
+            print(snapshot_id if created else f"{snapshot_id} (unchanged)")
+        elif args.command == 'list':
+            for manifest in store.snapshots():
+                when = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(manifest['created']))
+                print(f"{manifest['id']}  {when}  {len(manifest['files'])} files")
+            count, size = store.usage()
+            print(f"\n{len(store.snapshots())} snapshots, {count} blobs, {format_size(size)}")
+        elif args.command == 'restore':
+            target = Path(args.to) if args.to else WORK_LOG_DIR / args.snapshot_id
+            for path in store.restore(args.snapshot_id, target, args.names, link=not args.copy):
+                print(path)
+        elif args.command == 'compact':
+            compacted = store.compact(remove=not args.keep)
+            count, size = store.usage()
+            print(f"Compacted {len(compacted)} backup directories into {count} blobs ({format_size(size)})")
+    except (OSError, KeyError) as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
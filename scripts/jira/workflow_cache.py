@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+# The cache lives next to the scripts, like jira-sync.ts's .task-cache.json
+CACHE_PATH = Path(os.getenv('JIRA_WORKFLOW_CACHE', Path(__file__).parent / '.workflow-cache.json'))
+# Bump when the TENP workflow changes to start a fresh graph
+WORKFLOW_VERSION = os.getenv('JIRA_WORKFLOW_VERSION', '1')
+
+class WorkflowCache:
+    """
+    Disk-backed workflow graph: from-status -> target status -> transition ID,
+    keyed by project, issue type and workflow version
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, version: str = WORKFLOW_VERSION):
+        self.path = Path(path)
+        self.version = version
+        self._lock = threading.Lock()
+        self._graphs = None
+
+    def _graph_key(self, project: str, issue_type: str) -> str:
+        return f"{project}|{issue_type}|{self.version}"
+
+    def _load(self) -> dict:
+        if self._graphs is None:
+            try:
+                with open(self.path, 'r') as f:
+                    self._graphs = json.load(f)
+            except (OSError, ValueError):
+                self._graphs = {}
+        return self._graphs
+
+    def _save(self) -> None:
+        tmp_path = self.path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._graphs, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # The cache is an optimization; never fail a transition over it
+            pass
+
+    def lookup(self, project: str, issue_type: str, from_status: str, target_status: str) -> Optional[str]:
+        """
+        Look up a transition ID without contacting the server
+        Returns None when no cached transition reaches target_status; that is
+        not proof it is unreachable (an admin may have added the transition
+        since), so callers rediscover from the server
+        """
+        with self._lock:
+            graph = self._load().get(self._graph_key(project, issue_type), {})
+            return graph.get(from_status.lower(), {}).get(target_status.lower())
+
+    def record(self, snapshot: dict) -> None:
+        """Learn every outgoing transition of an issue snapshot fetched with expand=transitions"""
+        if 'transitions' not in snapshot:
+            return
+        fields = snapshot['fields']
+        edges = {}
+        for transition in snapshot['transitions']:
+            edges[transition['name'].lower()] = transition['id']
+            to_status = transition.get('to', {}).get('name')
+            if to_status:
+                edges.setdefault(to_status.lower(), transition['id'])
+
+        key = self._graph_key(fields['project']['key'], fields['issuetype']['name'])
+        from_status = fields['status']['name'].lower()
+        with self._lock:
+            graph = self._load().setdefault(key, {})
+            if graph.get(from_status) != edges:
+                graph[from_status] = edges
+                self._save()
+
+    def invalidate(self, project: str, issue_type: str, from_status: str) -> None:
+        """Forget a from-status after the server rejected one of its cached transitions"""
+        with self._lock:
+            graph = self._load().get(self._graph_key(project, issue_type), {})
+            if graph.pop(from_status.lower(), None) is not None:
+                self._save()
+
+_cache: Optional[WorkflowCache] = None
+_cache_lock = threading.Lock()
+
+def get_workflow_cache() -> WorkflowCache:
+    """Get the process-wide workflow cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = WorkflowCache()
+        return _cache
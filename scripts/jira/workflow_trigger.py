@@ -1,25 +1,10 @@
 #!/usr/bin/env python3
+import argparse
 import os
-import sys
-from jira import JIRA
-from dotenv import load_dotenv
-import subprocess
+from jira_utils import iter_issues
+from work_log_index import WorkLogIndex, incomplete_sections
 from datetime import datetime, timedelta
 
-# Load environment variables
-load_dotenv()
-
-# Jira connection setup
-JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
-JIRA_EMAIL = os.getenv('JIRA_EMAIL')
-JIRA_URL = os.getenv('JIRA_BASE_URL')
-
-# Initialize Jira client
-jira = JIRA(
-    basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN),
-    server=JIRA_URL
-)
-
 # Status configurations
 WORKING_STATUSES = ["In Progress", "Testing", "Review"]
 READY_TO_START_STATUSES = ["Selected for Development"]
@@ -40,14 +25,13 @@ def get_active_tasks():
     ORDER BY created DESC
     '''
     
-    selected_issues = jira.search_issues(jql_selected)
-    for issue in selected_issues:
+    for issue in iter_issues(jql_selected, 'workflow_trigger'):
         tasks_needing_attention.append({
-            'task_id': issue.key,
-            'summary': issue.fields.summary,
+            'task_id': issue['key'],
+            'summary': issue['fields']['summary'],
             'reason': 'Ready to start development',
             'action_needed': 'Start Development',
-            'status': issue.fields.status.name
+            'status': issue['fields']['status']['name']
         })
     
     # Get tasks in working statuses (need work logs)
@@ -58,44 +42,51 @@ def get_active_tasks():
     ORDER BY created DESC
     '''
     
-    working_issues = jira.search_issues(jql_working)
-    for issue in working_issues:
-        task_id = issue.key
-        status = issue.fields.status.name
-        work_log_path = os.path.join(work_log_dir, f'{task_id}_work_log.md')
+    # Work logs come from the index; only files changed since the last run are read
+    working = list(iter_issues(jql_working, 'workflow_trigger'))
+    work_logs = WorkLogIndex(work_log_dir).lookup(issue['key'] for issue in working)
+    
+    for issue in working:
+        task_id = issue['key']
+        status = issue['fields']['status']['name']
+        work_log = work_logs[task_id]
         
-        if not os.path.exists(work_log_path):
+        if work_log is None:
             tasks_needing_attention.append({
                 'task_id': task_id,
-                'summary': issue.fields.summary,
+                'summary': issue['fields']['summary'],
                 'reason': f'Missing work log for {status.lower()} task',
                 'action_needed': 'Create Work Log',
                 'status': status
             })
-        else:
-            with open(work_log_path, 'r') as f:
-                content = f.read().lower()
-                if '#### work done\n- \n' in content or '#### technical details\n- \n' in content:
-                    tasks_needing_attention.append({
-                        'task_id': task_id,
-                        'summary': issue.fields.summary,
-                        'reason': f'Work log needs updating for {status.lower()} task',
-                        'action_needed': 'Update Work Log',
-                        'status': status
-                    })
+        elif incomplete_sections(work_log):
+            tasks_needing_attention.append({
+                'task_id': task_id,
+                'summary': issue['fields']['summary'],
+                'reason': f'Work log needs updating for {status.lower()} task',
+                'action_needed': 'Update Work Log',
+                'status': status
+            })
     
     return tasks_needing_attention
 
 def trigger_workflow(task_id, action_needed, status):
     """Trigger the task workflow for a specific task"""
-    script_path = os.path.join(os.path.dirname(__file__), 'task_workflow.py')
     print(f"\nTask {task_id} ({status}) needs: {action_needed}")
     response = input(f"Would you like to run the workflow for {task_id}? (y/n): ")
     
     if response.lower() == 'y':
-        subprocess.run([sys.executable, script_path, task_id])
+        # In-process, so the workflow reuses this process's Jira session
+        import task_workflow
+        try:
+            task_workflow.main([task_id])
+        except SystemExit:
+            pass
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='List tasks that need workflow attention and process one')
+    parser.parse_args(argv)
 
-def main():
     print("Checking for tasks that need workflow attention...")
     tasks = get_active_tasks()
     
@@ -1,3 +1,4 @@
+import { execFileSync } from 'child_process';
 import fs from 'fs';
 import path from 'path';
 import { logger } from '../utils/logger';
@@ -133,19 +134,14 @@ class TaskLogManager {
       results.push(result);
     }
 
-    // Create a backup before any potential changes
-    const backupDir = path.join(this.workLogsDir, `backup_${Date.now()}`);
-    if (!fs.existsSync(backupDir)) {
-      fs.mkdirSync(backupDir);
-    }
-    
-    for (const file of files) {
-      const filePath = path.join(this.workLogsDir, file);
-      const backupPath = path.join(backupDir, file);
-      fs.copyFileSync(filePath, backupPath);
-    }
+    // Snapshot before any potential changes; unchanged logs are stored once
+    const snapshotId = execFileSync(
+      'python3',
+      [path.join(__dirname, 'jira', 'work_log_store.py'), 'snapshot', ...files.map(file => path.join(this.workLogsDir, file))],
+      { encoding: 'utf-8', env: { ...process.env, JIRA_WORK_LOG_DIR: this.workLogsDir } }
+    ).trim();
 
-    logger.info(`Backup created at ${backupDir}`);
+    logger.info(`Backup snapshot: ${snapshotId}`);
     logger.info('Work log conversion completed');
 
     return results;